@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares reading and writing a trait property across a batch of
+TraitsData using a view per element, versus the generated batch
+(columnar) accessors.
+
+Usage: python bench_batchAccessors.py [numTraitsDatas]
+"""
+
+import sys
+
+from openassetio.trait import TraitsData
+
+from harness import bestTime, report
+
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+
+
+def perViewGet(traitsDatas):
+    locations = [LocatableContentTrait_v1(data).getLocation() for data in traitsDatas]
+    frames = [FrameRangedTrait_v1(data).getStartFrame() for data in traitsDatas]
+    return locations, frames
+
+
+def batchGet(traitsDatas, asArray=False):
+    locations, _ = LocatableContentTrait_v1.batchGetLocation(traitsDatas)
+    frames, _ = FrameRangedTrait_v1.batchGetStartFrame(traitsDatas, asArray=asArray)
+    return locations, frames
+
+
+def perViewSet(traitsDatas, frames):
+    for data, frame in zip(traitsDatas, frames):
+        FrameRangedTrait_v1(data).setStartFrame(frame)
+
+
+def main(numTraitsDatas=50_000):
+    traitsDatas = [TraitsData() for _ in range(numTraitsDatas)]
+    frames = list(range(numTraitsDatas))
+    for index, data in enumerate(traitsDatas):
+        # Leave some gaps, so the missing masks are exercised.
+        if index % 10:
+            LocatableContentTrait_v1(data).setLocation(f"file:///shot/frame.{index:06d}.exr")
+            FrameRangedTrait_v1(data).setStartFrame(index)
+
+    print(f"Accessing properties of {numTraitsDatas} TraitsData")
+
+    naive = bestTime(lambda: perViewGet(traitsDatas), repeat=3)
+    report("get: view per TraitsData", naive)
+    report("get: batchGet*", bestTime(lambda: batchGet(traitsDatas), repeat=3), naive)
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        pass
+    else:
+        report(
+            "get: batchGet*(asArray=True)",
+            bestTime(lambda: batchGet(traitsDatas, True), repeat=3),
+            naive,
+        )
+
+    naive = bestTime(lambda: perViewSet(traitsDatas, frames), repeat=3)
+    report("set: view per TraitsData", naive)
+    report(
+        "set: batchSet*",
+        bestTime(lambda: FrameRangedTrait_v1.batchSetStartFrame(traitsDatas, frames), repeat=3),
+        naive,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares finding which of a batch of image sequences cover a frame, or
+overlap a frame range, by scanning every entity's `FrameRangedTrait`,
+against querying a `FrameRangeIndex`.
+
+Usage: python bench_frameRangeIndex.py [numEntities]
+"""
+
+import random
+import sys
+
+from harness import bestTime, report, timePerOp
+
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation.frameRangeIndex import FrameRangeIndex
+from openassetio_mediacreation.locationTemplate import frameRange
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+
+kNumQueries = 100
+
+
+def makeTraitsDatas(numEntities):
+    rng = random.Random(0)
+    traitsDatas = []
+    for _ in range(numEntities):
+        data = TraitsData()
+        trait = FrameRangedTrait_v1(data)
+        start = rng.randrange(100_000)
+        trait.setStartFrame(start)
+        trait.setEndFrame(start + rng.randrange(1, 200))
+        trait.setStep(rng.choice((1, 1, 1, 2)))
+        traitsDatas.append(data)
+    return traitsDatas
+
+
+def coveringScan(traitsDatas, frame):
+    return [index for index, data in enumerate(traitsDatas) if frame in (frameRange(data) or ())]
+
+
+def overlappingScan(ranges, firstFrame, lastFrame):
+    return [
+        index
+        for index, frames in enumerate(ranges)
+        if frames
+        and frames.start <= lastFrame
+        and frames[-1] >= firstFrame
+        and any(firstFrame <= frame <= lastFrame for frame in frames)
+    ]
+
+
+def main(numEntities=30_000):
+    traitsDatas = makeTraitsDatas(numEntities)
+    ranges = [frameRange(data) for data in traitsDatas]
+    rng = random.Random(1)
+    frames = [rng.randrange(100_000) for _ in range(kNumQueries)]
+    print(f"Querying {numEntities} frame ranges, {kNumQueries} queries per run")
+
+    report(
+        "build: fromTraitsData",
+        bestTime(lambda: FrameRangeIndex.fromTraitsData(traitsDatas), repeat=3),
+    )
+    index = FrameRangeIndex.fromTraitsData(traitsDatas)
+    assert index.covering(frames[0]).tolist() == coveringScan(traitsDatas, frames[0])
+    assert index.overlapping(frames[0], frames[0] + 24).tolist() == overlappingScan(
+        ranges, frames[0], frames[0] + 24
+    )
+
+    baseline = bestTime(
+        lambda: [coveringScan(traitsDatas, frame) for frame in frames[:10]], repeat=3
+    ) * (kNumQueries / 10)
+    report("covering: scan TraitsData", baseline)
+    report(
+        "covering: FrameRangeIndex",
+        bestTime(lambda: [index.covering(frame) for frame in frames], repeat=3),
+        baseline,
+    )
+
+    baseline = bestTime(
+        lambda: [overlappingScan(ranges, frame, frame + 24) for frame in frames], repeat=3
+    )
+    report("overlapping: scan precomputed ranges", baseline)
+    report(
+        "overlapping: FrameRangeIndex",
+        bestTime(lambda: [index.overlapping(frame, frame + 24) for frame in frames], repeat=3),
+        baseline,
+    )
+
+    counter = iter(range(numEntities, sys.maxsize))
+    report(
+        "insert: single entity (amortized merge)",
+        timePerOp(lambda: index.insert(next(counter), 10, 20)),
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Measures the latency of batches of `entityTraits` (answered by the
+Python half) and `resolve` (answered by the C++ half) queries against
+the SimpleHybridManager example plugin, loaded with a generated entity
+table.
+
+The C++ half must have been built and installed into the example's
+`plugin` directory for `resolve` to be measured, see the
+SimpleHybridManager README.
+
+Usage: python bench_hybridManager.py [numEntities]
+"""
+
+import os
+import sys
+import tempfile
+
+from harness import bestTime, report
+
+from openassetio.access import EntityTraitsAccess, ResolveAccess
+from openassetio.hostApi import HostInterface, ManagerFactory
+from openassetio.log import LoggerInterface
+from openassetio.pluginSystem import (
+    CppPluginSystemManagerImplementationFactory,
+    HybridPluginSystemManagerImplementationFactory,
+    PythonPluginSystemManagerImplementationFactory,
+)
+
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+from openassetio_mediacreation.traits.twoDimensional import ImageTrait
+from openassetio_mediacreation.traits.usage import EntityTrait
+
+pluginDir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "..",
+    "examples",
+    "resources",
+    "hybrid_plugin_system",
+    "SimpleHybridManager",
+    "plugin",
+)
+
+
+class BenchHostInterface(HostInterface):
+    def identifier(self):
+        return "org.openassetio.mediacreation.benchmarks"
+
+    def displayName(self):
+        return "Benchmarks"
+
+
+class NullLogger(LoggerInterface):
+    def log(self, severity, message):
+        pass
+
+
+def writeEntityTable(directory, numEntities):
+    traitSets = [
+        ",".join((EntityTrait.kId, LocatableContentTrait.kId)),
+        ",".join((EntityTrait.kId, ImageTrait.kId, LocatableContentTrait.kId)),
+    ]
+    path = os.path.join(directory, "entities.tsv")
+    with open(path, "w", encoding="utf-8") as table:
+        for index in range(numEntities):
+            table.write(
+                f"examplehybrid://entity/{index}\t{traitSets[index % len(traitSets)]}"
+                f"\tfile:///shots/{index}.exr\n"
+            )
+    configPath = os.path.join(directory, "openassetio_config.toml")
+    with open(configPath, "w", encoding="utf-8") as config:
+        config.write(
+            "[manager]\n"
+            'identifier = "org.openassetio.examples.simplehybridmanager"\n'
+            "[manager.settings]\n"
+            'entities_path = "${config_dir}/entities.tsv"\n'
+        )
+    return configPath
+
+
+def main(numEntities=100_000):
+    os.environ["OPENASSETIO_PLUGIN_PATH"] = pluginDir
+    logger = NullLogger()
+    factory = HybridPluginSystemManagerImplementationFactory(
+        [
+            CppPluginSystemManagerImplementationFactory(logger),
+            PythonPluginSystemManagerImplementationFactory(logger),
+        ],
+        logger,
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        configPath = writeEntityTable(directory, numEntities)
+        manager = ManagerFactory.defaultManagerForInterface(
+            configPath, BenchHostInterface(), factory, logger
+        )
+    context = manager.createContext()
+    print(f"SimpleHybridManager with {numEntities} entities")
+
+    def onError(index, error):
+        raise RuntimeError(error.message)
+
+    def onSuccess(index, value):
+        pass
+
+    canResolve = manager.hasCapability(manager.Capability.kResolution)
+    for batchSize in (1, 1_000, numEntities):
+        refs = [
+            manager.createEntityReference(f"examplehybrid://entity/{index}")
+            for index in range(batchSize)
+        ]
+        report(
+            f"entityTraits (Python) x {batchSize}",
+            bestTime(
+                lambda: manager.entityTraits(
+                    refs, EntityTraitsAccess.kRead, context, onSuccess, onError
+                )
+            ),
+        )
+        if canResolve:
+            report(
+                f"resolve (C++) x {batchSize}",
+                bestTime(
+                    lambda: manager.resolve(
+                        refs,
+                        {LocatableContentTrait.kId},
+                        ResolveAccess.kRead,
+                        context,
+                        onSuccess,
+                        onError,
+                    )
+                ),
+            )
+    if not canResolve:
+        print("resolve skipped, the C++ half of the plugin has not been built")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Measures the cost of reading trait properties through the view classes
+with instrumentation disabled (the default), enabled, and disabled
+again, to check that disabling restores the uninstrumented cost.
+
+Usage: python bench_instrumentation.py [numTraitsDatas]
+"""
+
+import sys
+
+from bench_serialization import makeData
+from harness import bestTime, report
+
+from openassetio_mediacreation import instrumentation
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+
+
+def readProperties(traitsDatas):
+    for data in traitsDatas:
+        locatable = LocatableContentTrait_v1(data)
+        if locatable.isImbued():
+            locatable.getLocation()
+            locatable.getMimeType()
+        frameRanged = FrameRangedTrait_v1(data)
+        frameRanged.getStartFrame()
+        frameRanged.getEndFrame()
+
+
+def main(numTraitsDatas=10_000):
+    traitsDatas = [makeData(index) for index in range(numTraitsDatas)]
+    print(f"Reading properties of {numTraitsDatas} TraitsData")
+
+    baseline = bestTime(lambda: readProperties(traitsDatas))
+    report("disabled", baseline)
+
+    instrumentation.enable()
+    report("enabled", bestTime(lambda: readProperties(traitsDatas)), baseline)
+
+    instrumentation.disable()
+    report("disabled again", bestTime(lambda: readProperties(traitsDatas)), baseline)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
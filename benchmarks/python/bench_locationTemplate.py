@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares expanding a templated location over a long frame range, per
+view, using `str.format` per frame, versus a LocationTemplate.
+
+Usage: python bench_locationTemplate.py [numFrames]
+"""
+
+import sys
+
+from harness import bestTime, report
+
+from openassetio_mediacreation.locationTemplate import LocationTemplate
+
+kLocation = "file:///jobs/show/seq/shot/render/beauty.{frame:04d}.{view}.exr"
+kViews = ("left", "right")
+
+
+def naive(frames):
+    return {
+        view: [kLocation.format(frame=frame, view=view) for frame in frames] for view in kViews
+    }
+
+
+def consume(iterator):
+    for _ in iterator:
+        pass
+
+
+def main(numFrames=100_000):
+    frames = range(1001, 1001 + numFrames)
+    print(f"Expanding {numFrames} frames for {len(kViews)} views")
+
+    baseline = bestTime(lambda: naive(frames), repeat=3)
+    report("str.format per frame", baseline)
+    report(
+        "LocationTemplate.expandViews (incl. parse)",
+        bestTime(lambda: LocationTemplate(kLocation).expandViews(frames, kViews), repeat=3),
+        baseline,
+    )
+    template = LocationTemplate(kLocation)
+    report(
+        "LocationTemplate.iterViews (lazy, consumed)",
+        bestTime(lambda: consume(template.iterViews(frames, kViews)), repeat=3),
+        baseline,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares the memoized `managementPolicy` of the SimpleHybridManager
+example plugin against its previous implementation, which built the
+required trait set and a fresh policy for every trait set queried.
+
+Usage: python bench_managementPolicy.py [numTraitSets]
+"""
+
+import os
+import sys
+
+from harness import bestTime, report
+
+from openassetio.access import PolicyAccess
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation.traits.content import LocatableContentTrait
+from openassetio_mediacreation.traits.managementPolicy import ManagedTrait
+from openassetio_mediacreation.traits.twoDimensional import ImageTrait
+from openassetio_mediacreation.traits.usage import EntityTrait
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "..",
+        "examples",
+        "resources",
+        "hybrid_plugin_system",
+        "SimpleHybridManager",
+        "plugin",
+    ),
+)
+
+# pylint: disable=wrong-import-position,import-error
+from PyComponentOfSimpleHybridManager import SimpleHybridManagerInterface
+
+
+def managementPolicyUnmemoized(traitSets, policyAccess):
+    policies = [TraitsData() for _ in traitSets]
+    if policyAccess != PolicyAccess.kRead:
+        return policies
+
+    for traitSet, policyData in zip(traitSets, policies):
+        if not {EntityTrait.kId, LocatableContentTrait.kId} <= traitSet:
+            continue
+        ManagedTrait.imbueTo(policyData)
+
+    return policies
+
+
+def main(numTraitSets=100_000):
+    # A typical host batch: many repeats of a few distinct trait sets.
+    distinct = [
+        {EntityTrait.kId, LocatableContentTrait.kId},
+        {EntityTrait.kId, LocatableContentTrait.kId, ImageTrait.kId},
+        {EntityTrait.kId},
+        {LocatableContentTrait.kId},
+    ]
+    traitSets = [set(distinct[index % len(distinct)]) for index in range(numTraitSets)]
+    interface = SimpleHybridManagerInterface()
+    print(f"managementPolicy of {numTraitSets} trait sets")
+
+    for access in (PolicyAccess.kRead, PolicyAccess.kWrite):
+        expected = managementPolicyUnmemoized(traitSets, access)
+        actual = interface.managementPolicy(traitSets, access, None, None)
+        assert [ManagedTrait.isImbuedTo(policy) for policy in actual] == [
+            ManagedTrait.isImbuedTo(policy) for policy in expected
+        ]
+
+        baseline = bestTime(lambda: managementPolicyUnmemoized(traitSets, access))
+        report(f"{access.name}: unmemoized", baseline)
+        report(
+            f"{access.name}: memoized",
+            bestTime(lambda: interface.managementPolicy(traitSets, access, None, None)),
+            baseline,
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares filtering a batch of entities by a `LocatableContentTrait`
+mimeType predicate using ad-hoc string splitting per comparison,
+against a compiled `MimeTypeMatcher`.
+
+Usage: python bench_mimeTypeMatcher.py [numEntities]
+"""
+
+import sys
+
+from harness import bestTime, report
+
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation.mimeTypeMatcher import MimeTypeMatcher
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+
+kWildcard = "*"
+kPredicate = "image/*,video/mp4,application/vnd.aswf.opentimelineio"
+kMimeTypes = [
+    "image/x-exr",
+    "image/png",
+    "video/mp4",
+    "video/quicktime",
+    "application/x-nuke",
+    "model/vnd.usda",
+    "audio/wav",
+    "image/*",
+]
+
+
+def matchesAdHoc(predicate, mimeType):
+    if not mimeType:
+        return False
+    for candidate in mimeType.split(","):
+        major, _, subtype = candidate.strip().lower().partition("/")
+        for wanted in predicate.split(","):
+            wantedMajor, _, wantedSubtype = wanted.strip().lower().partition("/")
+            if wantedMajor == major and kWildcard in (wantedSubtype, subtype):
+                return True
+            if (wantedMajor, wantedSubtype) == (major, subtype):
+                return True
+    return False
+
+
+def filterAdHoc(traitsDatas):
+    return [
+        matchesAdHoc(kPredicate, LocatableContentTrait_v1(data).getMimeType())
+        for data in traitsDatas
+    ]
+
+
+def main(numEntities=200_000):
+    traitsDatas = []
+    for index in range(numEntities):
+        data = TraitsData()
+        LocatableContentTrait_v1(data).setMimeType(kMimeTypes[index % len(kMimeTypes)])
+        traitsDatas.append(data)
+    mimeTypes = [kMimeTypes[index % len(kMimeTypes)] for index in range(numEntities)]
+    matcher = MimeTypeMatcher(kPredicate)
+    assert matcher.batchMatchesTraitsData(traitsDatas) == filterAdHoc(traitsDatas)
+    print(f"Filtering {numEntities} entities by '{kPredicate}'")
+
+    baseline = bestTime(lambda: filterAdHoc(traitsDatas), repeat=3)
+    report("TraitsData: ad-hoc splitting", baseline)
+    report(
+        "TraitsData: batchMatchesTraitsData",
+        bestTime(lambda: matcher.batchMatchesTraitsData(traitsDatas), repeat=3),
+        baseline,
+    )
+
+    baseline = bestTime(lambda: [matchesAdHoc(kPredicate, m) for m in mimeTypes], repeat=3)
+    report("strings: ad-hoc splitting", baseline)
+    report(
+        "strings: matches per string",
+        bestTime(lambda: [matcher.matches(m) for m in mimeTypes], repeat=3),
+        baseline,
+    )
+    report(
+        "strings: batchMatches",
+        bestTime(lambda: matcher.batchMatches(mimeTypes), repeat=3),
+        baseline,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
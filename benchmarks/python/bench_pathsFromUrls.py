@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares converting every frame URL of an image sequence to a path
+using the examples' per-URL `path_from_url` helper, versus the batch
+`paths_from_urls` helper.
+
+Requires the packages listed in examples/resources/requirements.txt.
+
+Usage: python bench_pathsFromUrls.py [numFrames]
+"""
+
+import os
+import sys
+
+from harness import bestTime, report
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "examples"))
+
+# pylint: disable=wrong-import-position
+from resources import helpers
+
+
+def main(numFrames=100_000):
+    urls = [
+        f"file:///jobs/show/seq/shot/render/v012/beauty%20pass.{frame:06d}.exr"
+        for frame in range(numFrames)
+    ]
+    print(f"Converting {numFrames} frame URLs")
+
+    assert helpers.paths_from_urls(urls) == [helpers.path_from_url(url) for url in urls]
+
+    baseline = bestTime(lambda: [helpers.path_from_url(url) for url in urls], repeat=3)
+    report("path_from_url per URL", baseline)
+    report("paths_from_urls", bestTime(lambda: helpers.paths_from_urls(urls), repeat=3), baseline)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
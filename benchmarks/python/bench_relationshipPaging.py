@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares consuming a long version history from a (simulated) paged
+relationship query by draining the pager into a list, against
+streaming it with `iterPages`.
+
+The simulated manager sleeps for a fixed round trip per page, plus a
+time per reference, and the consumer spends a time processing each
+reference, such that prefetching can overlap the two.
+
+Usage: python bench_relationshipPaging.py [numVersions]
+"""
+
+import sys
+import time
+
+from harness import bestTime, report
+
+from openassetio import EntityReference
+from openassetio.access import RelationsAccess
+
+from openassetio_mediacreation.relationshipPaging import PageSizer, iterPages
+from openassetio_mediacreation.specifications.lifecycle import (
+    EntityVersionsRelationshipSpecification_v1,
+)
+
+# The simulated round trip time, in seconds, of each page.
+kRoundTrip = 0.01
+# The simulated time, in seconds, to retrieve each reference.
+kPerReference = 0.00002
+# The simulated time, in seconds, to process each reference.
+kProcessing = 0.00002
+# The page size used when draining.
+kDrainPageSize = 100
+
+
+class SimulatedPager:
+    def __init__(self, refs, pageSize):
+        self.refs = refs
+        self.pageSize = pageSize
+        self.offset = 0
+        self.__fetch()
+
+    def __fetch(self):
+        time.sleep(kRoundTrip + kPerReference * len(self.get()))
+
+    def hasNext(self):
+        return self.offset + self.pageSize < len(self.refs)
+
+    def get(self):
+        return self.refs[self.offset : self.offset + self.pageSize]
+
+    def next(self):
+        self.offset += self.pageSize
+        self.__fetch()
+
+
+class SimulatedManager:
+    def __init__(self, numVersions):
+        self.refs = [EntityReference(f"sim:shot@v{index}") for index in range(numVersions)]
+
+    def getWithRelationship(self, ref, traitsData, pageSize, access, context, traitSet):
+        # pylint: disable=too-many-arguments,unused-argument
+        return SimulatedPager(self.refs, pageSize)
+
+
+def process(page):
+    time.sleep(kProcessing * len(page))
+
+
+def drain(manager, relationship):
+    pager = manager.getWithRelationship(
+        EntityReference("sim:shot"),
+        relationship,
+        kDrainPageSize,
+        RelationsAccess.kRead,
+        None,
+        set(),
+    )
+    refs = list(pager.get())
+    while pager.hasNext():
+        pager.next()
+        refs.extend(pager.get())
+    return refs
+
+
+def main(numVersions=20_000):
+    manager = SimulatedManager(numVersions)
+    relationship = EntityVersionsRelationshipSpecification_v1.create().traitsData()
+    sizer = PageSizer()
+    entityRef = EntityReference("sim:shot")
+    print(f"Consuming {numVersions} versions")
+
+    def drainThenProcess():
+        process(drain(manager, relationship))
+
+    def streamAndProcess():
+        for page in iterPages(manager, entityRef, relationship, None, pageSizer=sizer):
+            process(page)
+
+    # Let the sizer adapt before timing.
+    streamAndProcess()
+
+    baseline = bestTime(drainThenProcess, repeat=3)
+    report(f"drain pager (page size {kDrainPageSize}), then process", baseline)
+    report(
+        f"iterPages (adapted page size {sizer.pageSize}), processing as pages arrive",
+        bestTime(streamAndProcess, repeat=3),
+        baseline,
+    )
+
+    baseline = bestTime(lambda: drain(manager, relationship)[:10], repeat=3)
+    report("first 10 versions: drain pager", baseline)
+    report(
+        "first 10 versions: iterPages(limit=10)",
+        bestTime(
+            lambda: list(
+                iterPages(manager, entityRef, relationship, None, limit=10, pageSizer=sizer)
+            ),
+            repeat=3,
+        ),
+        baseline,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
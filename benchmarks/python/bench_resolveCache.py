@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares repeatedly resolving a working set of references directly via
+a (simulated) manager, against resolving them through a
+`ResolveCache`.
+
+The simulated manager builds the result data, after sleeping for a
+nominal round trip per batch, as a real manager would typically incur
+querying a database or service. The overhead of the cache itself is
+also reported.
+
+Usage: python bench_resolveCache.py [numReferences] [numPasses]
+"""
+
+import sys
+import time
+
+from harness import bestTime, report
+
+from openassetio import EntityReference
+from openassetio.access import ResolveAccess
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation.resolveCache import ResolveCache
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+from openassetio_mediacreation.traits.lifecycle import VersionTrait_v1
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+
+kTraitSet = {LocatableContentTrait_v1.kId, FrameRangedTrait_v1.kId}
+# The simulated round trip time, in seconds, of each batch resolve.
+kRoundTrip = 0.005
+
+
+class SimulatedManager:
+    def resolve(self, refs, traitSet, access, context, successCallback, errorCallback):
+        # pylint: disable=too-many-arguments,unused-argument
+        time.sleep(kRoundTrip)
+        for index, ref in enumerate(refs):
+            name, _, tag = ref.toString().partition("@")
+            data = TraitsData()
+            LocatableContentTrait_v1(data).setLocation(f"file:///shots/{name}.####.exr")
+            LocatableContentTrait_v1(data).setMimeType("image/x-exr")
+            FrameRangedTrait_v1(data).setStartFrame(1001)
+            FrameRangedTrait_v1(data).setEndFrame(1100)
+            if VersionTrait_v1.kId in traitSet:
+                VersionTrait_v1(data).setSpecifiedTag(tag)
+                VersionTrait_v1(data).setStableTag("3" if tag == "latest" else tag)
+            successCallback(index, data)
+
+
+def main(numReferences=2_000, numPasses=10):
+    manager = SimulatedManager()
+    refs = [
+        EntityReference(f"sim:shot{index}@{'latest' if index % 4 == 0 else '3'}")
+        for index in range(numReferences)
+    ]
+    print(f"Resolving {numReferences} references (1 in 4 dynamic), {numPasses} passes")
+
+    def resolveDirect():
+        for _ in range(numPasses):
+            results = []
+            manager.resolve(
+                refs,
+                kTraitSet,
+                ResolveAccess.kRead,
+                None,
+                lambda index, data: results.append(data),
+                None,
+            )
+
+    def resolveCached():
+        cache = ResolveCache(manager)
+        for _ in range(numPasses):
+            cache.batchResolve(refs, kTraitSet, ResolveAccess.kRead, None)
+
+    baseline = bestTime(resolveDirect, repeat=3)
+    report("manager.resolve every pass", baseline)
+    report(
+        "ResolveCache.batchResolve (incl. first pass)",
+        bestTime(resolveCached, repeat=3),
+        baseline,
+    )
+
+    cache = ResolveCache(manager)
+    cache.batchResolve(refs, kTraitSet, ResolveAccess.kRead, None)
+    report(
+        "ResolveCache.resolve, single reference hit",
+        bestTime(
+            lambda: [cache.resolve(ref, kTraitSet, ResolveAccess.kRead, None) for ref in refs],
+            repeat=3,
+        ),
+    )
+    print(
+        f"Hit rate after {numPasses} passes: {cache.hitRate:.2f}, {cache.stats()['bytes']} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares the cold start cost, in a fresh interpreter, of answering
+"what are the properties of trait X" by parsing the packaged
+traits.yml, against the precompiled `schema` module.
+
+Usage: python bench_schema.py [repeat]
+"""
+
+import subprocess
+import sys
+
+from harness import report
+
+kYamlScript = """
+import os, time
+start = time.perf_counter()
+import yaml, openassetio_mediacreation
+path = os.path.join(os.path.dirname(openassetio_mediacreation.__file__), "traits.yml")
+with open(path, encoding="utf-8") as file:
+    description = yaml.safe_load(file)
+description["traits"]["timeDomain"]["members"]["FrameRanged"]["versions"]["1"]["properties"]
+print(time.perf_counter() - start)
+"""
+
+kSchemaScript = """
+import time
+start = time.perf_counter()
+from openassetio_mediacreation import schema
+schema.traitProperties("openassetio-mediacreation:timeDomain.FrameRanged")
+print(time.perf_counter() - start)
+"""
+
+
+def coldTime(script, repeat):
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", script], check=True, capture_output=True, text=True
+            ).stdout
+        )
+        for _ in range(repeat)
+    )
+
+
+def main(repeat=5):
+    print("Cold start lookup of a trait's properties")
+    baseline = coldTime(kYamlScript, repeat)
+    report("yaml.safe_load(traits.yml)", baseline)
+    report("schema.traitProperties", coldTime(kSchemaScript, repeat), baseline)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
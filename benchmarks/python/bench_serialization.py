@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares encoding and decoding a batch of resolved TraitsData to/from
+JSON (with full trait IDs and property keys), versus the compact
+binary `serialization` module.
+
+Usage: python bench_serialization.py [numTraitsDatas]
+"""
+
+import json
+import sys
+
+from openassetio.trait import TraitsData
+
+from harness import bestTime, report
+
+from openassetio_mediacreation import serialization
+from openassetio_mediacreation.specifications.twoDimensional import (
+    BitmapImageResourceSequenceSpecification_v1,
+)
+
+
+def toJson(traitsDatas):
+    return json.dumps(
+        [
+            {
+                traitId: {
+                    key: data.getTraitProperty(traitId, key)
+                    for key in data.traitPropertyKeys(traitId)
+                }
+                for traitId in data.traitSet()
+            }
+            for data in traitsDatas
+        ]
+    ).encode("utf-8")
+
+
+def fromJson(buffer):
+    traitsDatas = []
+    for traits in json.loads(buffer):
+        data = TraitsData()
+        for traitId, properties in traits.items():
+            data.addTrait(traitId)
+            for key, value in properties.items():
+                data.setTraitProperty(traitId, key, value)
+        traitsDatas.append(data)
+    return traitsDatas
+
+
+def makeData(index):
+    spec = BitmapImageResourceSequenceSpecification_v1.create()
+    spec.locatableContentTrait().setLocation(
+        f"file:///jobs/show/shot{index:04d}/beauty.{{frame:04d}}.exr"
+    )
+    spec.locatableContentTrait().setMimeType("image/x-exr")
+    spec.locatableContentTrait().setIsTemplated(True)
+    spec.frameRangedTrait().setStartFrame(1001)
+    spec.frameRangedTrait().setEndFrame(1100)
+    spec.frameRangedTrait().setFramesPerSecond(24.0)
+    spec.pixelBasedTrait().setPixelAspectRatio(1.0)
+    return spec.traitsData()
+
+
+def main(numTraitsDatas=20_000):
+    traitsDatas = [makeData(index) for index in range(numTraitsDatas)]
+    print(f"Serializing {numTraitsDatas} TraitsData")
+
+    jsonBuffer = toJson(traitsDatas)
+    binaryBuffer = serialization.encode(traitsDatas)
+    assert fromJson(jsonBuffer) == traitsDatas
+    assert serialization.decode(binaryBuffer) == traitsDatas
+    print(f"{'size: JSON':<60} {len(jsonBuffer) / 2**20:>10.2f} MiB")
+    print(
+        f"{'size: serialization':<60} {len(binaryBuffer) / 2**20:>10.2f} MiB"
+        f"  ({len(jsonBuffer) / len(binaryBuffer):.1f}x)"
+    )
+
+    baseline = bestTime(lambda: toJson(traitsDatas), repeat=3)
+    report("encode: JSON", baseline)
+    report(
+        "encode: serialization",
+        bestTime(lambda: serialization.encode(traitsDatas), repeat=3),
+        baseline,
+    )
+
+    baseline = bestTime(lambda: fromJson(jsonBuffer), repeat=3)
+    report("decode: JSON", baseline)
+    report(
+        "decode: serialization",
+        bestTime(lambda: serialization.decode(binaryBuffer), repeat=3),
+        baseline,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares fanning a batch of resolved TraitsData out to process pool
+workers by pickling (the properties of) each TraitsData, versus via a
+`SharedTraitsDataBatch`, for increasing numbers of workers.
+
+Each worker reads the frame range of its chunk of the batch through
+the generated trait view classes.
+
+Usage: python bench_sharedTraitsData.py [numTraitsDatas] [maxWorkers]
+"""
+
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from openassetio.trait import TraitsData
+
+from bench_serialization import makeData
+from harness import bestTime, report
+
+from openassetio_mediacreation.sharedTraitsData import SharedTraitsDataBatch
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+
+
+def toProperties(data):
+    return {
+        traitId: {
+            key: data.getTraitProperty(traitId, key) for key in data.traitPropertyKeys(traitId)
+        }
+        for traitId in data.traitSet()
+    }
+
+
+def fromProperties(traits):
+    data = TraitsData()
+    for traitId, properties in traits.items():
+        for key, value in properties.items():
+            data.setTraitProperty(traitId, key, value)
+    return data
+
+
+def countFrames(traitsDatas):
+    total = 0
+    for data in traitsDatas:
+        trait = FrameRangedTrait_v1(data)
+        total += trait.getEndFrame() - trait.getStartFrame() + 1
+    return total
+
+
+def pickledWorker(chunk):
+    return countFrames(fromProperties(traits) for traits in chunk)
+
+
+def sharedWorker(batch, start, stop):
+    return countFrames(batch[index] for index in range(start, stop))
+
+
+def chunkBounds(numItems, numChunks):
+    step = -(-numItems // numChunks)
+    return [(start, min(start + step, numItems)) for start in range(0, numItems, step)]
+
+
+def fanOutPickled(pool, traitsDatas, numWorkers):
+    chunks = [
+        [toProperties(data) for data in traitsDatas[start:stop]]
+        for start, stop in chunkBounds(len(traitsDatas), numWorkers)
+    ]
+    return sum(pool.map(pickledWorker, chunks))
+
+
+def fanOutShared(pool, traitsDatas, numWorkers):
+    with SharedTraitsDataBatch.create(traitsDatas) as batch:
+        bounds = chunkBounds(len(batch), numWorkers)
+        return sum(pool.map(sharedWorker, *zip(*((batch, *bound) for bound in bounds))))
+
+
+def main(numTraitsDatas=20_000, maxWorkers=None):
+    maxWorkers = maxWorkers or os.cpu_count() or 1
+    traitsDatas = [makeData(index) for index in range(numTraitsDatas)]
+    print(f"Fanning out {numTraitsDatas} TraitsData ({os.cpu_count()} CPUs)")
+
+    pickledSize = len(pickle.dumps([toProperties(data) for data in traitsDatas]))
+    with SharedTraitsDataBatch.create(traitsDatas) as batch:
+        sharedSize = len(pickle.dumps(batch))
+    print(f"{'pickled per fan-out: pickle':<60} {pickledSize / 2**20:>10.2f} MiB")
+    print(f"{'pickled per fan-out: shared':<60} {sharedSize * maxWorkers:>10d} B")
+
+    numWorkers = 1
+    while numWorkers <= maxWorkers:
+        with ProcessPoolExecutor(max_workers=numWorkers) as pool:
+            # Start the workers outside of the timings.
+            expected = fanOutPickled(pool, traitsDatas, numWorkers)
+            assert fanOutShared(pool, traitsDatas, numWorkers) == expected
+
+            baseline = bestTime(lambda: fanOutPickled(pool, traitsDatas, numWorkers), repeat=3)
+            report(f"{numWorkers} worker(s): pickle", baseline)
+            report(
+                f"{numWorkers} worker(s): shared",
+                bestTime(lambda: fanOutShared(pool, traitsDatas, numWorkers), repeat=3),
+                baseline,
+            )
+        numWorkers *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
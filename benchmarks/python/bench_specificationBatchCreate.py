@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares building the data for a high-volume publish (e.g. a plate
+ingest) by creating each specification and setting its properties
+through the trait views, against `batchCreate` from columns of values.
+
+Usage: python bench_specificationBatchCreate.py [numEntities]
+"""
+
+import sys
+
+from harness import bestTime, report
+
+from openassetio_mediacreation.specifications.twoDimensional import (
+    BitmapImageResourceSequenceSpecification_v1,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def makeColumns(numEntities):
+    return {
+        "frameRanged.startFrame": [1001] * numEntities,
+        "frameRanged.endFrame": [1001 + index % 200 for index in range(numEntities)],
+        "locatableContent.location": [
+            f"file:///shows/abc/shot{index:06d}/plate.####.exr" for index in range(numEntities)
+        ],
+        "locatableContent.mimeType": ["image/x-exr"] * numEntities,
+        "pixelBased.displayWindowWidth": [4096] * numEntities,
+        "pixelBased.displayWindowHeight": [2160] * numEntities,
+    }
+
+
+def createViaViews(columns, numEntities):
+    starts = columns["frameRanged.startFrame"]
+    ends = columns["frameRanged.endFrame"]
+    locations = columns["locatableContent.location"]
+    mimeTypes = columns["locatableContent.mimeType"]
+    widths = columns["pixelBased.displayWindowWidth"]
+    heights = columns["pixelBased.displayWindowHeight"]
+    traitsDatas = []
+    for index in range(numEntities):
+        specification = BitmapImageResourceSequenceSpecification_v1.create()
+        frameRanged = specification.frameRangedTrait()
+        frameRanged.setStartFrame(starts[index])
+        frameRanged.setEndFrame(ends[index])
+        locatableContent = specification.locatableContentTrait()
+        locatableContent.setLocation(locations[index])
+        locatableContent.setMimeType(mimeTypes[index])
+        pixelBased = specification.pixelBasedTrait()
+        pixelBased.setDisplayWindowWidth(widths[index])
+        pixelBased.setDisplayWindowHeight(heights[index])
+        traitsDatas.append(specification.traitsData())
+    return traitsDatas
+
+
+def main(numEntities=100_000):
+    columns = makeColumns(numEntities)
+    assert BitmapImageResourceSequenceSpecification_v1.batchCreate(columns) == createViaViews(
+        columns, numEntities
+    )
+    print(f"Creating {numEntities} BitmapImageResourceSequence data, 6 properties each")
+
+    baseline = bestTime(lambda: createViaViews(columns, numEntities), repeat=3)
+    report("create() and trait view setters", baseline)
+    report(
+        "batchCreate, lists",
+        bestTime(
+            lambda: BitmapImageResourceSequenceSpecification_v1.batchCreate(columns), repeat=3
+        ),
+        baseline,
+    )
+    if numpy is not None:
+        arrayColumns = {
+            key: numpy.array(values) if isinstance(values[0], int) else values
+            for key, values in columns.items()
+        }
+        report(
+            "batchCreate, NumPy arrays for numeric columns",
+            bestTime(
+                lambda: BitmapImageResourceSequenceSpecification_v1.batchCreate(arrayColumns),
+                repeat=3,
+            ),
+            baseline,
+        )
+    report(
+        "batchCreate, lists, validated",
+        bestTime(
+            lambda: BitmapImageResourceSequenceSpecification_v1.batchCreate(
+                columns, validate=True
+            ),
+            repeat=3,
+        ),
+        baseline,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares classifying a batch of trait sets against all specifications
+using the generated bitmask matcher, versus a naive subset test against
+every specification class's kTraitSet.
+
+Usage: python bench_specificationMatcher.py [numTraitSets]
+"""
+
+import inspect
+import random
+import sys
+
+from harness import bestTime, report
+
+from openassetio_mediacreation import specificationMatcher, specifications
+
+
+def allSpecifications():
+    specs = []
+    for _, namespace in inspect.getmembers(specifications, inspect.ismodule):
+        for name, cls in inspect.getmembers(namespace, inspect.isclass):
+            if name.endswith("Specification_v1"):
+                specs.append(cls)
+    return specs
+
+
+def naiveSuperset(traitSets, specs):
+    return [tuple(cls for cls in specs if cls.kTraitSet <= traitSet) for traitSet in traitSets]
+
+
+def naiveExact(traitSets, specs):
+    return [tuple(cls for cls in specs if cls.kTraitSet == traitSet) for traitSet in traitSets]
+
+
+def main(numTraitSets=100_000):
+    specs = allSpecifications()
+    rng = random.Random(0)
+    # Entity trait sets are highly repetitive in practice, so draw from
+    # the specifications, occasionally with an extra (unknown) trait.
+    traitSets = []
+    for _ in range(numTraitSets):
+        traitSet = set(rng.choice(specs).kTraitSet)
+        if rng.random() < 0.2:
+            traitSet.add("example:extra.Trait")
+        traitSets.append(traitSet)
+
+    print(f"Classifying {numTraitSets} trait sets against {len(specs)} specifications")
+
+    naive = bestTime(lambda: naiveSuperset(traitSets, specs), repeat=3)
+    report("superset: naive kTraitSet subset loop", naive)
+    report(
+        "superset: specificationMatcher.supersetMatches",
+        bestTime(lambda: specificationMatcher.supersetMatches(traitSets), repeat=3),
+        naive,
+    )
+
+    naive = bestTime(lambda: naiveExact(traitSets, specs), repeat=3)
+    report("exact: naive kTraitSet equality loop", naive)
+    report(
+        "exact: specificationMatcher.exactMatches",
+        bestTime(lambda: specificationMatcher.exactMatches(traitSets), repeat=3),
+        naive,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,335 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Performance regression suite for the generated package.
+
+Measures, for every trait and specification defined in the package:
+
+- the cold import time of each namespace module (Python only);
+- trait view construction, `imbueTo` and `isImbuedTo`;
+- setting and getting each trait property;
+- `create()` of each specification.
+
+The same operations are measured through the C++ headers if `--cpp`
+is supplied, by generating, compiling and running a C++ program that
+mirrors the Python measurements. This requires a GCC or Clang
+compatible compiler, and the include directories and libraries of
+OpenAssetIO and OpenAssetIO-MediaCreation, e.g.
+
+    python bench_suite.py --cpp -I <mediacreation include dir> \\
+        -I <openassetio include dir> --link <libopenassetio-core.so>
+
+or, when tests are enabled, via the
+`openassetio-mediacreation.benchmarks.suite` CMake target.
+
+Results are in nanoseconds per operation, keyed by a stable name, e.g.
+`python.traits.<trait id>.get.<property>`, and can be written as JSON
+with `--output`. When a previously written `--baseline` is supplied,
+any result that is slower by more than `--tolerance` is reported, and
+the exit code is non-zero, such that (e.g.) a release can be gated on
+it. Baselines should be recorded on the same (quiet, dedicated) machine
+as the results they are compared against. Where timings are noisy,
+`--runs` takes the best of several complete runs of the suite.
+"""
+
+# pylint: disable=missing-function-docstring
+import argparse
+import importlib
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from importlib import metadata
+
+from harness import timePerOp
+
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation import registry, specifications, traits
+
+# A sample value of each property type, as Python and C++ expressions.
+kSampleValues = {
+    str: ("value", 'openassetio::Str{"value"}'),
+    int: (1, "openassetio::Int{1}"),
+    float: (1.0, "openassetio::Float{1.0}"),
+    bool: (True, "openassetio::Bool{true}"),
+}
+
+kImportScript = """
+import importlib, time
+import openassetio.trait, openassetio_mediacreation
+start = time.perf_counter()
+importlib.import_module({module!r})
+print(time.perf_counter() - start)
+"""
+
+kCppPrelude = """
+#include <algorithm>
+#include <chrono>
+#include <cstdio>
+#include <limits>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <openassetio/trait/TraitsData.hpp>
+#include <openassetio_mediacreation/openassetio_mediacreation.hpp>
+
+namespace {
+template <class T>
+void doNotOptimize(const T& value) {
+  asm volatile("" : : "g"(&value) : "memory");
+}
+
+// Returns the best time, in nanoseconds, of a single call to func,
+// timing enough calls per run that each run takes at least 10ms.
+template <class Func>
+double timePerOp(Func&& func) {
+  using Clock = std::chrono::steady_clock;
+  const auto run = [&](std::size_t number) {
+    const auto start = Clock::now();
+    for (std::size_t i = 0; i < number; ++i) {
+      func();
+    }
+    return std::chrono::duration<double, std::nano>(Clock::now() - start).count();
+  };
+  std::size_t number = 1;
+  while (run(number) < 1e7) {
+    number *= 10;
+  }
+  double best = std::numeric_limits<double>::max();
+  for (int repeat = 0; repeat < 5; ++repeat) {
+    best = std::min(best, run(number));
+  }
+  return best / static_cast<double>(number);
+}
+}  // namespace
+
+int main() {
+  using openassetio::trait::TraitsData;
+  std::vector<std::pair<std::string, double>> results;
+"""
+
+kCppEpilogue = """
+  std::printf("{\\n");
+  for (std::size_t i = 0; i < results.size(); ++i) {
+    std::printf("  \\"%s\\": %.3f%s\\n", results[i].first.c_str(), results[i].second,
+                i + 1 < results.size() ? "," : "");
+  }
+  std::printf("}\\n");
+  return 0;
+}
+"""
+
+
+def accessorSuffix(cls, propertyName):
+    """
+    Returns the suffix of the get/set accessor methods of a property,
+    as generated for the supplied view class.
+    """
+    wanted = "get" + re.sub("[^0-9a-zA-Z]", "", propertyName).lower()
+    (getter,) = [name for name in dir(cls) if name.lower() == wanted]
+    return getter[3:]
+
+
+def specificationClasses():
+    """
+    Yields `(namespace, class)` for every versioned specification.
+    """
+    for namespace in specifications.__all__:
+        module = importlib.import_module(f"{specifications.__name__}.{namespace}")
+        for name, cls in sorted(vars(module).items()):
+            if re.fullmatch(r".+Specification_v\d+", name):
+                yield namespace, cls
+
+
+def runPython(importRepeat):
+    results = {}
+
+    for package in (traits, specifications):
+        for namespace in package.__all__:
+            module = f"{package.__name__}.{namespace}"
+            script = kImportScript.format(module=module)
+            results[f"python.import.{module.split('.', 1)[1]}"] = 1e9 * min(
+                float(
+                    subprocess.run(
+                        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+                    ).stdout
+                )
+                for _ in range(importRepeat)
+            )
+
+    def measure(name, func):
+        results[f"python.{name}"] = 1e9 * timePerOp(func)
+
+    for traitId, info in registry.kTraits.items():
+        cls = registry.viewClass(traitId)
+        data = TraitsData()
+        measure(f"traits.{traitId}.construct", lambda cls=cls, data=data: cls(data))
+        measure(f"traits.{traitId}.imbueTo", lambda cls=cls, data=data: cls.imbueTo(data))
+        measure(f"traits.{traitId}.isImbuedTo", lambda cls=cls, data=data: cls.isImbuedTo(data))
+        view = cls(data)
+        for propertyName, valueType in info.properties.items():
+            suffix = accessorSuffix(cls, propertyName)
+            value = kSampleValues[valueType][0]
+            setter = getattr(view, f"set{suffix}")
+            getter = getattr(view, f"get{suffix}")
+            measure(f"traits.{traitId}.set.{propertyName}", lambda s=setter, v=value: s(v))
+            measure(f"traits.{traitId}.get.{propertyName}", getter)
+
+    for namespace, cls in specificationClasses():
+        measure(f"specifications.{namespace}.{cls.__name__}.create", cls.create)
+
+    return results
+
+
+def cppSource():
+    """
+    Returns the source of a C++ program that performs the same
+    measurements as `runPython` (bar imports), and prints the results
+    as JSON.
+    """
+    lines = [kCppPrelude]
+
+    def measure(name, body):
+        lines.append(f'  results.emplace_back("cpp.{name}", timePerOp([&] {{ {body}; }}));\n')
+
+    for traitId, info in registry.kTraits.items():
+        cls = registry.viewClass(traitId)
+        cppClass = f"openassetio_mediacreation::traits::{info.namespace}::{info.className}"
+        lines.append("  {\n")
+        lines.append(f"    using View = {cppClass};\n")
+        lines.append("    const auto data = TraitsData::make();\n")
+        measure(f"traits.{traitId}.construct", "View view{data}; doNotOptimize(view)")
+        measure(f"traits.{traitId}.imbueTo", "View::imbueTo(data)")
+        measure(f"traits.{traitId}.isImbuedTo", "doNotOptimize(View::isImbuedTo(data))")
+        lines.append("    View view{data};\n")
+        for propertyName, valueType in info.properties.items():
+            suffix = accessorSuffix(cls, propertyName)
+            value = kSampleValues[valueType][1]
+            measure(f"traits.{traitId}.set.{propertyName}", f"view.set{suffix}({value})")
+            measure(f"traits.{traitId}.get.{propertyName}", f"doNotOptimize(view.get{suffix}())")
+        lines.append("  }\n")
+
+    for namespace, cls in specificationClasses():
+        cppClass = f"openassetio_mediacreation::specifications::{namespace}::{cls.__name__}"
+        measure(
+            f"specifications.{namespace}.{cls.__name__}.create",
+            f"doNotOptimize({cppClass}::create())",
+        )
+
+    lines.append(kCppEpilogue)
+    return "".join(lines)
+
+
+def runCpp(compiler, includeDirs, libraries):
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "bench_suite.cpp")
+        with open(source, "w", encoding="utf-8") as file:
+            file.write(cppSource())
+        executable = os.path.join(directory, "bench_suite")
+        rpaths = sorted({os.path.dirname(os.path.abspath(library)) for library in libraries})
+        subprocess.run(
+            [
+                compiler,
+                "-std=c++17",
+                "-O2",
+                *(f"-I{includeDir}" for includeDir in includeDirs),
+                source,
+                "-o",
+                executable,
+                *libraries,
+                *(f"-Wl,-rpath,{rpath}" for rpath in rpaths),
+            ],
+            check=True,
+        )
+        output = subprocess.run([executable], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def compare(results, baseline, tolerance):
+    """
+    Prints the results that differ from the baseline by more than the
+    tolerance, returning the names of those that are slower.
+    """
+    regressions = []
+    for name in sorted(results.keys() & baseline.keys()):
+        ratio = results[name] / baseline[name]
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            print(f"REGRESSION  {name}: {baseline[name]:.1f} -> {results[name]:.1f} ns")
+        elif ratio < 1 / (1 + tolerance):
+            print(f"improvement {name}: {baseline[name]:.1f} -> {results[name]:.1f} ns")
+    for name in sorted(baseline.keys() - results.keys()):
+        print(f"missing     {name}")
+    for name in sorted(results.keys() - baseline.keys()):
+        print(f"new         {name}")
+    print(f"{len(regressions)} regressions of {len(results.keys() & baseline.keys())} compared")
+    return regressions
+
+
+def main(argv=None):
+    cmdline = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    cmdline.add_argument("--output", help="Write the results to this JSON file")
+    cmdline.add_argument("--baseline", help="Compare the results to this JSON file")
+    cmdline.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Fraction by which a result may be slower than the baseline (default: 0.25)",
+    )
+    cmdline.add_argument(
+        "--runs", type=int, default=1, help="Keep the best result of this many runs (default: 1)"
+    )
+    cmdline.add_argument("--import-repeat", type=int, default=3)
+    cmdline.add_argument("--cpp", action="store_true", help="Also measure the C++ headers")
+    cmdline.add_argument("--compiler", default=os.environ.get("CXX", "c++"))
+    cmdline.add_argument("-I", dest="include_dirs", action="append", default=[])
+    cmdline.add_argument(
+        "--link", dest="libraries", action="append", default=[], help="Library to link"
+    )
+    args = cmdline.parse_args(argv)
+
+    if args.cpp and shutil.which(args.compiler) is None:
+        cmdline.error(f"Compiler '{args.compiler}' not found")
+
+    results = {}
+    for _ in range(args.runs):
+        run = runPython(args.import_repeat)
+        if args.cpp:
+            run.update(runCpp(args.compiler, args.include_dirs, args.libraries))
+        for name, nanoseconds in run.items():
+            results[name] = min(nanoseconds, results.get(name, nanoseconds))
+
+    document = {
+        "metadata": {
+            "unit": "ns/op",
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "openassetio": metadata.version("openassetio"),
+            "openassetio-mediacreation": metadata.version("openassetio-mediacreation"),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(document, file, indent=2, sort_keys=True)
+            file.write("\n")
+    else:
+        for name, nanoseconds in results.items():
+            print(f"{name:<100} {nanoseconds:>12.1f} ns")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
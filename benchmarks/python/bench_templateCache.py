@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares substituting a small working set of templated locations many
+times using a freshly parsed LocationTemplate per call, versus the
+cached `locationTemplate.substitute`. Plain `str.format` is included
+for reference, though it handles neither percent-encoded variables nor
+URL encoding of substituted values.
+
+Usage: python bench_templateCache.py [numSubstitutions]
+"""
+
+import sys
+
+from harness import bestTime, report
+
+from openassetio_mediacreation import locationTemplate
+from openassetio_mediacreation.locationTemplate import LocationTemplate
+
+kLocations = [
+    f"file:///jobs/show/shot{index:03d}/render/beauty.{{frame:04d}}.{{view}}.exr"
+    for index in range(8)
+]
+
+
+def naive(count):
+    for index in range(count):
+        kLocations[index % 8].format(frame=index, view="left")
+
+
+def uncached(count):
+    for index in range(count):
+        LocationTemplate(kLocations[index % 8]).substitute(index, "left")
+
+
+def cached(count):
+    for index in range(count):
+        locationTemplate.substitute(kLocations[index % 8], index, "left")
+
+
+def main(count=100_000):
+    print(f"Substituting {count} locations from a working set of {len(kLocations)}")
+    report("str.format (reference)", bestTime(lambda: naive(count), repeat=3))
+    baseline = bestTime(lambda: uncached(count), repeat=3)
+    report("LocationTemplate per call", baseline)
+    locationTemplate.kDefaultCache.clear()
+    report(
+        "locationTemplate.substitute (cached)",
+        bestTime(lambda: cached(count), repeat=3),
+        baseline,
+    )
+    print(locationTemplate.kDefaultCache.stats())
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
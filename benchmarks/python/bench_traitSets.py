@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares building the trait set of a specification plus an optional
+trait in a hot loop, and using it as a `dict` key, against the
+precomputed, interned trait sets of the specification view classes.
+
+Usage: python bench_traitSets.py [numIterations]
+"""
+
+import sys
+
+from harness import bestTime, report
+
+from openassetio_mediacreation.specifications.twoDimensional import (
+    PlanarBitmapImageResourceSpecification_v1 as Spec,
+)
+from openassetio_mediacreation.traits.color import OCIOColorManagedTrait_v1
+
+
+def unionRebuilt(numIterations):
+    for _ in range(numIterations):
+        Spec.kTraitSet | {OCIOColorManagedTrait_v1.kId}  # pylint: disable=expression-not-assigned
+
+
+def unionPrecomputed(numIterations):
+    for _ in range(numIterations):
+        Spec.kTraitSetWithOCIOColorManaged  # pylint: disable=pointless-statement
+
+
+def unionMemoized(numIterations):
+    for _ in range(numIterations):
+        Spec.traitSetWith(OCIOColorManagedTrait_v1.kId)
+
+
+def lookupRebuilt(numIterations, table):
+    for _ in range(numIterations):
+        table[frozenset(Spec.kTraitSet | {OCIOColorManagedTrait_v1.kId})]  # pylint: disable=W0104
+
+
+def lookupPrecomputed(numIterations, table):
+    for _ in range(numIterations):
+        table[Spec.kTraitSetWithOCIOColorManaged]  # pylint: disable=pointless-statement
+
+
+def main(numIterations=100_000):
+    table = {frozenset(Spec.kTraitSetWithOCIOColorManaged): "policy"}
+    print(f"{Spec.__name__} trait set with OCIOColorManaged, {numIterations} times")
+
+    baseline = bestTime(lambda: unionRebuilt(numIterations))
+    report("union: kTraitSet | {...}", baseline)
+    report(
+        "union: kTraitSetWithOCIOColorManaged",
+        bestTime(lambda: unionPrecomputed(numIterations)),
+        baseline,
+    )
+    report("union: traitSetWith(...)", bestTime(lambda: unionMemoized(numIterations)), baseline)
+
+    baseline = bestTime(lambda: lookupRebuilt(numIterations, table))
+    report("dict lookup: frozenset(kTraitSet | {...})", baseline)
+    report(
+        "dict lookup: kTraitSetWithOCIOColorManaged",
+        bestTime(lambda: lookupPrecomputed(numIterations, table)),
+        baseline,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compares validating the property constraints of a publish of many
+image sequences per object, through the trait view classes (as
+managers typically do), versus the generated bulk `validators`.
+
+Usage: python bench_validators.py [numTraitsDatas]
+"""
+
+import re
+import sys
+
+from bench_serialization import makeData
+from harness import bestTime, report
+
+from openassetio_mediacreation import validators
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+from openassetio_mediacreation.traits.twoDimensional import PixelBasedTrait_v1
+
+urlRegex = re.compile(r"^[A-Za-z][A-Za-z0-9+.\-]*:[^\s]*$")
+
+
+def validatePerObject(traitsDatas):
+    errors = {}
+    for index, data in enumerate(traitsDatas):
+        messages = []
+        frameRanged = FrameRangedTrait_v1(data)
+        if frameRanged.isImbued():
+            step = frameRanged.getStep()
+            if step is not None and step <= 0:
+                messages.append("step must be > 0")
+            fps = frameRanged.getFramesPerSecond()
+            if fps is not None and fps <= 0:
+                messages.append("framesPerSecond must be > 0")
+            frames = [
+                frame
+                for frame in (
+                    frameRanged.getStartFrame(),
+                    frameRanged.getInFrame(),
+                    frameRanged.getOutFrame(),
+                    frameRanged.getEndFrame(),
+                )
+                if frame is not None
+            ]
+            if frames != sorted(frames):
+                messages.append("frames must be ordered")
+        pixelBased = PixelBasedTrait_v1(data)
+        if pixelBased.isImbued():
+            ratio = pixelBased.getPixelAspectRatio()
+            if ratio is not None and ratio <= 0:
+                messages.append("pixelAspectRatio must be > 0")
+            width = pixelBased.getDisplayWindowWidth()
+            if width is not None and width <= 0:
+                messages.append("displayWindowWidth must be > 0")
+            height = pixelBased.getDisplayWindowHeight()
+            if height is not None and height <= 0:
+                messages.append("displayWindowHeight must be > 0")
+        locatable = LocatableContentTrait_v1(data)
+        if locatable.isImbued():
+            location = locatable.getLocation()
+            if location is not None and not urlRegex.match(location):
+                messages.append("location must be a URL")
+        if messages:
+            errors[index] = messages
+    return errors
+
+
+def main(numTraitsDatas=10_000):
+    traitsDatas = [makeData(index) for index in range(numTraitsDatas)]
+    # Make some invalid.
+    for data in traitsDatas[::100]:
+        FrameRangedTrait_v1(data).setStep(0)
+    print(f"Validating {numTraitsDatas} TraitsData")
+
+    assert list(validatePerObject(traitsDatas)) == list(validators.violations(traitsDatas))
+
+    baseline = bestTime(lambda: validatePerObject(traitsDatas))
+    report("per object, via views", baseline)
+    report("validators.validate", bestTime(lambda: validators.validate(traitsDatas)), baseline)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Measures the memory and construction cost of trait and specification
+views over a large batch of TraitsData, and the cost of repeated
+specification trait accessor calls.
+
+The generated view classes use __slots__. For comparison, the baseline
+uses trivial subclasses that reintroduce a per-instance __dict__, as
+the view classes had previously.
+
+Usage: python bench_viewSlots.py [numTraitsDatas]
+"""
+
+import sys
+import tracemalloc
+
+from openassetio.trait import TraitsData
+
+from harness import bestTime, report
+
+from openassetio_mediacreation.specifications.threeDimensional import (
+    SceneGeometryResourceSpecification_v1,
+)
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+
+
+def withDict(cls):
+    """
+    Returns a subclass of cls whose instances have a __dict__.
+    """
+    return type(f"{cls.__name__}WithDict", (cls,), {})
+
+
+def buildViews(traitsDatas, classes):
+    return [cls(data) for data in traitsDatas for cls in classes]
+
+
+def viewMemory(traitsDatas, classes):
+    """
+    Returns the bytes allocated to hold a view of each class for each
+    data.
+    """
+    tracemalloc.start()
+    views = buildViews(traitsDatas, classes)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del views
+    return size
+
+
+def accessorCalls(specifications):
+    for spec in specifications:
+        spec.locatableContentTrait().getLocation()
+        spec.locatableContentTrait().getMimeType()
+        spec.spatialTrait().isImbued()
+
+
+def main(numTraitsDatas=100_000):
+    traitsDatas = [TraitsData() for _ in range(numTraitsDatas)]
+    slotted = [
+        LocatableContentTrait_v1,
+        FrameRangedTrait_v1,
+        SceneGeometryResourceSpecification_v1,
+    ]
+    unslotted = [withDict(cls) for cls in slotted]
+
+    print(f"Building {len(slotted)} views over each of {numTraitsDatas} TraitsData")
+
+    baseline = viewMemory(traitsDatas, unslotted)
+    print(f"{'memory: with __dict__':<60} {baseline / 2**20:>10.1f} MiB")
+    slottedMemory = viewMemory(traitsDatas, slotted)
+    print(
+        f"{'memory: __slots__':<60} {slottedMemory / 2**20:>10.1f} MiB"
+        f"  ({baseline / slottedMemory:.1f}x)"
+    )
+
+    baseline = bestTime(lambda: buildViews(traitsDatas, unslotted), repeat=3)
+    report("construct: with __dict__", baseline)
+    report(
+        "construct: __slots__",
+        bestTime(lambda: buildViews(traitsDatas, slotted), repeat=3),
+        baseline,
+    )
+
+    specifications = [SceneGeometryResourceSpecification_v1(data) for data in traitsDatas]
+    report(
+        "accessors: first call (creates views)",
+        bestTime(lambda: accessorCalls(specifications), repeat=1),
+    )
+    report(
+        "accessors: subsequent calls (cached views)",
+        bestTime(lambda: accessorCalls(specifications), repeat=3),
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
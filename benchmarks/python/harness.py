@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Minimal shared timing utilities for the benchmark scripts in this
+directory.
+"""
+
+import timeit
+
+
+def bestTime(func, number=1, repeat=5):
+    """
+    Returns the best wall-clock time, in seconds, of `repeat` runs of
+    `number` calls to func.
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(name, seconds, baseline=None):
+    """
+    Prints a single result line, with the speedup relative to a
+    baseline time if supplied.
+    """
+    line = f"{name:<60} {seconds * 1e3:>10.3f} ms"
+    if baseline is not None:
+        line += f"  ({baseline / seconds:.1f}x)"
+    print(line)
+
+
+def timePerOp(func, minSeconds=0.01, repeat=5):
+    """
+    Returns the best time, in seconds, of a single call to func, timing
+    enough calls per run that each run takes at least minSeconds.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < minSeconds:
+        number *= 10
+    return min(timer.repeat(number=number, repeat=repeat)) / number
@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Build-time code generation for openassetio-mediacreation.
+
+The trait and specification view classes are generated by
+openassetio-traitgen. This package wraps that generation, using the
+traitgen `parser` and `generators` modules as described in the traitgen
+documentation, and then runs additional MediaCreation generators over
+the same package declaration. These produce supplementary sources that
+traitgen itself has no knowledge of.
+
+This package is not distributed. It is only used by setup.py and
+CMakeLists.txt during a build.
+"""
+
+import logging
+from typing import Collection, Optional, Tuple
+
+from openassetio_traitgen import generators as traitgen_generators
+from openassetio_traitgen import parser
+
+from . import constraints, cpp, python
+
+# Supplementary generators, keyed by the traitgen generator they extend.
+ALL = {"python": python, "cpp": cpp}
+
+
+# pylint: disable=too-many-arguments
+def generate(
+    description_path: str,
+    output_directory: str,
+    generator: str,
+    creation_callback,
+    logger: logging.Logger,
+    template_globals=None,
+    namespaces: Optional[Collection[Tuple[str, str]]] = None,
+    constraints_path: Optional[str] = None,
+):
+    """
+    Generates the traitgen sources for the supplied description, and
+    then any MediaCreation supplementary sources for that language.
+
+    @param description_path: The path to the YAML package description.
+    @param output_directory: The root output directory for code.
+    @param generator: Which traitgen generator to invoke, e.g.
+        "python" or "cpp".
+    @param creation_callback: A callback, called with the path to each
+        directory or file generated.
+    @param logger: All messaging will be submitted to the supplied
+        logger.
+    @param template_globals: Any additional globals to pass to the
+        generation templates, see `openassetio_traitgen.generate`.
+    @param namespaces: If supplied, only the per-namespace sources for
+        these `(kind, namespace id)` pairs are generated, where kind is
+        "traits" or "specifications". Package-wide sources are always
+        generated in full. Only supported by the "python" generator.
+    @param constraints_path: The path to the property and specification
+        constraints file,
+        see `codegen.constraints`. Defaults to the constraints.yml
+        alongside the description, if any. Only used by the "python"
+        generator.
+    """
+    package_description = parser.load_yaml(description_path)
+    parser.validate_package_description(package_description)
+    package_declaration = parser.build_package_declaration(package_description)
+
+    try:
+        traitgen_generator = getattr(traitgen_generators, generator)
+    except AttributeError as exc:
+        raise ValueError(f"Could not find generator {generator}") from exc
+
+    supplement_kwargs = {}
+    traitgen_declaration = package_declaration
+    if namespaces is not None:
+        if generator != "python":
+            raise ValueError(f"Generator {generator} does not support partial generation")
+        # traitgen renders its package-wide sources from the filtered
+        # declaration too, but these are then replaced by the
+        # supplementary generator, which sees the full declaration.
+        traitgen_declaration = package_declaration._replace(
+            **{
+                kind: [
+                    namespace
+                    for namespace in getattr(package_declaration, kind) or ()
+                    if (kind, namespace.id) in namespaces
+                ]
+                for kind in ("traits", "specifications")
+            }
+        )
+        supplement_kwargs["only_namespaces"] = namespaces
+
+    if generator == "python":
+        if constraints_path is None:
+            constraints_path = constraints.default_path(description_path)
+        supplement_kwargs["constraints"] = constraints.load(constraints_path, package_declaration)
+        supplement_kwargs["specification_constraints"] = constraints.load_specifications(
+            constraints_path, package_declaration
+        )
+
+    globals_ = traitgen_generators.helpers.default_template_globals()
+    if template_globals:
+        globals_.update(template_globals)
+    globals_["generator"] = generator
+
+    logger.info("Generating with traitgen generator %s...", generator)
+    traitgen_generator.generate(
+        traitgen_declaration, globals_, output_directory, creation_callback, logger
+    )
+
+    if generator in ALL:
+        logger.info("Generating MediaCreation %s supplements...", generator)
+        ALL[generator].generate(
+            package_declaration,
+            globals_,
+            output_directory,
+            creation_callback,
+            logger,
+            **supplement_kwargs,
+        )
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Command-line entry point, used by CMakeLists.txt. Mirrors the subset of
+the `openassetio-traitgen` CLI that the build makes use of, e.g.
+
+    python -m codegen traits.yml -o build/python -g python
+
+with additional options for build-time generation, see
+`codegen.incremental.generate_changed_only`.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+from openassetio_traitgen import generators
+
+from . import generate, incremental
+
+
+def main(argv=None):
+    """
+    Parses the supplied arguments and runs code generation.
+    """
+    cmdline = argparse.ArgumentParser(
+        prog="codegen", description="Generate the openassetio-mediacreation sources."
+    )
+    cmdline.add_argument("input", help="YAML file detailing traits and specifications")
+    cmdline.add_argument("-o", "--output-dir", required=True, help="Root output directory")
+    cmdline.add_argument(
+        "-g", "--generator", required=True, choices=generators.ALL, help="Generator to use"
+    )
+    cmdline.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Only rewrite output files whose content has changed",
+    )
+    cmdline.add_argument(
+        "--stamp", help="A file to touch once generation has completed successfully"
+    )
+    args = cmdline.parse_args(argv)
+
+    logging.basicConfig(
+        stream=sys.stderr, format="%(asctime)s [%(name)s] %(levelname)s: %(message)s"
+    )
+    logger = logging.getLogger("openassetio-mediacreation-codegen")
+
+    if args.changed_only:
+        logger.setLevel(logging.INFO)
+        incremental.generate_changed_only(
+            args.input, args.output_dir, args.generator, lambda _: _, logger
+        )
+    else:
+        generate(args.input, args.output_dir, args.generator, lambda _: _, logger)
+
+    if args.stamp:
+        os.makedirs(os.path.dirname(os.path.abspath(args.stamp)), exist_ok=True)
+        with open(args.stamp, "w", encoding="utf-8"):
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Loading of the machine-readable trait property and specification
+constraints, see constraints.yml for the format.
+
+The constraints are validated against the package declaration, so that
+typos (e.g. an unknown property) fail generation rather than silently
+going unchecked.
+"""
+
+import os
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+from openassetio_traitgen.datamodel import (
+    NamespaceDeclaration,
+    PackageDeclaration,
+    PropertyDeclaration,
+    PropertyType,
+    SpecificationDeclaration,
+    TraitDeclaration,
+    TraitReference,
+)
+
+__all__ = [
+    "TraitConstraints",
+    "PropertyConstraints",
+    "SpecificationConstraints",
+    "default_path",
+    "load",
+    "load_specifications",
+]
+
+# The name of the constraints file expected alongside a package
+# description.
+FILENAME = "constraints.yml"
+
+_kNumericTypes = (PropertyType.INTEGER, PropertyType.FLOAT)
+
+# Constraint keyword to the property types it applies to.
+_kKeywords = {
+    "minimum": _kNumericTypes,
+    "exclusiveMinimum": _kNumericTypes,
+    "maximum": _kNumericTypes,
+    "exclusiveMaximum": _kNumericTypes,
+    "enum": (PropertyType.STRING, PropertyType.INTEGER, PropertyType.FLOAT, PropertyType.BOOL),
+    "format": (PropertyType.STRING,),
+}
+
+_kFormats = ("url",)
+
+
+class PropertyConstraints(NamedTuple):
+    """
+    The constraints on a single property.
+    """
+
+    property: PropertyDeclaration
+    # (keyword, value) pairs, in declaration order.
+    checks: List[Tuple[str, Any]]
+
+
+class TraitConstraints(NamedTuple):
+    """
+    The constraints on a single version of a trait.
+    """
+
+    namespace: NamespaceDeclaration
+    trait: TraitDeclaration
+    properties: List[PropertyConstraints]
+    # Chains of property IDs whose values must be non-decreasing.
+    ordered: List[List[str]]
+
+
+class SpecificationConstraints(NamedTuple):
+    """
+    The constraints on a single version of a specification.
+    """
+
+    namespace: NamespaceDeclaration
+    specification: SpecificationDeclaration
+    # Traits commonly composed with the specification's trait set, in
+    # declaration order.
+    optional_traits: List[TraitReference]
+
+
+def default_path(description_path: str) -> Optional[str]:
+    """
+    Returns the path of the constraints file alongside the supplied
+    package description, or None if there isn't one.
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(description_path)), FILENAME)
+    return path if os.path.isfile(path) else None
+
+
+def load(path: Optional[str], package_declaration: PackageDeclaration) -> List[TraitConstraints]:
+    """
+    Loads the trait constraints from the constraints file at path, and
+    resolves them against the supplied package declaration.
+
+    @return The constraints of each trait version that has any, in
+    trait ID order. Empty if path is None.
+
+    @exception ValueError If the file is malformed, or refers to traits,
+    properties or constraints that are not valid for the package.
+    """
+    if path is None:
+        return []
+    description = _read(path, package_declaration)
+
+    declared = {
+        (namespace.id, trait.name, str(trait.version)): (namespace, trait)
+        for namespace in package_declaration.traits or ()
+        for trait in namespace.members
+    }
+
+    result = []
+    for namespace_id, traits in (description.get("traits") or {}).items():
+        for trait_name, versions in traits.items():
+            for version, declaration in versions.items():
+                key = (namespace_id, trait_name, str(version))
+                if key not in declared:
+                    raise ValueError(f"{path}: Unknown trait {'.'.join(key)}")
+                namespace, trait = declared[key]
+                result.append(_trait_constraints(path, namespace, trait, declaration or {}))
+    return sorted(result, key=lambda constraints: constraints.trait.id)
+
+
+def load_specifications(
+    path: Optional[str], package_declaration: PackageDeclaration
+) -> List[SpecificationConstraints]:
+    """
+    Loads the specification constraints from the constraints file at
+    path, and resolves them against the supplied package declaration.
+
+    @return The constraints of each specification version that has
+    any, in namespace and specification ID order. Empty if path is
+    None.
+
+    @exception ValueError If the file is malformed, or refers to
+    specifications or traits that are not valid for the package.
+    """
+    if path is None:
+        return []
+    description = _read(path, package_declaration)
+
+    declared_specifications = {
+        (namespace.id, specification.id, str(specification.version)): (namespace, specification)
+        for namespace in package_declaration.specifications or ()
+        for specification in namespace.members
+    }
+    declared_traits = {
+        (namespace.id, trait.name, str(trait.version)): (namespace, trait)
+        for namespace in package_declaration.traits or ()
+        for trait in namespace.members
+    }
+
+    result = []
+    for namespace_id, specifications in (description.get("specifications") or {}).items():
+        for specification_id, versions in specifications.items():
+            for version, declaration in versions.items():
+                key = (namespace_id, specification_id, str(version))
+                if key not in declared_specifications:
+                    raise ValueError(f"{path}: Unknown specification {'.'.join(key)}")
+                namespace, specification = declared_specifications[key]
+                result.append(
+                    _specification_constraints(
+                        path,
+                        package_declaration.id,
+                        namespace,
+                        specification,
+                        declaration or {},
+                        declared_traits,
+                    )
+                )
+    return sorted(
+        result, key=lambda constraints: (constraints.namespace.id, constraints.specification.id)
+    )
+
+
+# pylint: disable=too-many-arguments
+def _specification_constraints(
+    path, package_id, namespace, specification, declaration, declared_traits
+):
+    context = f"{path}: {namespace.id}.{specification.id} v{specification.version}"
+    unknown = set(declaration) - {"optionalTraits"}
+    if unknown:
+        raise ValueError(f"{context}: Unknown keys {sorted(unknown)}")
+
+    trait_set_ids = {trait.id for trait in specification.trait_set}
+    optional_traits = []
+    for reference in declaration.get("optionalTraits") or ():
+        key = (reference.get("namespace"), reference.get("name"), str(reference.get("version")))
+        if key not in declared_traits:
+            raise ValueError(f"{context}: Unknown trait {'.'.join(map(str, key))}")
+        trait_namespace, trait = declared_traits[key]
+        if trait.id in trait_set_ids:
+            raise ValueError(f"{context}: Optional trait {trait.id} is already in the trait set")
+        if any(optional.name == trait.name for optional in optional_traits):
+            raise ValueError(f"{context}: Duplicate optional trait name '{trait.name}'")
+        optional_traits.append(
+            TraitReference(
+                id=trait.id,
+                name=trait.name,
+                namespace=trait_namespace.id,
+                package=package_id,
+                version=str(trait.version),
+                unique_name_parts=(trait.name,),
+            )
+        )
+
+    return SpecificationConstraints(namespace, specification, optional_traits)
+
+
+def _read(path, package_declaration):
+    """
+    Reads the constraints file at path, checking its top-level keys.
+    """
+    with open(path, encoding="utf-8") as file:
+        description = yaml.safe_load(file) or {}
+
+    if description.get("package") != package_declaration.id:
+        raise ValueError(
+            f"{path}: 'package' must be '{package_declaration.id}',"
+            f" got '{description.get('package')}'"
+        )
+    unknown = set(description) - {"package", "traits", "specifications"}
+    if unknown:
+        raise ValueError(f"{path}: Unknown keys {sorted(unknown)}")
+    return description
+
+
+def _trait_constraints(path, namespace, trait, declaration):
+    context = f"{path}: {trait.id} v{trait.version}"
+    unknown = set(declaration) - {"properties", "ordered"}
+    if unknown:
+        raise ValueError(f"{context}: Unknown keys {sorted(unknown)}")
+
+    properties = {prop.id: prop for prop in trait.properties or ()}
+
+    property_constraints = []
+    for property_id, checks in (declaration.get("properties") or {}).items():
+        prop = properties.get(property_id)
+        if prop is None:
+            raise ValueError(f"{context}: Unknown property '{property_id}'")
+        for keyword, value in checks.items():
+            if keyword not in _kKeywords:
+                raise ValueError(f"{context}: Unknown constraint '{keyword}' on '{property_id}'")
+            if prop.type not in _kKeywords[keyword]:
+                raise ValueError(
+                    f"{context}: '{keyword}' is not applicable to {prop.type.value}"
+                    f" property '{property_id}'"
+                )
+            _check_value(context, prop, keyword, value)
+        property_constraints.append(PropertyConstraints(prop, list(checks.items())))
+
+    ordered = []
+    for chain in declaration.get("ordered") or ():
+        if len(chain) < 2:
+            raise ValueError(f"{context}: Ordered chains must have at least two properties")
+        for property_id in chain:
+            prop = properties.get(property_id)
+            if prop is None:
+                raise ValueError(f"{context}: Unknown property '{property_id}'")
+            if prop.type not in _kNumericTypes:
+                raise ValueError(
+                    f"{context}: Ordered property '{property_id}' must be an integer or float"
+                )
+        ordered.append(list(chain))
+
+    return TraitConstraints(namespace, trait, property_constraints, ordered)
+
+
+def _check_value(context, prop, keyword, value):
+    """
+    Checks the value of a constraint keyword is valid.
+    """
+    if keyword == "format":
+        if value not in _kFormats:
+            raise ValueError(f"{context}: Unknown format '{value}' on '{prop.id}'")
+    elif keyword == "enum":
+        if not isinstance(value, list) or not value:
+            raise ValueError(f"{context}: 'enum' on '{prop.id}' must be a non-empty list")
+    elif isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{context}: '{keyword}' on '{prop.id}' must be a number")
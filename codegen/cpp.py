@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Supplementary generator for the C++ header-only library.
+
+Runs after the traitgen cpp generator, and renders additional headers
+alongside the top-level package header it produced.
+"""
+
+import logging
+import os
+
+from openassetio_traitgen.datamodel import PackageDeclaration, PropertyType
+
+from . import helpers
+
+__all__ = ["generate"]
+
+# Must match the ABI version namespace used by traitgen.
+TRAITGEN_ABI_VERSION = "v1"
+
+
+def generate(
+    package_declaration: PackageDeclaration,
+    globals_: dict,
+    output_directory: str,
+    creation_callback,
+    logger: logging.Logger,
+):
+    """
+    Generates the supplementary C++ headers for the supplied
+    declaration, under the include directory traitgen has created in
+    output_directory.
+    """
+    env = helpers.create_jinja_env(globals_)
+    env.filters["to_cpp_property_type"] = to_cpp_property_type
+
+    package_name = helpers.to_identifier(package_declaration.id)
+    package_abs_path = os.path.join(output_directory, package_name, "include", package_name)
+
+    def render_template(name: str, variables: dict):
+        helpers.render_template(
+            env,
+            f"cpp/{name}.hpp.in",
+            os.path.join(package_abs_path, f"{name}.hpp"),
+            {
+                "package": package_declaration,
+                "traitgen_abi_version": TRAITGEN_ABI_VERSION,
+                **variables,
+            },
+            creation_callback,
+            logger,
+        )
+
+    if package_declaration.traits:
+        traits = [
+            (namespace, trait)
+            for namespace in package_declaration.traits
+            for trait in namespace.members
+        ]
+        render_template("registry", {"traits": sorted(traits, key=lambda t: t[1].id)})
+
+    if package_declaration.specifications:
+        namespaces = [
+            (namespace, namespace.members) for namespace in package_declaration.specifications
+        ]
+        render_template("specificationTraitSets", {"namespaces": namespaces})
+
+
+_kTypeMap = {
+    PropertyType.STRING: "kStr",
+    PropertyType.INTEGER: "kInt",
+    PropertyType.FLOAT: "kFloat",
+    PropertyType.BOOL: "kBool",
+}
+
+
+def to_cpp_property_type(declaration_type: PropertyType) -> str:
+    """
+    Returns the registry PropertyType enumerator for a property
+    declaration.
+    """
+    if declaration_type not in _kTypeMap:
+        raise TypeError(f"{declaration_type} properties are not supported")
+    return _kTypeMap[declaration_type]
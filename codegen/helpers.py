@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Utilities shared by the supplementary generators.
+"""
+
+import logging
+import os
+import re
+
+import jinja2
+
+from openassetio_traitgen.generators import helpers
+
+
+def create_jinja_env(env_globals: dict) -> jinja2.Environment:
+    """
+    Creates a Jinja2 environment that loads templates from the
+    'templates' directory alongside this module, with the filters
+    common to all languages installed.
+    """
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(os.path.join(os.path.dirname(__file__), "templates")),
+        keep_trailing_newline=True,
+    )
+    env.globals.update(env_globals)
+    env.filters["to_identifier"] = to_identifier
+    env.filters["to_class_name"] = helpers.to_upper_camel_alnum
+    return env
+
+
+def render_template(
+    env: jinja2.Environment,
+    name: str,
+    path: str,
+    variables: dict,
+    creation_callback,
+    logger: logging.Logger,
+):
+    """
+    Renders the named template into the file at path, and calls the
+    creation callback.
+    """
+    # NB: Jinja assumes '/' on all platforms.
+    template = env.get_template(name)
+    with open(path, "w", encoding="utf-8", newline="\n") as file:
+        file.write(template.render(variables))
+    creation_callback(path)
+    logger.debug("Rendered %s", path)
+
+
+def to_identifier(string: str) -> str:
+    """
+    Conforms the supplied string to a legal module/namespace name,
+    matching the traitgen python and cpp generators.
+    """
+    return re.sub(r"[^a-zA-Z0-9_]", "_", string.replace("-", "_"))
@@ -0,0 +1,307 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Incremental code generation.
+
+Records a manifest of content hashes alongside a previous generation,
+such that unchanged sources can be skipped entirely, and (for the
+python generator) only the namespaces whose declarations have changed
+need be regenerated.
+
+Alternatively, `generate_changed_only` regenerates everything, but
+only rewrites the files whose content has changed, leaving the
+timestamps of unchanged files intact for build systems.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from importlib import metadata
+from typing import List
+
+from openassetio_traitgen import parser
+
+from . import generate as generate_all
+from . import constraints, helpers, python
+
+__all__ = ["generate", "generate_changed_only", "fingerprint"]
+
+# Bumped whenever the manifest structure changes, invalidating any
+# existing manifests.
+MANIFEST_VERSION = 1
+
+_kKinds = ("traits", "specifications")
+
+# Manifest entries that, if changed, require full regeneration.
+_kInvariantKeys = ("manifest", "generator", "traitgen", "codegen", "package", "constraints")
+
+
+# pylint: disable=too-many-arguments
+def generate(
+    description_path: str,
+    output_directory: str,
+    generator: str,
+    manifest_path: str,
+    creation_callback,
+    logger: logging.Logger,
+) -> List[str]:
+    """
+    Generates sources as per `codegen.generate`, unless the manifest
+    at manifest_path shows they are already up to date.
+
+    Everything is regenerated if the manifest is missing, or if
+    openassetio-traitgen, codegen, the package-level declaration, the
+    property constraints or any previously generated file has changed
+    since. Otherwise, if the
+    generator supports it, only the namespaces whose declarations have
+    changed are regenerated, and the modules of removed namespaces are
+    deleted.
+
+    @return The "<kind>/<namespace id>" keys of the namespaces that
+    were (re)generated, empty if the sources were up to date.
+    """
+    current = fingerprint(description_path, generator)
+    previous = _load_manifest(manifest_path)
+
+    outputs = []
+
+    def record_output(path):
+        if os.path.isfile(path):
+            outputs.append(os.path.relpath(path, output_directory))
+        creation_callback(path)
+
+    only_namespaces = None
+    if previous is not None and _outputs_exist(previous, output_directory):
+        if all(previous.get(key) == current[key] for key in _kInvariantKeys):
+            # Edits outside of any declaration (e.g. comments) change the
+            # schema hash, but not the namespace hashes.
+            if previous["namespaces"] == current["namespaces"]:
+                logger.info("Generated %s sources are up to date", generator)
+                return []
+            if generator == "python":
+                only_namespaces = _changed_namespaces(previous, current)
+                _remove_stale_modules(previous, current, output_directory, logger)
+
+    if only_namespaces is None:
+        regenerated = sorted(current["namespaces"])
+        generate_all(description_path, output_directory, generator, record_output, logger)
+        current["outputs"] = sorted(outputs)
+    else:
+        regenerated = sorted(f"{kind}/{namespace}" for kind, namespace in only_namespaces)
+        logger.info("Regenerating changed namespaces: %s", ", ".join(regenerated))
+        generate_all(
+            description_path,
+            output_directory,
+            generator,
+            record_output,
+            logger,
+            namespaces=only_namespaces,
+        )
+        current["outputs"] = sorted(
+            (set(previous["outputs"]) - set(_stale_outputs(previous, current))) | set(outputs)
+        )
+
+    _save_manifest(manifest_path, current)
+    return regenerated
+
+
+def generate_changed_only(
+    description_path: str,
+    output_directory: str,
+    generator: str,
+    creation_callback,
+    logger: logging.Logger,
+) -> List[str]:
+    """
+    Generates sources as per `codegen.generate`, but into a staging
+    directory, and then only copies files into output_directory whose
+    content differs from what is already there.
+
+    Files in generated sub-directories of output_directory that were
+    not generated this time (e.g. from a removed namespace) are
+    deleted.
+
+    @return The paths of the files that were written or removed.
+    """
+    changed = []
+    with tempfile.TemporaryDirectory() as staging_directory:
+        generate_all(description_path, staging_directory, generator, lambda _: _, logger)
+
+        for directory, _, filenames in os.walk(staging_directory):
+            relative_directory = os.path.relpath(directory, staging_directory)
+            output_subdirectory = os.path.normpath(
+                os.path.join(output_directory, relative_directory)
+            )
+            os.makedirs(output_subdirectory, exist_ok=True)
+
+            for filename in filenames:
+                source = os.path.join(directory, filename)
+                destination = os.path.join(output_subdirectory, filename)
+                if _same_content(source, destination):
+                    continue
+                shutil.copyfile(source, destination)
+                changed.append(destination)
+                creation_callback(destination)
+
+            # The output directory itself may hold other files, but the
+            # sub-directories are wholly owned by the generator.
+            if relative_directory == os.curdir:
+                continue
+            for filename in os.listdir(output_subdirectory):
+                stale = os.path.join(output_subdirectory, filename)
+                if filename not in filenames and os.path.isfile(stale):
+                    os.remove(stale)
+                    changed.append(stale)
+
+    logger.info("Updated %d generated %s file(s)", len(changed), generator)
+    return changed
+
+
+def fingerprint(description_path: str, generator: str) -> dict:
+    """
+    Returns the content hashes that determine the generated sources
+    for the supplied description and generator.
+    """
+    with open(description_path, "rb") as file:
+        schema = file.read()
+    description = parser.load_yaml(description_path)
+    constraints_digest = None
+    constraints_path = constraints.default_path(description_path)
+    if constraints_path is not None:
+        with open(constraints_path, "rb") as file:
+            constraints_digest = hashlib.sha256(file.read()).hexdigest()
+
+    package_level = {key: value for key, value in description.items() if key not in _kKinds}
+    namespaces = {}
+    for kind in _kKinds:
+        for namespace, declaration in (description.get(kind) or {}).items():
+            namespaces[f"{kind}/{namespace}"] = _hash_json(declaration)
+    # Specifications reference traits, so must also be regenerated if
+    # the declarations of those traits change.
+    for namespace, declaration in (description.get("specifications") or {}).items():
+        referenced = sorted(
+            {
+                f"traits/{trait['namespace']}"
+                for specification in declaration.get("members", {}).values()
+                for version in specification.get("versions", {}).values()
+                for trait in version.get("traitSet", ())
+                if trait.get("package", description["package"]) == description["package"]
+            }
+        )
+        key = f"specifications/{namespace}"
+        namespaces[key] = _hash_json(
+            [namespaces[key]] + [namespaces.get(trait_key) for trait_key in referenced]
+        )
+
+    return {
+        "manifest": MANIFEST_VERSION,
+        "generator": generator,
+        "traitgen": metadata.version("openassetio-traitgen"),
+        "codegen": _codegen_hash(),
+        "schema": hashlib.sha256(schema).hexdigest(),
+        "packageId": description["package"],
+        "package": _hash_json(package_level),
+        "constraints": constraints_digest,
+        "namespaces": namespaces,
+    }
+
+
+def _changed_namespaces(previous, current):
+    """
+    Returns the `(kind, namespace id)` pairs that are new or changed.
+    """
+    return {
+        tuple(key.split("/", 1))
+        for key, digest in current["namespaces"].items()
+        if previous["namespaces"].get(key) != digest
+    }
+
+
+def _stale_outputs(previous, current):
+    """
+    Returns the output paths of namespaces that have been removed, i.e.
+    their traitgen modules, and the modules extending them.
+    """
+    package = helpers.to_identifier(current["packageId"])
+    return [
+        os.path.join(package, module_path)
+        for kind, namespace in (
+            key.split("/", 1) for key in set(previous["namespaces"]) - set(current["namespaces"])
+        )
+        for module_path in (
+            os.path.join(kind, f"{helpers.to_identifier(namespace)}.py"),
+            python.extensions_module_path(kind, namespace),
+        )
+    ]
+
+
+def _remove_stale_modules(previous, current, output_directory, logger):
+    """
+    Deletes the generated modules of namespaces that have been removed.
+    """
+    for path in _stale_outputs(previous, current):
+        full_path = os.path.join(output_directory, path)
+        if os.path.exists(full_path):
+            logger.info("Removing stale module %s", full_path)
+            os.remove(full_path)
+
+
+def _outputs_exist(manifest, output_directory):
+    """
+    Determines whether all the previously generated files still exist.
+    """
+    outputs = manifest.get("outputs")
+    return bool(outputs) and all(
+        os.path.isfile(os.path.join(output_directory, path)) for path in outputs
+    )
+
+
+def _codegen_hash():
+    """
+    Hashes the codegen sources and templates, along with the names of
+    the hand-written package modules, which are all inputs to
+    generation.
+    """
+    digest = hashlib.sha256()
+    root = os.path.dirname(os.path.abspath(__file__))
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name != "__pycache__")
+        for filename in sorted(filenames):
+            path = os.path.join(directory, filename)
+            digest.update(os.path.relpath(path, root).encode("utf-8"))
+            with open(path, "rb") as file:
+                digest.update(file.read())
+    digest.update(json.dumps(sorted(python.hand_written_modules())).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _same_content(path_a, path_b):
+    """
+    Determines whether two files have identical content. The second
+    file need not exist.
+    """
+    if not os.path.isfile(path_b) or os.path.getsize(path_a) != os.path.getsize(path_b):
+        return False
+    with open(path_a, "rb") as file_a, open(path_b, "rb") as file_b:
+        return file_a.read() == file_b.read()
+
+
+def _hash_json(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _load_manifest(path):
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_manifest(path, manifest):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
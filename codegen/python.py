@@ -0,0 +1,385 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Supplementary generator for the Python package.
+
+Runs after the traitgen python generator, and renders additional
+modules into the package it produced, including extensions of the
+traitgen view classes.
+"""
+
+import glob
+import json
+import logging
+import os
+from typing import Collection, List, Optional, Tuple
+
+from openassetio_traitgen.datamodel import PackageDeclaration, PropertyType
+from openassetio_traitgen.generators import helpers as traitgen_helpers
+
+from . import helpers
+from .constraints import SpecificationConstraints, TraitConstraints
+
+__all__ = ["extensions_module_path", "generate", "hand_written_modules"]
+
+# The private sub-package holding the modules that extend the traitgen
+# namespace modules, by kind.
+_kExtensionsPackage = "_extensions"
+
+# The template of the extensions module for each kind of namespace.
+_kExtensionsTemplates = {
+    "traits": "traitExtensions",
+    "specifications": "specificationExtensions",
+}
+
+# The environment variable that enables the generated instrumentation
+# of trait view classes when the package is imported.
+INSTRUMENTATION_ENV_VAR = "OPENASSETIO_MEDIACREATION_INSTRUMENT"
+
+
+def generate(
+    package_declaration: PackageDeclaration,
+    globals_: dict,
+    output_directory: str,
+    creation_callback,
+    logger: logging.Logger,
+    only_namespaces: Optional[Collection[Tuple[str, str]]] = None,
+    constraints: Optional[List[TraitConstraints]] = None,
+    specification_constraints: Optional[List[SpecificationConstraints]] = None,
+):
+    """
+    Generates the supplementary Python sources for the supplied
+    declaration, under the package directory traitgen has created in
+    output_directory.
+
+    If only_namespaces is supplied, then only the per-namespace modules for
+    those `(kind, namespace id)` pairs are rendered, see
+    `codegen.generate`.
+
+    If constraints are supplied, a module of bulk validators is
+    rendered for them, see `codegen.constraints`. Similarly, if
+    specification constraints are supplied, the specification view
+    classes gain precomputed unions of their trait set with each of
+    their optional traits.
+    """
+    env = helpers.create_jinja_env(globals_)
+    env.filters["to_py_type"] = to_py_type
+    # Filters matching traitgen's, used to reference the traitgen
+    # classes. Any conforming warnings have already been logged by
+    # traitgen.
+    env.filters["to_py_class_name"] = traitgen_helpers.to_upper_camel_alnum
+    env.filters["to_py_var_accessor_name"] = traitgen_helpers.to_upper_camel_alnum
+    env.filters["to_py_var_name"] = traitgen_helpers.to_lower_camel_alnum
+    env.filters["to_py_module_name"] = helpers.to_identifier
+    env.filters["to_py_trait_accessor_name"] = to_py_trait_accessor_name
+    env.filters["to_py_literal"] = to_py_literal
+    env.filters["to_py_tuple"] = tuple
+
+    package_dir_path = os.path.join(
+        output_directory, helpers.to_identifier(package_declaration.id)
+    )
+
+    optional_traits = {
+        (
+            spec_constraints.namespace.id,
+            spec_constraints.specification.id,
+            str(spec_constraints.specification.version),
+        ): spec_constraints.optional_traits
+        for spec_constraints in specification_constraints or ()
+    }
+
+    batch_columns = _batch_columns(package_declaration)
+
+    def render_template(name: str, path: str, variables: dict):
+        helpers.render_template(
+            env, f"python/{name}.py.in", path, variables, creation_callback, logger
+        )
+
+    # Replace the traitgen package __init__s with ones that defer
+    # importing namespace modules until they are first accessed.
+    package_submodules = []
+    for kind in ("traits", "specifications"):
+        namespaces = getattr(package_declaration, kind, None)
+        if not namespaces:
+            continue
+        package_submodules.append(kind)
+
+        # Extend the classes of the traitgen namespace modules, which
+        # are otherwise left as traitgen generated them. The extensions
+        # add __slots__, batch (columnar) trait accessors, cached
+        # specification trait views and batch specification
+        # constructors. Each traitgen module imports its extensions
+        # module last, replacing its classes with the extended ones.
+        extensions_dir_path = os.path.join(package_dir_path, _kExtensionsPackage, kind)
+        os.makedirs(extensions_dir_path, exist_ok=True)
+        for namespace in namespaces:
+            if only_namespaces is not None and (kind, namespace.id) not in only_namespaces:
+                continue
+            module_name = helpers.to_identifier(namespace.id)
+            render_template(
+                _kExtensionsTemplates[kind],
+                os.path.join(extensions_dir_path, f"{module_name}.py"),
+                {
+                    "package": package_declaration,
+                    "namespace": namespace,
+                    "imports": traitgen_helpers.package_dependencies(namespace.members),
+                    "optionalTraits": {
+                        (member_id, version): traits
+                        for (namespace_id, member_id, version), traits in optional_traits.items()
+                        if namespace_id == namespace.id
+                    },
+                    "batchColumns": {
+                        (member_id, version): columns
+                        for (namespace_id, member_id, version), columns in batch_columns.items()
+                        if namespace_id == namespace.id
+                    },
+                },
+            )
+            _append_extensions_import(
+                os.path.join(package_dir_path, kind, f"{module_name}.py"),
+                f"..{_kExtensionsPackage}.{kind}.{module_name}",
+            )
+        render_template(
+            "__init__",
+            os.path.join(extensions_dir_path, "__init__.py"),
+            {
+                "docstring": f"Extensions of the traitgen {kind} view classes.",
+                "lazyImports": [],
+            },
+        )
+
+        docstring = f"{kind.capitalize()} defined in the '{package_declaration.id}' package."
+        render_template(
+            "__init__",
+            os.path.join(package_dir_path, kind, "__init__.py"),
+            {
+                "docstring": docstring,
+                "lazyImports": sorted(helpers.to_identifier(ns.id) for ns in namespaces),
+            },
+        )
+
+    if package_submodules:
+        render_template(
+            "__init__",
+            os.path.join(package_dir_path, _kExtensionsPackage, "__init__.py"),
+            {"docstring": "Extensions of the traitgen view classes.", "lazyImports": []},
+        )
+
+    # Supplementary modules, rendered alongside the traits and
+    # specifications sub-packages.
+    supplements = {}
+    if package_declaration.traits:
+        supplements["registry"] = {}
+        supplements["schema"] = {}
+        supplements["instrumentation"] = {"envVar": INSTRUMENTATION_ENV_VAR}
+    if package_declaration.specifications:
+        supplements["specificationMatcher"] = _specification_matcher_variables(package_declaration)
+    if constraints:
+        supplements["validators"] = _validators_variables(constraints)
+
+    for name, variables in supplements.items():
+        render_template(
+            name,
+            os.path.join(package_dir_path, f"{name}.py"),
+            {"package": package_declaration, **variables},
+        )
+
+    render_template(
+        "__init__",
+        os.path.join(package_dir_path, "__init__.py"),
+        {
+            "docstring": package_declaration.description,
+            "lazyImports": sorted(package_submodules + list(supplements) + hand_written_modules()),
+            "instrumentationEnvVar": (
+                INSTRUMENTATION_ENV_VAR if "instrumentation" in supplements else None
+            ),
+        },
+    )
+
+
+def extensions_module_path(kind: str, namespace_id: str) -> str:
+    """
+    Returns the path, relative to the package directory, of the
+    (private) module that extends the classes of the traitgen module
+    for a namespace.
+    """
+    return os.path.join(_kExtensionsPackage, kind, f"{helpers.to_identifier(namespace_id)}.py")
+
+
+def _append_extensions_import(module_path: str, extensions_module: str):
+    """
+    Appends the import of its extensions module to a traitgen namespace
+    module, which replaces the module's classes with the extended ones.
+    """
+    with open(module_path, "a", encoding="utf-8", newline="\n") as file:
+        file.write(
+            "\n\n# Extended by openassetio-mediacreation codegen.\n"
+            "# pylint: disable=wildcard-import,unused-wildcard-import,wrong-import-position\n"
+            f"from {extensions_module} import *\n"
+        )
+
+
+def hand_written_modules():
+    """
+    Returns the names of the public hand-written modules that are
+    copied into the package alongside the generated sources.
+    """
+    source_dir = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "openassetio_mediacreation"
+    )
+    return [
+        os.path.splitext(os.path.basename(path))[0]
+        for path in glob.glob(os.path.join(source_dir, "*.py"))
+        if not os.path.basename(path).startswith("_")
+    ]
+
+
+def _specification_matcher_variables(package_declaration: PackageDeclaration) -> dict:
+    """
+    Assigns a bit to each trait referenced by the package (sorted by
+    ID), and computes each specification's trait set as a bitmask.
+    """
+    trait_ids = {
+        trait.id for namespace in package_declaration.traits or () for trait in namespace.members
+    }
+    trait_ids.update(
+        trait.id
+        for namespace in package_declaration.specifications
+        for specification in namespace.members
+        for trait in specification.trait_set
+    )
+    trait_ids = sorted(trait_ids)
+    bits = {trait_id: 1 << index for index, trait_id in enumerate(trait_ids)}
+
+    specifications = []
+    for namespace in package_declaration.specifications:
+        for specification in namespace.members:
+            mask = 0
+            for trait in specification.trait_set:
+                mask |= bits[trait.id]
+            specifications.append((namespace, specification, f"{mask:#x}"))
+
+    return {"traitIds": trait_ids, "specifications": specifications}
+
+
+def _batch_columns(package_declaration: PackageDeclaration) -> dict:
+    """
+    Determines the columns accepted by the batch constructor of each
+    specification, keyed by `(namespace id, specification id,
+    version)`, as a list of `(key, trait reference, property
+    declaration)`, where key is "<trait accessor>.<property id>".
+
+    Only the properties of traits declared by the package are known.
+    """
+    trait_properties = {
+        (trait.id, str(trait.version)): trait.properties
+        for namespace in package_declaration.traits or ()
+        for trait in namespace.members
+    }
+    columns = {}
+    for namespace in package_declaration.specifications or ():
+        for specification in namespace.members:
+            columns[(namespace.id, specification.id, str(specification.version))] = [
+                (f"{to_py_trait_accessor_name(trait.unique_name_parts)}.{prop.id}", trait, prop)
+                for trait in specification.trait_set
+                for prop in trait_properties.get((trait.id, str(trait.version)), ())
+            ]
+    return columns
+
+
+# Constraint keyword to `_validation` function and comparison operator.
+_kBoundOperators = {
+    "minimum": ">=",
+    "exclusiveMinimum": ">",
+    "maximum": "<=",
+    "exclusiveMaximum": "<",
+}
+
+
+def _validators_variables(constraints: List[TraitConstraints]) -> dict:
+    """
+    Determines, for each constrained trait, the property columns that
+    must be gathered and the `_validation` checks to run over them.
+    """
+    validators = []
+    for trait_constraints in constraints:
+        trait = trait_constraints.trait
+        constrained_ids = {
+            property_constraints.property.id
+            for property_constraints in trait_constraints.properties
+        }
+        constrained_ids.update(
+            property_id for chain in trait_constraints.ordered for property_id in chain
+        )
+
+        checks = []
+        for property_constraints in trait_constraints.properties:
+            property_id = property_constraints.property.id
+            for keyword, value in property_constraints.checks:
+                if keyword in _kBoundOperators:
+                    checks.append(
+                        (
+                            property_id,
+                            "checkBound",
+                            [to_py_literal(_kBoundOperators[keyword]), to_py_literal(value)],
+                        )
+                    )
+                elif keyword == "enum":
+                    checks.append((property_id, "checkEnum", [to_py_literal(tuple(value))]))
+                elif keyword == "format":
+                    checks.append((property_id, "checkUrl", []))
+
+        validators.append(
+            {
+                "trait": trait,
+                "className": f"{traitgen_helpers.to_upper_camel_alnum(trait.name)}"
+                f"Trait_v{trait.version}",
+                # In declaration order, for stable output.
+                "columns": [prop for prop in trait.properties if prop.id in constrained_ids],
+                "checks": checks,
+                "ordered": trait_constraints.ordered,
+            }
+        )
+    return {"validators": validators}
+
+
+def to_py_literal(value) -> str:
+    """
+    Returns the Python literal for a constraint value, or a list or
+    tuple of them.
+    """
+    if isinstance(value, (list, tuple)):
+        items = ", ".join(to_py_literal(item) for item in value)
+        if isinstance(value, list):
+            return f"[{items}]"
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    if isinstance(value, str):
+        return json.dumps(value)
+    return repr(value)
+
+
+def to_py_trait_accessor_name(name_parts) -> str:
+    """
+    Returns the specification accessor method name (sans "Trait") for
+    a trait, matching the traitgen python generator.
+    """
+    unique_name = "".join(traitgen_helpers.to_upper_camel_alnum(part) for part in name_parts)
+    return traitgen_helpers.to_lower_camel_alnum(unique_name)
+
+
+_kTypeMap = {
+    PropertyType.STRING: "str",
+    PropertyType.INTEGER: "int",
+    PropertyType.FLOAT: "float",
+    PropertyType.BOOL: "bool",
+}
+
+
+def to_py_type(declaration_type: PropertyType) -> str:
+    """
+    Returns the python value type for a property declaration, matching
+    the traitgen python generator.
+    """
+    if declaration_type not in _kTypeMap:
+        raise TypeError(f"{declaration_type} properties are not supported")
+    return _kTypeMap[declaration_type]
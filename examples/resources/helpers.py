@@ -1,4 +1,6 @@
+import functools
 import os
+import re
 
 from IPython.display import display, display_markdown
 from PIL import Image
@@ -37,6 +39,53 @@ def path_from_url(url):
     return os.path.normpath(os.path.join(host, urllib.request.url2pathname(parsed.path)))
 
 
+_kSeparatorsRegex = re.compile("|".join(re.escape(sep) for sep in (os.sep, os.altsep) if sep))
+
+
+def paths_from_urls(urls):
+    """
+    Extracts paths from many file URLs, as per `path_from_url`.
+
+    URLs are expected to largely share a directory, e.g. the frames of
+    an image sequence. The directory is only converted once (and is
+    memoized across calls), such that only the final path segment of
+    each URL needs to be decoded.
+    """
+    paths = []
+    for url in urls:
+        directory, _, name = url.rpartition("/")
+        # url2pathname (and so path_from_url) just decodes the final
+        # segment, so it can be appended directly, unless it has some
+        # special meaning to urlparse or normpath.
+        if directory and "?" not in name and "#" not in name:
+            if "%" in name:
+                # Escapes are typically in the part of the name shared
+                # by all frames, so only decode up to the last escape.
+                split = name.rfind("%") + 3
+                name = _unquote(name[:split]) + name[split:]
+            if name not in ("", ".", "..") and not _kSeparatorsRegex.search(name):
+                paths.append(os.path.join(_directory_path_from_url(directory), name))
+                continue
+        paths.append(path_from_url(url))
+    return paths
+
+
+@functools.lru_cache(maxsize=1024)
+def _directory_path_from_url(url):
+    """
+    Memoized `path_from_url` for the directory portion of URLs.
+    """
+    return path_from_url(url + "/")
+
+
+@functools.lru_cache(maxsize=1024)
+def _unquote(string):
+    """
+    Memoized URL decoding of path segments.
+    """
+    return urllib.parse.unquote(string)
+
+
 def bootstrap(manager_config_toml_path: str):
     """
     Encapsulate the common bootstrapping code used in multiple
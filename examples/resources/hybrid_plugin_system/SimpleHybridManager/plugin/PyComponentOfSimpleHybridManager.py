@@ -3,10 +3,13 @@
 """
 A single-class module, providing the SimpleHybridManagerInterface class.
 """
+
 # pylint: disable=unused-argument
 
+import sys
+
 from openassetio.trait import TraitsData
-from openassetio.errors import BatchElementError
+from openassetio.errors import BatchElementError, InputValidationException
 from openassetio.access import PolicyAccess, EntityTraitsAccess
 from openassetio.managerApi import ManagerInterface
 from openassetio.pluginSystem import PythonPluginSystemManagerPlugin
@@ -18,8 +21,16 @@ from openassetio_mediacreation.traits.usage import EntityTrait
 # Unique ID of the plugin. Must match that advertised by the partner C++
 # plugin.
 kPluginId = "org.openassetio.examples.simplehybridmanager"
-# The one and only entity reference we support.
+# The entity reference we support if no entity table is configured.
 kTheEntityReference = "examplehybrid://example_entity"
+# Manager setting holding the path of the entity table, which is shared
+# with the partner C++ plugin. See `entities.tsv` for the format.
+kEntitiesPathSetting = "entities_path"
+# The traits an entity must have for us to manage it.
+kManagedTraitSet = frozenset({EntityTrait.kId, LocatableContentTrait.kId})
+# The maximum number of distinct trait sets to cache the read policy
+# of, before the cache is cleared.
+kMaxCachedPolicies = 1024
 
 
 class SimpleHybridManagerInterface(ManagerInterface):
@@ -27,6 +38,19 @@ class SimpleHybridManagerInterface(ManagerInterface):
     Python side of the hybrid plugin.
     """
 
+    def __init__(self):
+        super().__init__()
+        self.__settings = {}
+        # Mapping of entity reference string to its trait set.
+        self.__entityTraitSets = {
+            kTheEntityReference: {EntityTrait.kId, LocatableContentTrait.kId}
+        }
+        # Mapping of frozen trait set to the prebuilt read policy for
+        # it, or None if not managed.
+        self.__policyTemplates = {}
+        self.__managedPolicyTemplate = TraitsData()
+        ManagedTrait.imbueTo(self.__managedPolicyTemplate)
+
     def identifier(self):
         """
         Identifier must match the partner C++ plugin's identifier.
@@ -40,6 +64,35 @@ class SimpleHybridManagerInterface(ManagerInterface):
         """
         return "Simple Hybrid Manager"
 
+    def settings(self, hostSession):
+        """
+        Returns the settings supplied to `initialize`.
+        """
+        return self.__settings.copy()
+
+    def initialize(self, managerSettings, hostSession):
+        """
+        Loads the entity table, if configured, indexed by entity
+        reference.
+
+        Entities commonly share trait sets, so each distinct trait set
+        is interned, and built only once, here, up front.
+        """
+        unknown = set(managerSettings) - {kEntitiesPathSetting}
+        if unknown:
+            raise InputValidationException(f"Unknown settings: {', '.join(sorted(unknown))}")
+
+        path = managerSettings.get(kEntitiesPathSetting)
+        if path is not None:
+            # Mapping of frozen trait set to its interned (mutable, as
+            # required by the success callback) trait set.
+            trait_sets = {}
+            self.__entityTraitSets = {
+                ref: trait_sets.setdefault(trait_set, set(trait_set))
+                for ref, trait_set, _location in _readEntityTable(path)
+            }
+        self.__settings = dict(managerSettings)
+
     def hasCapability(self, capability):
         """
         This plugin supports only the minimal required set of
@@ -58,20 +111,41 @@ class SimpleHybridManagerInterface(ManagerInterface):
     def managementPolicy(self, traitSets, policyAccess, context, hostSession):
         """
         Only support reading file paths (or URLs).
+
+        Hosts typically query large batches containing few distinct
+        trait sets, so the policy for each distinct trait set is
+        determined once, and cached as a prebuilt TraitsData template,
+        which is then copied for each element.
         """
-        policies = [TraitsData() for _ in traitSets]
         if policyAccess != PolicyAccess.kRead:
             # We only support read access.
-            return policies
+            return [TraitsData() for _ in traitSets]
 
-        for trait_set, policy_data in zip(traitSets, policies):
-            if not {EntityTrait.kId, LocatableContentTrait.kId} <= trait_set:
-                # We only support file entities.
-                continue
-            ManagedTrait.imbueTo(policy_data)
+        templates = self.__policyTemplates
+        if len(templates) >= kMaxCachedPolicies:
+            templates.clear()
+
+        policies = []
+        for trait_set in traitSets:
+            key = frozenset(trait_set)
+            try:
+                template = templates[key]
+            except KeyError:
+                template = templates[key] = self.__policyTemplate(key)
+            policies.append(TraitsData() if template is None else TraitsData(template))
 
         return policies
 
+    def __policyTemplate(self, traitSet):
+        """
+        Returns the prebuilt read policy for a trait set, or None if it
+        is not managed.
+        """
+        if not kManagedTraitSet <= traitSet:
+            # We only support file entities.
+            return None
+        return self.__managedPolicyTemplate
+
     def isEntityReferenceString(self, someString, hostSession):
         """
         Both Python and C++ plugins should expect the same entity
@@ -92,6 +166,10 @@ class SimpleHybridManagerInterface(ManagerInterface):
         This Python plugin provides introspection of entities to get
         their trait set, whereas the values for the properties of the
         traits are `resolve`d through the partner C++ plugin.
+
+        Each entity is found with a single lookup in the index built by
+        `initialize`, and its prebuilt trait set passed as-is to the
+        success callback.
         """
 
         # Only support reading.
@@ -103,19 +181,46 @@ class SimpleHybridManagerInterface(ManagerInterface):
                 errorCallback(idx, result)
             return
 
+        entity_trait_sets = self.__entityTraitSets
         for idx, ref in enumerate(entityReferences):
-            if ref.toString() == kTheEntityReference:
-                successCallback(idx, {EntityTrait.kId, LocatableContentTrait.kId})
+            ref_string = ref.toString()
+            trait_set = entity_trait_sets.get(ref_string)
+            if trait_set is not None:
+                successCallback(idx, trait_set)
             else:
                 errorCallback(
                     idx,
                     BatchElementError(
                         BatchElementError.ErrorCode.kEntityResolutionError,
-                        f"Entity '{ref.toString()}' not found",
+                        f"Entity '{ref_string}' not found",
                     ),
                 )
 
 
+def _readEntityTable(path):
+    """
+    Yields an `(entity reference, trait set, location)` tuple for each
+    entity in the table at path.
+
+    Trait IDs are interned, as they are repeated across entities.
+    """
+    with open(path, encoding="utf-8") as table:
+        for line_number, line in enumerate(table, 1):
+            line = line.rstrip("\r\n")
+            if not line or line.startswith("#"):
+                continue
+            columns = line.split("\t")
+            if len(columns) != 3:
+                raise InputValidationException(
+                    f"{path}:{line_number}: Expected 3 tab separated columns, got {len(columns)}"
+                )
+            ref, trait_ids, location = columns
+            trait_set = frozenset(
+                sys.intern(trait_id) for trait_id in trait_ids.split(",") if trait_id
+            )
+            yield ref, trait_set, location
+
+
 class SimpleHybridManagerPlugin(PythonPluginSystemManagerPlugin):
     """
     Entry point for the plugin.
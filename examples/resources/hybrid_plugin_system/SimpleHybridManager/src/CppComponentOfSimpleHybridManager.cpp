@@ -1,12 +1,18 @@
 // SPDX-License-Identifier: Apache-2.0
 // Copyright 2024 The Foundry Visionmongers Ltd
 #include <algorithm>
+#include <cstddef>
+#include <fstream>
 #include <optional>
 #include <string>
 #include <string_view>
+#include <unordered_map>
+#include <utility>
+#include <variant>
 
 #include <export.h>
 
+#include <openassetio/InfoDictionary.hpp>
 #include <openassetio/errors/exceptions.hpp>
 #include <openassetio/managerApi/EntityReferencePagerInterface.hpp>
 #include <openassetio/managerApi/ManagerInterface.hpp>
@@ -19,10 +25,76 @@ namespace {
 // Unique ID of the plugin. Must match that advertised by the partner
 // Python plugin.
 constexpr std::string_view kPluginId = "org.openassetio.examples.simplehybridmanager";
-// The one and only entity reference we support. These two lines
-// represent our backend database.
+// The entity we support if no entity table is configured.
 constexpr std::string_view kTheEntityReference = "examplehybrid://example_entity";
 constexpr std::string_view kTheEntityPath = "file:///some/path.exr";
+// Manager setting holding the path of the entity table, which is
+// shared with the partner Python plugin. See `entities.tsv` for the
+// format.
+constexpr std::string_view kEntitiesPathSetting = "entities_path";
+
+/**
+ * The properties of an entity needed to `resolve` it.
+ */
+struct Entity {
+  bool isLocatable;
+  openassetio::Str location;
+};
+
+/**
+ * Mapping of entity reference string to entity - our backend database.
+ */
+using EntityIndex = std::unordered_map<openassetio::Str, Entity>;
+
+/**
+ * Loads the entity table at the given path into an index.
+ */
+EntityIndex loadEntityIndex(const openassetio::Str& path) {
+  using openassetio::errors::InputValidationException;
+  using openassetio_mediacreation::traits::content::LocatableContentTrait;
+
+  std::ifstream table{path};
+  if (!table) {
+    throw InputValidationException{"Unable to read entity table '" + path + "'"};
+  }
+
+  EntityIndex index;
+  std::string line;
+  std::size_t lineNumber = 0;
+  while (std::getline(table, line)) {
+    ++lineNumber;
+    if (!line.empty() && line.back() == '\r') {
+      line.pop_back();
+    }
+    if (line.empty() || line.front() == '#') {
+      continue;
+    }
+
+    const std::size_t traitsStart = line.find('\t');
+    const std::size_t locationStart =
+        traitsStart == std::string::npos ? traitsStart : line.find('\t', traitsStart + 1);
+    if (locationStart == std::string::npos ||
+        line.find('\t', locationStart + 1) != std::string::npos) {
+      throw InputValidationException{path + ":" + std::to_string(lineNumber) +
+                                     ": Expected 3 tab separated columns"};
+    }
+
+    // Trait IDs are comma separated, and the entity is only locatable
+    // if one of them is LocatableContent.
+    const std::string_view traitIds{line.data() + traitsStart + 1,
+                                    locationStart - traitsStart - 1};
+    bool isLocatable = false;
+    for (std::size_t start = 0; start <= traitIds.size() && !isLocatable;) {
+      const std::size_t end = std::min(traitIds.find(',', start), traitIds.size());
+      isLocatable = traitIds.substr(start, end - start) == LocatableContentTrait::kId;
+      start = end + 1;
+    }
+
+    index.insert_or_assign(line.substr(0, traitsStart),
+                           Entity{isLocatable, line.substr(locationStart + 1)});
+  }
+  return index;
+}
 }  // namespace
 
 /**
@@ -45,6 +117,40 @@ struct SimpleHybridManagerInterface final : openassetio::managerApi::ManagerInte
    */
   [[nodiscard]] openassetio::Str displayName() const override { return "Simple Hybrid Manager"; }
 
+  /**
+   * Returns the settings supplied to `initialize`.
+   */
+  openassetio::InfoDictionary settings(
+      [[maybe_unused]] const openassetio::managerApi::HostSessionPtr& hostSession) override {
+    return settings_;
+  }
+
+  /**
+   * Loads the entity table, if configured, into a hash index, such
+   * that each entity can be found in a single lookup.
+   */
+  void initialize(
+      openassetio::InfoDictionary managerSettings,
+      [[maybe_unused]] const openassetio::managerApi::HostSessionPtr& hostSession) override {
+    using openassetio::errors::InputValidationException;
+
+    for (const auto& [key, value] : managerSettings) {
+      if (key != kEntitiesPathSetting) {
+        throw InputValidationException{"Unknown setting: " + key};
+      }
+    }
+
+    if (const auto setting = managerSettings.find(openassetio::Str{kEntitiesPathSetting});
+        setting != managerSettings.end()) {
+      const auto* path = std::get_if<openassetio::Str>(&setting->second);
+      if (path == nullptr) {
+        throw InputValidationException{"Setting '" + setting->first + "' must be a string"};
+      }
+      entities_ = loadEntityIndex(*path);
+    }
+    settings_ = std::move(managerSettings);
+  }
+
   /**
    * The C++ side of this hybrid plugin is solely responsible for
    * `resolve` and nothing else.
@@ -81,16 +187,19 @@ struct SimpleHybridManagerInterface final : openassetio::managerApi::ManagerInte
       return;
     }
 
+    // The requested trait set is the same for the whole batch, so
+    // check it once, up front. We only support one trait.
+    const bool isLocationRequested = traitSet.count(LocatableContentTrait::kId) != 0;
+
     // Loop each entity reference in the input batch.
     for (std::size_t idx = 0; idx < entityReferences.size(); ++idx) {
-      // We only support one entity.
-      if (entityReferences[idx].toString() == kTheEntityReference) {
+      const auto entity = entities_.find(entityReferences[idx].toString());
+      if (entity != entities_.end()) {
         TraitsDataPtr traitsData = TraitsData::make();
 
-        // Populate the requested traits with their properties. We only
-        // support one trait.
-        if (traitSet.count(LocatableContentTrait::kId)) {
-          LocatableContentTrait{traitsData}.setLocation(openassetio::Str{kTheEntityPath});
+        // Populate the requested traits with their properties.
+        if (isLocationRequested && entity->second.isLocatable) {
+          LocatableContentTrait{traitsData}.setLocation(entity->second.location);
         }
 
         successCallback(idx, std::move(traitsData));
@@ -102,6 +211,11 @@ struct SimpleHybridManagerInterface final : openassetio::managerApi::ManagerInte
       }
     }
   }
+
+ private:
+  openassetio::InfoDictionary settings_;
+  EntityIndex entities_{
+      {openassetio::Str{kTheEntityReference}, Entity{true, openassetio::Str{kTheEntityPath}}}};
 };
 
 /**
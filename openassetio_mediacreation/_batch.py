@@ -0,0 +1,165 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Private helpers for the batch (columnar) accessors of the generated
+trait view classes, and the batch constructors of the generated
+specification view classes.
+"""
+
+from openassetio.trait import TraitsData
+
+# The maximum number of invalid data detailed in the error raised when
+# validating a batch.
+kMaxReportedProblems = 5
+
+
+def missingMask(values, valueType, propertyName):
+    """
+    Returns a list flagging the `None` entries of the supplied values.
+
+    @exception TypeError If any other entry is not exactly of type
+    valueType.
+    """
+    missing = [value is None for value in values]
+    if not all(type(value) is valueType for value in values if value is not None):
+        for index, value in enumerate(values):
+            if value is not None and type(value) is not valueType:
+                raise TypeError(
+                    f"Invalid stored value type for '{propertyName}' at index {index}:"
+                    f" '{type(value).__name__}' should be '{valueType.__name__}'."
+                )
+    return missing
+
+
+def toArrays(values, missing, valueType):
+    """
+    Converts a column of values, and its missing mask, to NumPy arrays.
+
+    Missing integer values are 0, missing float values are NaN.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy
+
+    if valueType is float:
+        # NumPy converts None to NaN for float arrays.
+        array = numpy.array(values, dtype=numpy.float64)
+    else:
+        array = numpy.fromiter(
+            (0 if value is None else value for value in values),
+            dtype=numpy.int64,
+            count=len(values),
+        )
+    return array, numpy.array(missing, dtype=bool)
+
+
+def checkedValues(traitsDatas, values, missing, valueType, propertyName):
+    """
+    Validates a column of values to be set on the supplied data,
+    returning them as a list, where entries flagged in the (optional)
+    missing mask are replaced with `None`, i.e. are not to be set.
+
+    @exception ValueError If the number of values (or mask entries)
+    differs from the number of data.
+    @exception TypeError If any value to be set is not of valueType.
+    """
+    if hasattr(values, "tolist"):
+        # NumPy arrays, convert to native Python values.
+        values = values.tolist()
+    else:
+        values = list(values)
+    if len(values) != len(traitsDatas):
+        raise ValueError(
+            f"Expected {len(traitsDatas)} values for '{propertyName}', got {len(values)}."
+        )
+
+    if missing is not None:
+        if hasattr(missing, "tolist"):
+            missing = missing.tolist()
+        if len(missing) != len(values):
+            raise ValueError(
+                f"Expected {len(values)} mask entries for '{propertyName}', got {len(missing)}."
+            )
+        values = [None if isMissing else value for value, isMissing in zip(values, missing)]
+
+    for index, value in enumerate(values):
+        if value is not None and type(value) is not valueType:
+            raise TypeError(f"{propertyName} at index {index} must be a '{valueType.__name__}'.")
+    return values
+
+
+# pylint: disable=too-many-arguments,too-many-locals
+def createBatch(traitSet, columnSpecs, columns, missing, count, validate):
+    """
+    Returns a list of new TraitsData, each imbued with traitSet, whose
+    properties are set from columns of values, as per the generated
+    `batchCreate` of a specification.
+
+    @param columnSpecs: The `(key, traitId, propertyName, valueType)`
+    of each accepted column.
+
+    @exception ValueError If a column is not accepted, the columns
+    differ in length, or no columns or count are supplied, or if
+    validating and any data is invalid.
+    @exception TypeError If any value to be set is not of its column's
+    valueType.
+    """
+    columns = columns or {}
+    missing = missing or {}
+    specs = {spec[0]: spec for spec in columnSpecs}
+    for key in (*columns, *missing):
+        if key not in specs:
+            raise ValueError(
+                f"Unknown column '{key}', expected one of: {', '.join(specs) or 'none'}."
+            )
+    for key in missing:
+        if key not in columns:
+            raise ValueError(f"Mask supplied for column '{key}', but no values.")
+    if count is None:
+        if not columns:
+            raise ValueError("A count is required if no columns are supplied.")
+        count = len(next(iter(columns.values())))
+
+    traitsDatas = [TraitsData() for _ in range(count)]
+    checkedColumns = {
+        key: checkedValues(traitsDatas, values, missing.get(key), specs[key][3], key)
+        for key, values in columns.items()
+    }
+
+    if validate:
+        # Validate the columns before they are set, rather than
+        # retrieving every property again from the built data.
+        # pylint: disable=import-outside-toplevel
+        from . import validators
+
+        columnsByTrait = {}
+        for key, values in checkedColumns.items():
+            _, traitId, propertyName, _ = specs[key]
+            columnsByTrait.setdefault(traitId, {})[propertyName] = values
+        problems = validators.columnViolations(columnsByTrait, count)
+        if problems:
+            details = "; ".join(
+                f"[{index}] {', '.join(messages)}"
+                for index, messages in list(problems.items())[:kMaxReportedProblems]
+            )
+            raise ValueError(f"{len(problems)} of {count} entities are invalid: {details}")
+
+    # Setting a property imbues its trait, so traits with a column of
+    # values for every data need not be added separately.
+    unimbued = set(traitSet)
+    setTraitProperty = TraitsData.setTraitProperty
+    for key, values in checkedColumns.items():
+        _, traitId, propertyName, _ = specs[key]
+        if None in values:
+            for traitsData, value in zip(traitsDatas, values):
+                if value is not None:
+                    setTraitProperty(traitsData, traitId, propertyName, value)
+        else:
+            for traitsData, value in zip(traitsDatas, values):
+                setTraitProperty(traitsData, traitId, propertyName, value)
+            unimbued.discard(traitId)
+
+    addTrait = TraitsData.addTrait
+    for traitId in unimbued:
+        for traitsData in traitsDatas:
+            addTrait(traitsData, traitId)
+    return traitsDatas
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Private helpers for the generated `instrumentation` module.
+
+Instrumentation replaces the methods of the trait view classes, in
+place, with wrappers that increment counters before delegating to the
+original method. The originals are recorded so that they can be
+restored exactly, leaving the classes as they were.
+
+Counts are keyed by `(traitId, event)` for whole-trait events, and
+`(traitId, propertyName, event)` for property events.
+"""
+
+import collections
+import functools
+import operator
+
+from openassetio.trait import TraitsData
+
+_counts = collections.Counter()
+# (class, attribute name, original attribute, whether inherited) for
+# each replaced method.
+_originals = []
+
+
+def isInstalled():
+    """
+    Returns whether any view class is currently instrumented.
+    """
+    return bool(_originals)
+
+
+def install(cls, traitId, accessors):
+    """
+    Instruments the supplied trait view class.
+
+    @param accessors: A `(propertyName, getterName, setterName)` tuple
+    for each property of the trait.
+    """
+    _patch(cls, "__init__", _counting, (traitId, "constructed"))
+    # isImbued delegates to isImbuedTo, so is counted by it.
+    _patch(cls, "isImbuedTo", _counting, (traitId, "isImbued"))
+    _patch(cls, "imbue", _counting, (traitId, "imbue"))
+    _patch(cls, "imbueTo", _counting, (traitId, "imbue"))
+
+    # The wrapped data is held in a private (name mangled) slot.
+    getData = operator.attrgetter(f"_{cls.__name__}__data")
+    for propertyName, getterName, setterName in accessors:
+        _patch(cls, getterName, _countingGetter, getData, traitId, propertyName)
+        _patch(cls, setterName, _counting, (traitId, propertyName, "sets"))
+
+
+def uninstall():
+    """
+    Restores the original methods of all instrumented classes.
+    """
+    while _originals:
+        cls, name, original, isInherited = _originals.pop()
+        if isInherited:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+
+
+def reset():
+    """
+    Zeros all counts.
+    """
+    _counts.clear()
+
+
+def snapshot():
+    """
+    Returns the current counts as nested dicts, see
+    `instrumentation.snapshot`.
+    """
+    result = {}
+    for key, count in _counts.items():
+        traitCounts = result.get(key[0])
+        if traitCounts is None:
+            traitCounts = result[key[0]] = {
+                "constructed": 0,
+                "imbue": 0,
+                "isImbued": 0,
+                "properties": {},
+            }
+        if len(key) == 2:
+            traitCounts[key[1]] += count
+        else:
+            propertyCounts = traitCounts["properties"].setdefault(
+                key[1], {"getHits": 0, "getMisses": 0, "sets": 0}
+            )
+            propertyCounts[key[2]] += count
+    return result
+
+
+def _patch(cls, name, makeWrapper, *args):
+    """
+    Replaces a method of cls with the wrapper returned by makeWrapper,
+    preserving any classmethod-ness.
+
+    Methods inherited from a base class (e.g. the traitgen class a view
+    class extends) are overridden on cls, leaving the base untouched.
+    """
+    owner = next(klass for klass in cls.__mro__ if name in klass.__dict__)
+    original = owner.__dict__[name]
+    if isinstance(original, classmethod):
+        wrapper = classmethod(makeWrapper(original.__func__, *args))
+    else:
+        wrapper = makeWrapper(original, *args)
+    _originals.append((cls, name, original, owner is not cls))
+    setattr(cls, name, wrapper)
+
+
+def _counting(func, key):
+    counts = _counts
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        counts[key] += 1
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _countingGetter(func, getData, traitId, propertyName):
+    counts = _counts
+    hitKey = (traitId, propertyName, "getHits")
+    missKey = (traitId, propertyName, "getMisses")
+    getTraitProperty = TraitsData.getTraitProperty
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if getTraitProperty(getData(self), traitId, propertyName) is None:
+            counts[missKey] += 1
+        else:
+            counts[hitKey] += 1
+        return func(self, *args, **kwargs)
+
+    return wrapper
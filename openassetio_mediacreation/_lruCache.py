@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Private base for the bounded, least-recently-used caches of compiled
+values, e.g. parsed location templates or MIME type matchers.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict
+
+
+class LruCache:
+    """
+    A bounded, least-recently-used cache of the values created by
+    factory, keyed by the single argument they are created from.
+
+    The cache is thread safe. Hit, miss and eviction counts are
+    maintained for monitoring, see @ref stats.
+
+    @param factory Callable creating the value for a key. Any exception
+    it raises is propagated, and nothing is cached.
+    @param maxSize The maximum number of values to hold.
+
+    @exception ValueError If maxSize is not positive.
+    """
+
+    def __init__(self, factory, maxSize: int):
+        if maxSize < 1:
+            raise ValueError(f"Invalid maxSize '{maxSize}': must be positive.")
+        self.__factory = factory
+        self.__maxSize = maxSize
+        self.__values = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @property
+    def maxSize(self) -> int:
+        """
+        The maximum number of values held.
+        """
+        return self.__maxSize
+
+    def get(self, key):
+        """
+        Returns the value for the supplied key, creating and caching it
+        if required.
+        """
+        with self.__lock:
+            value = self.__values.get(key)
+            if value is not None:
+                self.__values.move_to_end(key)
+                self.__hits += 1
+                return value
+            self.__misses += 1
+
+        # Create outside the lock, a concurrent creation for the same
+        # key is harmless.
+        value = self.__factory(key)
+
+        with self.__lock:
+            self.__values[key] = value
+            self.__values.move_to_end(key)
+            while len(self.__values) > self.__maxSize:
+                self.__values.popitem(last=False)
+                self.__evictions += 1
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns a snapshot of the cache's counters, with the keys
+        "hits", "misses", "evictions", "size" and "maxSize".
+        """
+        with self.__lock:
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "evictions": self.__evictions,
+                "size": len(self.__values),
+                "maxSize": self.__maxSize,
+            }
+
+    def clear(self):
+        """
+        Removes all values and resets the counters.
+        """
+        with self.__lock:
+            self.__values.clear()
+            self.__hits = self.__misses = self.__evictions = 0
+
+    def __len__(self):
+        return len(self.__values)
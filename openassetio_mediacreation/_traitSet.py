@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Private helpers for the precomputed trait sets of the generated
+specification view classes.
+"""
+
+import sys
+
+# Maximum number of `union` results to memoize per memo, after which
+# the memo is cleared.
+kMaxUnions = 1024
+
+
+class FrozenTraitSet(set):
+    """
+    An immutable, hashable set of (interned) trait IDs.
+
+    This is a `set`, rather than a `frozenset`, subclass, as the
+    OpenAssetIO API only accepts a `set` where a TraitSet is expected.
+    It hashes and compares equal to the equivalent `frozenset`, so
+    either can be used to look up the other in a `dict`.
+
+    As with `frozenset`, the result of set algebra (including augmented
+    assignment) is a new set. This is a plain, mutable `set`.
+    """
+
+    __slots__ = ("__hash",)
+
+    def __init__(self, traitIds=()):
+        super().__init__(map(sys.intern, traitIds))
+        self.__hash = hash(frozenset(self))
+
+    def __hash__(self):
+        return self.__hash
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+    def __readonly(self, *_args):
+        raise TypeError(f"'{type(self).__name__}' object is immutable")
+
+    add = discard = remove = pop = clear = update = __readonly
+    difference_update = intersection_update = symmetric_difference_update = __readonly
+
+    def __ior__(self, other):
+        return self | other
+
+    def __iand__(self, other):
+        return self & other
+
+    def __isub__(self, other):
+        return self - other
+
+    def __ixor__(self, other):
+        return self ^ other
+
+
+_interned = {}
+
+
+def intern(traitIds):
+    """
+    Returns the canonical FrozenTraitSet of the supplied trait IDs,
+    such that equal trait sets are the same object.
+    """
+    key = frozenset(traitIds)
+    traitSet = _interned.get(key)
+    if traitSet is None:
+        traitSet = _interned[key] = FrozenTraitSet(key)
+    return traitSet
+
+
+def union(memo, traitSet, traitIds):
+    """
+    Returns the interned union of the supplied FrozenTraitSet and tuple
+    of trait IDs, memoizing it in memo, keyed by the tuple.
+    """
+    if len(memo) >= kMaxUnions:
+        memo.clear()
+    result = memo[traitIds] = intern(traitSet.union(traitIds))
+    return result
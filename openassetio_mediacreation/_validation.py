@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Private helpers for the generated `validators` module.
+
+Each check acts on a column of property values, gathered from the
+TraitsData at the supplied indices, and records a message against the
+index of each violating value in problems, a dict of index to a list
+of messages. Unset (`None`) values never violate a check.
+"""
+
+import re
+
+from openassetio.trait import TraitsData
+
+# The scheme of an (absolute) URL.
+_kUrlSchemeRegex = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*:")
+# Any character not valid in a URL (allowing the braces of templated
+# locations, see `locationTemplate`), or a malformed percent-encoding.
+_kUrlInvalidRegex = re.compile(r"[^A-Za-z0-9\-._~:/?#\[\]@!$&'()*+,;={}%]|%(?![0-9A-Fa-f]{2})")
+
+_kNoneType = type(None)
+
+
+def column(traitsDatas, traitId, propertyName, valueType, indices, problems):
+    """
+    Returns the values of a property for each of the supplied data,
+    which are at the supplied indices of the batch, where values not of
+    valueType are recorded as problems and replaced with `None`.
+    """
+    # Calling the unbound method avoids creating a bound method per data.
+    getTraitProperty = TraitsData.getTraitProperty
+    values = [getTraitProperty(traitsData, traitId, propertyName) for traitsData in traitsDatas]
+    if set(map(type, values)) <= {valueType, _kNoneType}:
+        return values
+    for position, (index, value) in enumerate(zip(indices, values)):
+        if value is not None and type(value) is not valueType:
+            _record(
+                problems,
+                index,
+                f"'{traitId}' property '{propertyName}' must be a '{valueType.__name__}',"
+                f" got '{type(value).__name__}'",
+            )
+            values[position] = None
+    return values
+
+
+# pylint: disable=too-many-arguments
+def checkBound(problems, traitId, propertyName, indices, values, operator, bound):
+    """
+    Checks each value satisfies `value <operator> bound`, where operator
+    is one of ">=", ">", "<=" or "<".
+    """
+    if operator == ">=":
+        violations = [(i, v) for i, v in zip(indices, values) if v is not None and not v >= bound]
+    elif operator == ">":
+        violations = [(i, v) for i, v in zip(indices, values) if v is not None and not v > bound]
+    elif operator == "<=":
+        violations = [(i, v) for i, v in zip(indices, values) if v is not None and not v <= bound]
+    else:
+        violations = [(i, v) for i, v in zip(indices, values) if v is not None and not v < bound]
+    for index, value in violations:
+        _record(
+            problems,
+            index,
+            f"'{traitId}' property '{propertyName}' must be {operator} {bound!r}, got {value!r}",
+        )
+
+
+def checkEnum(problems, traitId, propertyName, indices, values, allowed):
+    """
+    Checks each value is one of the allowed values.
+    """
+    allowed = frozenset(allowed)
+    for index, value in zip(indices, values):
+        if value is not None and value not in allowed:
+            _record(
+                problems,
+                index,
+                f"'{traitId}' property '{propertyName}' must be one of"
+                f" {sorted(allowed)!r}, got {value!r}",
+            )
+
+
+def checkUrl(problems, traitId, propertyName, indices, values):
+    """
+    Checks each value is a valid URL, with any special characters
+    percent-encoded.
+    """
+    matchScheme = _kUrlSchemeRegex.match
+    searchInvalid = _kUrlInvalidRegex.search
+    for index, value in zip(indices, values):
+        if value is not None and (matchScheme(value) is None or searchInvalid(value)):
+            _record(
+                problems,
+                index,
+                f"'{traitId}' property '{propertyName}' must be a valid URL, got {value!r}",
+            )
+
+
+def checkOrdered(problems, traitId, propertyNames, indices, columns):
+    """
+    Checks that the values of the named properties, where set, are
+    non-decreasing in the order given.
+    """
+    for index, values in zip(indices, zip(*columns)):
+        present = [value for value in values if value is not None] if None in values else values
+        if list(present) == sorted(present):
+            continue
+        setValues = ", ".join(
+            f"{name}={value!r}" for name, value in zip(propertyNames, values) if value is not None
+        )
+        _record(
+            problems,
+            index,
+            f"'{traitId}' properties must satisfy {' <= '.join(propertyNames)}, got {setValues}",
+        )
+
+
+def _record(problems, index, message):
+    problems.setdefault(index, []).append(message)
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Private helpers for the generated extensions of the trait and
+specification view classes generated by openassetio-traitgen.
+
+The traitgen classes are authoritative. The extensions subclass them,
+to add (e.g.) batch accessors, and replace them in their namespace
+module. As `__slots__` only removes the per-instance `__dict__` if
+every class in the hierarchy declares them, the traitgen classes are
+first copied with `__slots__`, see @ref slotted.
+"""
+
+import types
+
+# Class attributes that are specific to a class with a `__dict__`.
+_kDictAttributes = ("__dict__", "__weakref__")
+
+
+def slotted(cls, slots=(), base=None):
+    """
+    Returns a copy of the supplied class, with the supplied
+    `__slots__`, such that neither it nor any slotted subclass has a
+    per-instance `__dict__`.
+
+    Private (name mangled) slot names are mangled with the class name,
+    which is unchanged, so are those used by the class's methods.
+
+    @param base: If supplied, the copy derives from this class instead
+    of the original's bases, e.g. a slotted copy of the original base.
+    """
+    namespace = {name: value for name, value in vars(cls).items() if name not in _kDictAttributes}
+    namespace["__slots__"] = tuple(slots)
+    copy = type(cls)(cls.__name__, cls.__bases__ if base is None else (base,), namespace)
+
+    # Methods using zero-argument `super()` reference their class via a
+    # closure cell, which must now reference the copy.
+    for value in namespace.values():
+        function = getattr(value, "__func__", value)
+        if not isinstance(function, types.FunctionType):
+            continue
+        for cell in function.__closure__ or ():
+            try:
+                if cell.cell_contents is cls:
+                    cell.cell_contents = copy
+            except ValueError:
+                # Empty cell.
+                pass
+    return copy
@@ -0,0 +1,370 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+An interval index over the frame ranges of `FrameRangedTrait` data.
+
+A `FrameRangeIndex` answers which of many entities cover a given frame,
+or any frame of a given range, optionally honouring each entity's
+`step`, without scanning every entity. Ranges are held in NumPy
+arrays, sorted by first frame, alongside an implicit binary tree of
+the maximum last frame under each node, such that queries only visit
+the O(log n) nodes on the paths to the matching entities.
+
+Entities are identified by integer IDs of the caller's choosing (e.g.
+their index in a batch), which keeps the index to a few tens of bytes
+per entity. Entities can be inserted, replaced and removed
+incrementally. Changes are buffered, and merged into the sorted
+arrays once the buffer grows beyond a fraction of the index.
+
+The frame range of an entity is as per @ref
+locationTemplate.frameRange, i.e. from `inFrame` (or `startFrame`),
+aligned to `step` relative to `startFrame`, to `outFrame` (or
+`endFrame`), inclusive.
+
+NumPy is required.
+"""
+
+from typing import Iterable, Optional, Sequence
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from openassetio.trait import TraitsData
+
+from . import locationTemplate
+from .traits.timeDomain import FrameRangedTrait_v1
+
+__all__ = ["FrameRangeIndex"]
+
+# The minimum number of buffered changes before they are merged.
+kMinBufferSize = 1024
+# The fraction of the index size that buffered changes may reach
+# before they are merged.
+kBufferFraction = 1 / 32
+
+
+class FrameRangeIndex:
+    """
+    An index of entity frame ranges, for point and range queries.
+
+    @exception ImportError If NumPy is not installed.
+    """
+
+    __slots__ = (
+        "__first",
+        "__last",
+        "__step",
+        "__ids",
+        "__alive",
+        "__numDead",
+        "__levels",
+        "__sortedIds",
+        "__idRows",
+        "__pending",
+        "__pendingArrays",
+    )
+
+    def __init__(self):
+        if numpy is None:
+            raise ImportError("FrameRangeIndex requires NumPy")
+        empty = numpy.empty(0, dtype=numpy.int64)
+        self.__pending = {}
+        self.__pendingArrays = None
+        self.__build(empty, empty, empty, empty)
+
+    @classmethod
+    def fromArrays(
+        cls,
+        ids: Sequence[int],
+        firstFrames: Sequence[int],
+        lastFrames: Sequence[int],
+        steps: Optional[Sequence[int]] = None,
+    ) -> "FrameRangeIndex":
+        """
+        Returns an index of the supplied columns of entity IDs, first
+        and last frames (inclusive) and, optionally, steps.
+
+        @exception ValueError If the columns differ in length, IDs are
+        repeated, or any range is empty or has a step less than 1.
+        """
+        ids = numpy.asarray(ids, dtype=numpy.int64)
+        first = numpy.asarray(firstFrames, dtype=numpy.int64)
+        last = numpy.asarray(lastFrames, dtype=numpy.int64)
+        step = (
+            numpy.ones(len(ids), dtype=numpy.int64)
+            if steps is None
+            else numpy.asarray(steps, dtype=numpy.int64)
+        )
+        if not len(ids) == len(first) == len(last) == len(step):
+            raise ValueError("Frame range columns must all be the same length")
+        if len(numpy.unique(ids)) != len(ids):
+            raise ValueError("Frame range IDs must be unique")
+        _checkRanges(first, last, step)
+
+        index = cls()
+        order = numpy.argsort(first, kind="stable")
+        index.__build(ids[order], first[order], last[order], step[order])
+        return index
+
+    @classmethod
+    def fromTraitsData(
+        cls, traitsDatas: Sequence[TraitsData], ids: Optional[Iterable[int]] = None
+    ) -> "FrameRangeIndex":
+        """
+        Returns an index of the frame ranges of the supplied data.
+
+        Data whose frame range cannot be determined, or is empty, is
+        not indexed.
+
+        @param ids The ID of each data, defaulting to its position in
+        traitsDatas.
+
+        @exception ValueError If any `step` is less than 1.
+        """
+        start, startMissing = FrameRangedTrait_v1.batchGetStartFrame(traitsDatas, asArray=True)
+        end, endMissing = FrameRangedTrait_v1.batchGetEndFrame(traitsDatas, asArray=True)
+        inFrame, inMissing = FrameRangedTrait_v1.batchGetInFrame(traitsDatas, asArray=True)
+        outFrame, outMissing = FrameRangedTrait_v1.batchGetOutFrame(traitsDatas, asArray=True)
+        step, stepMissing = FrameRangedTrait_v1.batchGetStep(traitsDatas, asArray=True)
+
+        first = numpy.where(inMissing, start, inFrame)
+        firstMissing = inMissing & startMissing
+        last = numpy.where(outMissing, end, outFrame)
+        lastMissing = outMissing & endMissing
+        step[stepMissing] = 1
+        if (step < 1).any():
+            raise ValueError(f"Invalid FrameRanged step '{step[step < 1][0]}': must be positive.")
+        # Align the first frame to the step, relative to startFrame.
+        first += numpy.where(startMissing, 0, (start - first) % step)
+
+        ids = (
+            numpy.arange(len(traitsDatas), dtype=numpy.int64)
+            if ids is None
+            else numpy.fromiter(ids, dtype=numpy.int64, count=len(traitsDatas))
+        )
+        keep = ~firstMissing & ~lastMissing & (first <= last)
+        return cls.fromArrays(ids[keep], first[keep], last[keep], step[keep])
+
+    def insert(self, entityId: int, firstFrame: int, lastFrame: int, step: int = 1):
+        """
+        Adds the frame range (inclusive) of an entity, replacing any
+        previous range for the same ID.
+
+        @exception ValueError If the range is empty or the step is less
+        than 1.
+        """
+        if step < 1:
+            raise ValueError(f"Invalid frame range step '{step}': must be positive.")
+        if lastFrame < firstFrame:
+            raise ValueError(
+                f"Invalid frame range {firstFrame}-{lastFrame}: last frame before first."
+            )
+        if entityId in self:
+            self.remove(entityId)
+        self.__pending[entityId] = (firstFrame, lastFrame, step)
+        self.__pendingArrays = None
+        self.__mergeIfNeeded()
+
+    def insertTraitsData(self, entityId: int, traitsData: TraitsData):
+        """
+        Adds the frame range of the supplied data, replacing any
+        previous range for the same ID.
+
+        @exception ValueError If the frame range cannot be determined,
+        or is empty.
+        """
+        frames = locationTemplate.frameRange(traitsData)
+        if not frames:
+            raise ValueError(f"Cannot index entity {entityId}: empty frame range.")
+        self.insert(entityId, frames.start, frames.stop - 1, frames.step)
+
+    def remove(self, entityId: int):
+        """
+        Removes the frame range of an entity.
+
+        @exception KeyError If the entity is not in the index.
+        """
+        if self.__pending.pop(entityId, None) is not None:
+            self.__pendingArrays = None
+            return
+        row = self.__row(entityId)
+        if row is None:
+            raise KeyError(entityId)
+        self.__alive[row] = False
+        self.__numDead += 1
+        self.__mergeIfNeeded()
+
+    def frameRange(self, entityId: int) -> range:
+        """
+        Returns the indexed frames of an entity.
+
+        @exception KeyError If the entity is not in the index.
+        """
+        pending = self.__pending.get(entityId)
+        if pending is not None:
+            first, last, step = pending
+        else:
+            row = self.__row(entityId)
+            if row is None:
+                raise KeyError(entityId)
+            first, last, step = (
+                int(self.__first[row]),
+                int(self.__last[row]),
+                int(self.__step[row]),
+            )
+        return range(first, last + 1, step)
+
+    def covering(self, frame: int, honourStep: bool = True):
+        """
+        Returns the (sorted) IDs of the entities whose frame range
+        includes the supplied frame.
+
+        @param honourStep If True, entities with a step only cover the
+        frames they step through.
+        @return A NumPy array of IDs.
+        """
+        return self.overlapping(frame, frame, honourStep)
+
+    def overlapping(self, firstFrame: int, lastFrame: int, honourStep: bool = True):
+        """
+        Returns the (sorted) IDs of the entities whose frame range
+        overlaps the supplied range (inclusive).
+
+        @param honourStep If True, entities with a step only overlap if
+        one of the frames they step through is within the range.
+        @return A NumPy array of IDs.
+        """
+        rows = self.__candidates(lastFrame, firstFrame)
+        ids = self.__select(
+            self.__ids[rows],
+            self.__first[rows],
+            self.__last[rows],
+            self.__step[rows],
+            firstFrame,
+            lastFrame,
+            honourStep,
+        )
+        if self.__pending:
+            pendingIds, first, last, step = self.__pendingColumns()
+            hit = (first <= lastFrame) & (last >= firstFrame)
+            ids = numpy.concatenate(
+                (
+                    ids,
+                    self.__select(
+                        pendingIds[hit],
+                        first[hit],
+                        last[hit],
+                        step[hit],
+                        firstFrame,
+                        lastFrame,
+                        honourStep,
+                    ),
+                )
+            )
+        ids.sort()
+        return ids
+
+    def __len__(self):
+        return len(self.__ids) - self.__numDead + len(self.__pending)
+
+    def __contains__(self, entityId):
+        return entityId in self.__pending or self.__row(entityId) is not None
+
+    def __repr__(self):
+        return f"<FrameRangeIndex of {len(self)} entities>"
+
+    @staticmethod
+    def __select(ids, first, last, step, firstFrame, lastFrame, honourStep):
+        """
+        Filters candidate ranges (that overlap the query range) by step.
+        """
+        if not honourStep:
+            return ids
+        # The first frame stepped through at or after firstFrame.
+        offset = numpy.maximum(firstFrame - first, 0)
+        frame = first + -(-offset // step) * step
+        return ids[frame <= numpy.minimum(last, lastFrame)]
+
+    def __candidates(self, maxFirst, minLast):
+        """
+        Returns the rows of the live ranges with a first frame no later
+        than maxFirst, and a last frame no earlier than minLast, by
+        descending the tree of maximum last frames.
+        """
+        numRows = numpy.searchsorted(self.__first, maxFirst, side="right")
+        nodes = numpy.arange(len(self.__levels[-1]), dtype=numpy.int64)
+        for depth in range(len(self.__levels) - 1, -1, -1):
+            level = self.__levels[depth]
+            nodes = nodes[(level[nodes] >= minLast) & ((nodes << depth) < numRows)]
+            if depth:
+                nodes = numpy.concatenate((nodes * 2, nodes * 2 + 1))
+                nodes = nodes[nodes < len(self.__levels[depth - 1])]
+        return nodes[self.__alive[nodes]]
+
+    def __row(self, entityId):
+        """
+        Returns the row of a live, merged entity, or None.
+        """
+        position = numpy.searchsorted(self.__sortedIds, entityId)
+        if position == len(self.__sortedIds) or self.__sortedIds[position] != entityId:
+            return None
+        row = self.__idRows[position]
+        return row if self.__alive[row] else None
+
+    def __pendingColumns(self):
+        if self.__pendingArrays is None:
+            ids = numpy.fromiter(self.__pending, dtype=numpy.int64, count=len(self.__pending))
+            ranges = numpy.array(list(self.__pending.values()), dtype=numpy.int64).reshape(-1, 3)
+            self.__pendingArrays = (ids, ranges[:, 0], ranges[:, 1], ranges[:, 2])
+        return self.__pendingArrays
+
+    def __mergeIfNeeded(self):
+        threshold = max(kMinBufferSize, int(len(self.__ids) * kBufferFraction))
+        if len(self.__pending) + self.__numDead <= threshold:
+            return
+        ids, first, last, step = (
+            column[self.__alive] for column in (self.__ids, self.__first, self.__last, self.__step)
+        )
+        if self.__pending:
+            pendingIds, pendingFirst, pendingLast, pendingStep = self.__pendingColumns()
+            ids = numpy.concatenate((ids, pendingIds))
+            first = numpy.concatenate((first, pendingFirst))
+            last = numpy.concatenate((last, pendingLast))
+            step = numpy.concatenate((step, pendingStep))
+        self.__pending = {}
+        self.__pendingArrays = None
+        order = numpy.argsort(first, kind="stable")
+        self.__build(ids[order], first[order], last[order], step[order])
+
+    def __build(self, ids, first, last, step):
+        """
+        Replaces the merged ranges with the supplied columns, which must
+        be sorted by first frame.
+        """
+        self.__ids = ids
+        self.__first = first
+        self.__last = last
+        self.__step = step
+        self.__alive = numpy.ones(len(ids), dtype=bool)
+        self.__numDead = 0
+        self.__idRows = numpy.argsort(ids)
+        self.__sortedIds = ids[self.__idRows]
+        # levels[depth][node] is the maximum last frame of the rows
+        # [node << depth, (node + 1) << depth).
+        levels = [last]
+        while len(levels[-1]) > 1:
+            level = levels[-1]
+            if len(level) % 2:
+                level = numpy.append(level, numpy.iinfo(numpy.int64).min)
+            levels.append(numpy.maximum(level[0::2], level[1::2]))
+        self.__levels = levels
+
+
+def _checkRanges(first, last, step):
+    if (step < 1).any():
+        raise ValueError(f"Invalid frame range step '{step[step < 1][0]}': must be positive.")
+    if (last < first).any():
+        bad = numpy.flatnonzero(last < first)[0]
+        raise ValueError(f"Invalid frame range {first[bad]}-{last[bad]}: last frame before first.")
@@ -0,0 +1,398 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Expansion of templated locations.
+
+A `LocatableContentTrait` location with `isTemplated` set contains
+variables that must be substituted before the content can be loaded.
+Variables use the OpenAssetIO (Python format string) syntax, e.g.
+"file:///shot/image.{frame:04d}.{view}.exr", and the well-known
+`frame` and `view` variables are defined by MediaCreation.
+
+A `LocationTemplate` parses a location once, such that it can then be
+cheaply expanded for any number of frames and views. Expansion over a
+frame range is lazy, so arbitrarily long sequences can be iterated
+without building intermediate lists.
+
+Processes that repeatedly expand the same few locations should use
+`compileTemplate` or `substitute`, which keep parsed templates in a
+bounded, least-recently-used cache.
+"""
+
+import re
+from string import Formatter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from openassetio.trait import TraitsData
+
+from ._lruCache import LruCache
+from .traits.content import LocatableContentTrait_v1
+from .traits.timeDomain import FrameRangedTrait_v1
+
+__all__ = [
+    "LocationTemplate",
+    "LocationTemplateCache",
+    "compileTemplate",
+    "frameRange",
+    "iterLocations",
+    "substitute",
+]
+
+# The well-known variable names.
+kFrame = "frame"
+kView = "view"
+
+# Variables are defined post URL-decoding, so their braces may be
+# percent-encoded in the location.
+_kEncodedBracesRegex = re.compile(r"%7[bBdD]")
+# Format specs under which an integer frame formats as plain (optionally
+# zero-padded) digits, and so never needs URL encoding.
+_kPlainFrameSpecRegex = re.compile(r"^(0\d+)?d?$")
+# Characters that are not encoded in substituted values.
+_kSafeChars = "-._~"
+# Bound on the number of per-view formatters memoized by a template.
+_kMaxViewFormatters = 64
+
+
+class LocationTemplate:
+    """
+    A templated location, parsed once for repeated expansion.
+
+    @param location The templated location URL.
+
+    @exception ValueError If the location is not a valid template, or
+    uses positional, indexed or nested variables, which are not
+    supported.
+    """
+
+    __slots__ = ("__location", "__pieces", "__variables", "__viewFormatters")
+
+    def __init__(self, location: str):
+        self.__location = location
+        self.__pieces, self.__variables = self.__parse(location)
+        # Frame formatters for substitution with only a frame and view,
+        # keyed by view. There are typically very few views.
+        self.__viewFormatters = {}
+
+    @property
+    def location(self) -> str:
+        """
+        The location this template was parsed from.
+        """
+        return self.__location
+
+    @property
+    def variables(self) -> frozenset:
+        """
+        The names of all the variables used by the template.
+        """
+        return self.__variables
+
+    @property
+    def needsFrame(self) -> bool:
+        """
+        Whether the template uses the `frame` variable.
+        """
+        return kFrame in self.__variables
+
+    @property
+    def needsView(self) -> bool:
+        """
+        Whether the template uses the `view` variable.
+        """
+        return kView in self.__variables
+
+    def substitute(self, frame: Optional[int] = None, view: Optional[str] = None, **variables):
+        """
+        Returns the location with all variables substituted.
+
+        Substituted values are URL encoded.
+
+        @exception KeyError If a variable used by the template is not
+        supplied.
+        """
+        if frame is None and kFrame in self.__variables:
+            raise KeyError(f"No value supplied for location template variable '{kFrame}'")
+        if variables:
+            return self.__frameFormatter(view, variables)(frame)
+        try:
+            formatter = self.__viewFormatters[view]
+        except KeyError:
+            formatter = self.__frameFormatter(view, variables)
+            if len(self.__viewFormatters) >= _kMaxViewFormatters:
+                self.__viewFormatters.clear()
+            self.__viewFormatters[view] = formatter
+        return formatter(frame)
+
+    def iterFrames(
+        self, frames: Iterable[int], view: Optional[str] = None, **variables
+    ) -> Iterator[str]:
+        """
+        Lazily yields the location for each of the supplied frames.
+
+        @param frames The frames to expand, typically the `range`
+        returned by @ref frameRange.
+        @param view The value of the `view` variable, if used.
+        @param variables Values for any other variables used.
+        """
+        return map(self.__frameFormatter(view, variables), frames)
+
+    def expandFrames(
+        self, frames: Iterable[int], view: Optional[str] = None, **variables
+    ) -> List[str]:
+        """
+        Returns a list of the locations for each of the supplied frames.
+
+        @see iterFrames
+        """
+        return list(self.iterFrames(frames, view, **variables))
+
+    def iterViews(
+        self, frames: Iterable[int], views: Iterable[str], **variables
+    ) -> Iterator[Tuple[str, int, str]]:
+        """
+        Lazily yields a `(view, frame, location)` tuple for each of the
+        supplied frames of each of the supplied views, in view order.
+
+        The frames are iterated once per view, so must not be a
+        one-shot iterator if there is more than one view.
+        """
+        for view in views:
+            formatter = self.__frameFormatter(view, variables)
+            for frame in frames:
+                yield view, frame, formatter(frame)
+
+    def expandViews(
+        self, frames: Iterable[int], views: Iterable[str], **variables
+    ) -> Dict[str, List[str]]:
+        """
+        Returns a mapping of each of the supplied views to the list of
+        locations for each of the supplied frames.
+
+        @see iterViews
+        """
+        return {view: self.expandFrames(frames, view, **variables) for view in views}
+
+    def __repr__(self):
+        return f"LocationTemplate({self.__location!r})"
+
+    def __frameFormatter(self, view, variables):
+        """
+        Returns a function of frame to location, with all variables but
+        `frame` substituted up-front.
+        """
+        values = dict(variables)
+        values[kView] = view
+        # Reduce the template to alternating literal text and frame
+        # fields, merging adjacent literals.
+        literals = [""]
+        frameFields = []
+        for piece in self.__pieces:
+            if isinstance(piece, str):
+                literals[-1] += piece
+            elif piece[0] == kFrame:
+                frameFields.append(piece)
+                literals.append("")
+            else:
+                literals[-1] += _formatValue(values, *piece)
+
+        if not frameFields:
+            location = literals[0]
+            return lambda _frame: location
+
+        if len(frameFields) == 1 and frameFields[0][1] is None:
+            spec = frameFields[0][2]
+            if _kPlainFrameSpecRegex.match(spec):
+                # The common case, avoid all per-frame overhead other
+                # than formatting the number.
+                prefix, suffix = literals
+                return lambda frame: prefix + format(frame, spec) + suffix
+
+        def formatter(frame):
+            values[kFrame] = frame
+            parts = [literals[0]]
+            for field, literal in zip(frameFields, literals[1:]):
+                parts.append(_formatValue(values, *field))
+                parts.append(literal)
+            return "".join(parts)
+
+        return formatter
+
+    @staticmethod
+    def __parse(location):
+        """
+        Parses the location into a list of literal strings and
+        `(name, conversion, spec)` field tuples, along with the set of
+        variable names used.
+        """
+        template = _kEncodedBracesRegex.sub(
+            lambda match: "{" if match.group(0)[2] in "bB" else "}", location
+        )
+        pieces = []
+        variables = set()
+        try:
+            parsed = list(Formatter().parse(template))
+        except ValueError as exc:
+            raise ValueError(f"Invalid location template '{location}': {exc}") from exc
+
+        for literal, name, spec, conversion in parsed:
+            if literal:
+                pieces.append(literal)
+            if name is None:
+                continue
+            if not name.isidentifier():
+                raise ValueError(
+                    f"Unsupported variable '{{{name}}}' in location template '{location}':"
+                    " only named variables are supported."
+                )
+            if "{" in spec:
+                raise ValueError(
+                    f"Unsupported nested variable in the format spec of '{name}' in location"
+                    f" template '{location}'."
+                )
+            pieces.append((name, conversion, spec))
+            variables.add(name)
+        return tuple(pieces), frozenset(variables)
+
+
+def _formatValue(values, name, conversion, spec):
+    """
+    Formats a single variable value, URL encoding the result.
+    """
+    try:
+        value = values[name]
+    except KeyError:
+        raise KeyError(f"No value supplied for location template variable '{name}'") from None
+    if value is None:
+        raise KeyError(f"No value supplied for location template variable '{name}'")
+    if conversion == "r":
+        value = repr(value)
+    elif conversion == "s":
+        value = str(value)
+    elif conversion == "a":
+        value = ascii(value)
+    return quote(format(value, spec), safe=_kSafeChars)
+
+
+class LocationTemplateCache(LruCache):
+    """
+    A bounded, least-recently-used cache of parsed location templates,
+    keyed by location.
+
+    The cache is thread safe. Hit, miss and eviction counts are
+    maintained for monitoring, see @ref stats.
+
+    @param maxSize The maximum number of templates to hold.
+    """
+
+    def __init__(self, maxSize: int = 1024):
+        super().__init__(LocationTemplate, maxSize)
+
+    def get(self, location: str) -> LocationTemplate:
+        """
+        Returns the parsed template for the supplied location, parsing
+        and caching it if required.
+
+        @exception ValueError If the location is not a valid template.
+        """
+        return super().get(location)
+
+
+# The cache used by the module-level functions.
+kDefaultCache = LocationTemplateCache()
+
+
+def compileTemplate(location: str) -> LocationTemplate:
+    """
+    Returns the parsed template for the supplied location, from
+    @ref kDefaultCache.
+
+    The template's `needsFrame` and `needsView` properties can be used
+    to skip expansion entirely for locations that don't vary.
+    """
+    return kDefaultCache.get(location)
+
+
+def substitute(
+    location: str, frame: Optional[int] = None, view: Optional[str] = None, **variables
+) -> str:
+    """
+    Returns the supplied templated location with all variables
+    substituted, using the cached parsed template.
+
+    @see LocationTemplate.substitute
+    """
+    return kDefaultCache.get(location).substitute(frame, view, **variables)
+
+
+def frameRange(traitsData: TraitsData) -> range:
+    """
+    Returns the frames covered by the `FrameRangedTrait` of the
+    supplied data.
+
+    The range runs from `inFrame` to `outFrame` (inclusive), falling
+    back to `startFrame` and `endFrame` respectively if not set. If
+    `step` is set, then only every step'th frame from `startFrame` is
+    included.
+
+    @exception ValueError If neither the first nor last frame can be
+    determined.
+    """
+    trait = FrameRangedTrait_v1(traitsData)
+    startFrame = trait.getStartFrame()
+    inFrame = trait.getInFrame(startFrame)
+    outFrame = trait.getOutFrame(trait.getEndFrame())
+    if inFrame is None or outFrame is None:
+        raise ValueError(
+            "Cannot determine frame range: FrameRanged trait requires either"
+            " startFrame/endFrame or inFrame/outFrame."
+        )
+    step = trait.getStep(1)
+    if step < 1:
+        raise ValueError(f"Invalid FrameRanged step '{step}': must be positive.")
+
+    if startFrame is not None and step > 1:
+        # Align the first frame to the step, relative to startFrame.
+        inFrame += (startFrame - inFrame) % step
+    return range(inFrame, outFrame + 1, step)
+
+
+def iterLocations(
+    traitsData: TraitsData, views: Optional[Iterable[str]] = None
+) -> Iterator[Tuple[Optional[str], Optional[int], str]]:
+    """
+    Lazily yields a `(view, frame, location)` tuple for each location
+    described by the `LocatableContentTrait` of the supplied data.
+
+    If the location is not templated, it is yielded once, as-is, with
+    no view or frame. Otherwise it is expanded over the frames of the
+    data's `FrameRangedTrait`, if the template uses the `frame`
+    variable, and over the supplied views, if it uses the `view`
+    variable. The frame or view of a tuple is `None` if not used.
+
+    @exception ValueError If the data has no location, or the template
+    uses variables that cannot be provided.
+    """
+    trait = LocatableContentTrait_v1(traitsData)
+    location = trait.getLocation()
+    if location is None:
+        raise ValueError("Cannot expand locations: LocatableContent trait has no location.")
+    if not trait.getIsTemplated(False):
+        yield None, None, location
+        return
+
+    template = compileTemplate(location)
+    unsupported = template.variables - {kFrame, kView}
+    if unsupported:
+        raise ValueError(
+            f"Cannot expand location '{location}': unsupported variables"
+            f" {', '.join(sorted(unsupported))}."
+        )
+    frames = frameRange(traitsData) if template.needsFrame else (None,)
+    if template.needsView:
+        if views is None:
+            raise ValueError(f"Cannot expand location '{location}': no views supplied.")
+    else:
+        views = (None,)
+    yield from template.iterViews(frames, views)
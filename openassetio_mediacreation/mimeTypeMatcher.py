@@ -0,0 +1,244 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Matching of MIME types against `LocatableContentTrait` mimeType
+filters.
+
+A `LocatableContentTrait` mimeType may be a single MIME type, a
+wildcard (e.g. "image/*"), or a comma-separated list of either (e.g.
+"image/jpeg,image/png"), and may also be used as a filter predicate.
+
+A `MimeTypeMatcher` compiles such a value once, hashing its exact types
+and bucketing its wildcards by major type, such that any number of MIME
+types can then be tested against it without re-parsing. Batch methods
+test a whole list of MIME types, or of `TraitsData`, in one call, only
+testing each distinct MIME type once.
+
+Processes that repeatedly match against the same few predicates should
+use `compileMatcher` or `matches`, which keep compiled matchers in a
+bounded, least-recently-used cache.
+
+MIME types are compared case-insensitively, and any parameters (e.g.
+"; charset=utf-8") are ignored.
+"""
+
+from typing import FrozenSet, Iterable, List, Optional, Sequence
+
+from openassetio.trait import TraitsData
+
+from ._lruCache import LruCache
+from .traits.content import LocatableContentTrait_v1
+
+__all__ = [
+    "MimeTypeMatcher",
+    "MimeTypeMatcherCache",
+    "compileMatcher",
+    "matches",
+]
+
+# The wildcard used in place of a major type or subtype.
+kWildcard = "*"
+
+
+def _parse(value):
+    """
+    Returns the normalized `(major, subtype)` pairs of the MIME types in
+    the supplied (possibly comma-separated) value.
+
+    @exception ValueError If an entry is not of the form
+    "major/subtype".
+    """
+    pairs = []
+    for entry in value.split(","):
+        entry = entry.split(";", 1)[0].strip().lower()
+        if not entry:
+            continue
+        if entry == kWildcard:
+            pairs.append((kWildcard, kWildcard))
+            continue
+        major, sep, subtype = entry.partition("/")
+        major = major.strip()
+        subtype = subtype.strip()
+        if not sep or not major or not subtype or "/" in subtype:
+            raise ValueError(f"Invalid MIME type '{entry}' in '{value}'")
+        if major == kWildcard and subtype != kWildcard:
+            raise ValueError(f"Invalid MIME type '{entry}' in '{value}': wildcard major type")
+        pairs.append((major, subtype))
+    return pairs
+
+
+class MimeTypeMatcher:
+    """
+    A mimeType filter predicate, compiled once for repeated matching.
+
+    A MIME type matches if any of its (comma-separated) entries is one
+    of the predicate's exact types, or has the major type of one of
+    its wildcards. Wildcard MIME types being matched (e.g. "image/*")
+    match any predicate entry with the same major type.
+
+    @param predicate The mimeType filter, e.g. "image/*,video/mp4".
+
+    @exception ValueError If the predicate is empty, or not a valid
+    list of MIME types.
+    """
+
+    __slots__ = ("__predicate", "__exact", "__wildcardMajors", "__majors", "__matchesAll")
+
+    def __init__(self, predicate: str):
+        pairs = _parse(predicate)
+        if not pairs:
+            raise ValueError(f"Invalid MIME type predicate '{predicate}': no MIME types")
+        self.__predicate = predicate
+        self.__matchesAll = (kWildcard, kWildcard) in pairs
+        self.__exact = frozenset(
+            f"{major}/{subtype}" for major, subtype in pairs if subtype != kWildcard
+        )
+        self.__wildcardMajors = frozenset(
+            major for major, subtype in pairs if subtype == kWildcard and major != kWildcard
+        )
+        # All major types, for matching wildcard MIME types.
+        self.__majors = frozenset(major for major, _ in pairs)
+
+    @property
+    def predicate(self) -> str:
+        """
+        The predicate this matcher was compiled from.
+        """
+        return self.__predicate
+
+    @property
+    def exactTypes(self) -> FrozenSet[str]:
+        """
+        The normalized exact MIME types of the predicate.
+        """
+        return self.__exact
+
+    @property
+    def wildcardMajors(self) -> FrozenSet[str]:
+        """
+        The major types of the predicate's "major/*" wildcards.
+        """
+        return self.__wildcardMajors
+
+    @property
+    def matchesAll(self) -> bool:
+        """
+        Whether the predicate includes "*/*", so matches any MIME type.
+        """
+        return self.__matchesAll
+
+    def matches(self, mimeType: Optional[str]) -> bool:
+        """
+        Determines whether the supplied MIME type (or comma-separated
+        list of MIME types) matches the predicate.
+
+        `None`, or an empty string, never matches.
+
+        @exception ValueError If the MIME type is invalid.
+        """
+        if not mimeType:
+            return False
+        # Fast path for the common case of a single, normalized type,
+        # which is known to be valid.
+        if mimeType in self.__exact:
+            return True
+        pairs = _parse(mimeType)
+        if self.__matchesAll:
+            return bool(pairs)
+        for major, subtype in pairs:
+            if subtype == kWildcard:
+                if major == kWildcard or major in self.__majors:
+                    return True
+            elif major in self.__wildcardMajors or f"{major}/{subtype}" in self.__exact:
+                return True
+        return False
+
+    def batchMatches(self, mimeTypes: Iterable[Optional[str]]) -> List[bool]:
+        """
+        Returns a list flagging which of the supplied MIME types match
+        the predicate.
+
+        Each distinct MIME type is only tested once.
+
+        Unlike @ref matches, invalid MIME types do not raise, but never
+        match, such that one malformed stored value does not prevent
+        filtering the rest.
+
+        @see matches
+        """
+        results = {}
+        mask = []
+        for mimeType in mimeTypes:
+            try:
+                mask.append(results[mimeType])
+            except KeyError:
+                try:
+                    result = self.matches(mimeType)
+                except ValueError:
+                    result = False
+                results[mimeType] = result
+                mask.append(result)
+        return mask
+
+    def batchMatchesTraitsData(self, traitsDatas: Sequence[TraitsData]) -> List[bool]:
+        """
+        Returns a list flagging which of the supplied data have a
+        `LocatableContentTrait` mimeType that matches the predicate.
+
+        Data without a mimeType, or with an invalid mimeType, never
+        match.
+
+        @exception TypeError If any mimeType is not a string.
+        @see batchMatches
+        """
+        mimeTypes, _ = LocatableContentTrait_v1.batchGetMimeType(traitsDatas)
+        return self.batchMatches(mimeTypes)
+
+    def __repr__(self):
+        return f"MimeTypeMatcher({self.__predicate!r})"
+
+
+class MimeTypeMatcherCache(LruCache):
+    """
+    A bounded, least-recently-used cache of compiled MIME type
+    matchers, keyed by predicate.
+
+    The cache is thread safe. Hit, miss and eviction counts are
+    maintained for monitoring, see @ref stats.
+
+    @param maxSize The maximum number of matchers to hold.
+    """
+
+    def __init__(self, maxSize: int = 256):
+        super().__init__(MimeTypeMatcher, maxSize)
+
+    def get(self, predicate: str) -> MimeTypeMatcher:
+        """
+        Returns the compiled matcher for the supplied predicate,
+        compiling and caching it if required.
+
+        @exception ValueError If the predicate is invalid.
+        """
+        return super().get(predicate)
+
+
+# The cache used by the module-level functions.
+kDefaultCache = MimeTypeMatcherCache()
+
+
+def compileMatcher(predicate: str) -> MimeTypeMatcher:
+    """
+    Returns the compiled matcher for the supplied predicate, from
+    @ref kDefaultCache.
+    """
+    return kDefaultCache.get(predicate)
+
+
+def matches(predicate: str, mimeType: Optional[str]) -> bool:
+    """
+    Determines whether the supplied MIME type matches the supplied
+    predicate, using the cached compiled matcher.
+
+    @see MimeTypeMatcher.matches
+    """
+    return kDefaultCache.get(predicate).matches(mimeType)
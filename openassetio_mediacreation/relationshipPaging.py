@@ -0,0 +1,358 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Streaming of the results of paged relationship queries.
+
+Relationships imbued with `UnboundedTrait`, such as those of the
+`EntityVersionsRelationshipSpecification_v1` and
+`StableEntityVersionsRelationshipSpecification_v1`, may relate thousands
+of entities, and so must be queried with the paged
+@fqref{hostApi.Manager.getWithRelationship}
+"Manager.getWithRelationship" API. `iterPages` and `iterReferences`
+wrap the resulting @fqref{hostApi.EntityReferencePager}
+"EntityReferencePager" in a generator, such that callers can consume
+related references as they arrive, e.g.
+
+    for ref in iterReferences(
+        manager, entityRef, EntityVersionsRelationshipSpecification_v1.create(), context, limit=10
+    ):
+        ...
+
+The first page is returned as soon as it is retrieved. Subsequent
+pages are prefetched by a background thread, a bounded number of pages
+ahead of the caller, so the caller rarely waits on the manager, yet a
+full history never needs to be held in memory at once.
+
+The page size of a query is chosen by a `PageSizer`, which adapts it to
+the latency measured for the pages of previous queries, aiming for each
+page to take a target time to retrieve. A pager's page size is fixed
+for the lifetime of the query, so adaption takes effect from the next
+query. If a `limit` is given, pages are no larger than the limit, such
+that e.g. "first 10 versions" is a single small request.
+
+Managers are required to be thread safe, so the pager may be advanced
+from the prefetch thread.
+"""
+
+import queue
+import threading
+import time
+from typing import Iterator, List, Optional, Set
+
+from openassetio import Context, EntityReference
+from openassetio.access import RelationsAccess
+from openassetio.trait import TraitsData
+
+__all__ = ["PageSizer", "iterPages", "iterReferences"]
+
+# The default number of pages to prefetch ahead of the caller.
+kDefaultPrefetch = 2
+# How often, in seconds, the prefetch thread checks whether the caller
+# has stopped consuming pages, whilst waiting to queue a page.
+kStopPollInterval = 0.05
+
+
+class PageSizer:
+    """
+    Chooses the page size of paged relationship queries, adapting it to
+    the latency of previously retrieved pages.
+
+    Following each full page, the page size moves toward the size that
+    would have taken `targetLatency` to retrieve, assuming latency
+    grows linearly with page size. Since managers typically incur a
+    fixed cost per page, this converges on larger pages for fast
+    managers, and smaller pages for slow ones. Each adjustment is
+    damped, and limited to a factor of four.
+
+    The sizer is thread safe, so may be shared between queries.
+
+    @param targetLatency The target time, in seconds, to retrieve a
+    page.
+
+    @param initialPageSize The page size to use before any latency has
+    been measured.
+
+    @param minPageSize The smallest page size to use.
+
+    @param maxPageSize The largest page size to use.
+    """
+
+    def __init__(
+        self,
+        targetLatency: float = 0.1,
+        initialPageSize: int = 100,
+        minPageSize: int = 10,
+        maxPageSize: int = 10000,
+    ):
+        if targetLatency <= 0:
+            raise ValueError(f"Invalid targetLatency '{targetLatency}': must be positive.")
+        if not 1 <= minPageSize <= initialPageSize <= maxPageSize:
+            raise ValueError(
+                f"Invalid page sizes '{minPageSize}', '{initialPageSize}', '{maxPageSize}': "
+                "must be positive, and minPageSize <= initialPageSize <= maxPageSize."
+            )
+        self.__targetLatency = targetLatency
+        self.__initialPageSize = initialPageSize
+        self.__minPageSize = minPageSize
+        self.__maxPageSize = maxPageSize
+        self.__pageSize = float(initialPageSize)
+        self.__lock = threading.Lock()
+
+    @property
+    def targetLatency(self) -> float:
+        """
+        The target time, in seconds, to retrieve a page.
+        """
+        return self.__targetLatency
+
+    @property
+    def pageSize(self) -> int:
+        """
+        The page size to use for the next query.
+        """
+        with self.__lock:
+            return round(self.__pageSize)
+
+    def record(self, pageSize: int, numReferences: int, seconds: float):
+        """
+        Records the time taken to retrieve a page, adapting the page
+        size accordingly.
+
+        Partial pages (e.g. the last page of a query) are only recorded
+        if they were slower than the target, since their latency says
+        little about that of a full page.
+
+        @param pageSize The page size of the query.
+
+        @param numReferences The number of references in the page.
+
+        @param seconds The time taken to retrieve the page.
+        """
+        if numReferences < pageSize and seconds <= self.__targetLatency:
+            return
+        ideal = pageSize * self.__targetLatency / max(seconds, 1e-6)
+        with self.__lock:
+            ideal = min(max(ideal, self.__pageSize / 4), self.__pageSize * 4)
+            # Geometric mean, to damp noisy measurements.
+            pageSize = (self.__pageSize * ideal) ** 0.5
+            self.__pageSize = min(max(pageSize, self.__minPageSize), self.__maxPageSize)
+
+    def reset(self):
+        """
+        Forgets all measurements, reverting to the initial page size.
+        """
+        with self.__lock:
+            self.__pageSize = float(self.__initialPageSize)
+
+
+# The sizer used if none is supplied.
+kDefaultPageSizer = PageSizer()
+
+
+def iterPages(
+    manager,
+    entityReference: EntityReference,
+    relationship,
+    context: Context,
+    resultTraitSet: Optional[Set[str]] = None,
+    relationsAccess: RelationsAccess = RelationsAccess.kRead,
+    limit: Optional[int] = None,
+    prefetch: int = kDefaultPrefetch,
+    pageSizer: Optional[PageSizer] = None,
+) -> Iterator[List[EntityReference]]:
+    """
+    Yields the pages of references related to the supplied reference.
+
+    The query is made when the first page is requested. Closing the
+    generator (or letting it go out of scope) stops any prefetching.
+
+    @param manager The manager to query.
+
+    @param entityReference The reference to query relationships of.
+
+    @param relationship The relationship to query, either as a
+    specification view (e.g.
+    `EntityVersionsRelationshipSpecification_v1.create()`), or as
+    @fqref{TraitsData} "TraitsData".
+
+    @param context The calling context.
+
+    @param resultTraitSet A hint as to the traits the related entities
+    should have.
+
+    @param relationsAccess The intended usage of the related
+    references.
+
+    @param limit The maximum number of references to yield, or `None`
+    for all of them.
+
+    @param prefetch The maximum number of pages to retrieve ahead of
+    the caller, in the background. If zero, pages are retrieved on
+    demand.
+
+    @param pageSizer The sizer to choose, and measure, the page size
+    with, or `None` for @ref kDefaultPageSizer.
+
+    @exception ValueError If `limit` is not positive, or `prefetch` is
+    negative.
+
+    @exception openassetio.errors.BatchElementException If the manager
+    fails to query the relationship.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"Invalid limit '{limit}': must be positive.")
+    if prefetch < 0:
+        raise ValueError(f"Invalid prefetch '{prefetch}': must not be negative.")
+    if not isinstance(relationship, TraitsData):
+        relationship = relationship.traitsData()
+    pageSizer = pageSizer or kDefaultPageSizer
+    pageSize = pageSizer.pageSize
+    if limit is not None:
+        pageSize = min(pageSize, limit)
+    remaining = limit
+
+    start = time.perf_counter()
+    pager = manager.getWithRelationship(
+        entityReference,
+        relationship,
+        pageSize,
+        relationsAccess,
+        context,
+        set(resultTraitSet or ()),
+    )
+    page = pager.get()
+    pageSizer.record(pageSize, len(page), time.perf_counter() - start)
+
+    if not page:
+        return
+    if remaining is not None and len(page) >= remaining:
+        yield page[:remaining]
+        return
+    if prefetch:
+        pages = _Prefetcher(pager, pageSize, pageSizer, prefetch)
+    else:
+        pages = _fetch(pager, pageSize, pageSizer)
+
+    try:
+        while page:
+            if remaining is not None:
+                if len(page) >= remaining:
+                    yield page[:remaining]
+                    return
+                remaining -= len(page)
+            yield page
+            page = next(pages, None)
+    finally:
+        pages.close()
+
+
+def iterReferences(
+    manager,
+    entityReference: EntityReference,
+    relationship,
+    context: Context,
+    resultTraitSet: Optional[Set[str]] = None,
+    relationsAccess: RelationsAccess = RelationsAccess.kRead,
+    limit: Optional[int] = None,
+    prefetch: int = kDefaultPrefetch,
+    pageSizer: Optional[PageSizer] = None,
+) -> Iterator[EntityReference]:
+    """
+    Yields the references related to the supplied reference, one at a
+    time.
+
+    @see iterPages
+    """
+    pages = iterPages(
+        manager,
+        entityReference,
+        relationship,
+        context,
+        resultTraitSet,
+        relationsAccess,
+        limit,
+        prefetch,
+        pageSizer,
+    )
+    try:
+        for page in pages:
+            yield from page
+    finally:
+        pages.close()
+
+
+def _fetch(pager, pageSize, pageSizer):
+    """
+    Yields the pages following the current page of the pager, on
+    demand.
+    """
+    while pager.hasNext():
+        start = time.perf_counter()
+        pager.next()
+        page = pager.get()
+        pageSizer.record(pageSize, len(page), time.perf_counter() - start)
+        if not page:
+            return
+        yield page
+
+
+class _Prefetcher:
+    """
+    An iterator over the pages following the current page of a pager,
+    retrieved ahead of time by a background thread.
+    """
+
+    def __init__(self, pager, pageSize, pageSizer, prefetch):
+        self.__pages = queue.Queue(maxsize=prefetch)
+        self.__stop = threading.Event()
+        self.__done = False
+        threading.Thread(
+            target=self.__run,
+            args=(pager, pageSize, pageSizer),
+            name="iterPages prefetch",
+            daemon=True,
+        ).start()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.__done:
+            raise StopIteration
+        page = self.__pages.get()
+        if page is None or isinstance(page, Exception):
+            self.__done = True
+            if page is None:
+                raise StopIteration
+            raise page
+        return page
+
+    def close(self):
+        """
+        Stops prefetching.
+        """
+        self.__done = True
+        self.__stop.set()
+
+    def __run(self, pager, pageSize, pageSizer):
+        try:
+            for page in _fetch(pager, pageSize, pageSizer):
+                if not self.__put(page):
+                    return
+            self.__put(None)
+        except Exception as exc:  # pylint: disable=broad-except
+            self.__put(exc)
+
+    def __put(self, item):
+        """
+        Queues an item, unless the consumer has stopped.
+
+        @return Whether the item was queued.
+        """
+        while not self.__stop.is_set():
+            try:
+                self.__pages.put(item, timeout=kStopPollInterval)
+                return True
+            except queue.Full:
+                pass
+        return False
@@ -0,0 +1,446 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Caching of entity resolution, aware of the stability of entity
+versions.
+
+Hosts often resolve the same references many times in a session. A
+`ResolveCache` wraps a @fqref{hostApi.Manager} "Manager", and keeps the
+results of `resolve`, keyed by entity reference, trait set and access,
+such that repeated resolves are answered without calling the manager.
+
+A result is only safe to keep indefinitely if the data of the entity
+it describes can't change. A result is considered stable if it is
+imbued with a `VersionTrait` whose `stableTag` equals its
+`specifiedTag`, i.e. the reference is pinned to a specific version, or
+if its reference has been marked as stable via
+@ref ResolveCache.markStable, e.g. because it was returned from a
+`StableEntityVersionsRelationship` or `StableReferenceRelationship`
+query. Stable results are kept until evicted. All other (dynamic)
+results, such as those for "latest" or approval-based meta-versions,
+expire after a time-to-live, and can be invalidated explicitly.
+
+So that stability can be determined, the `VersionTrait` is added to
+the trait set requested from the manager, so results may additionally
+be imbued with it.
+
+The cache is bounded by an approximate memory budget, evicting the
+least recently used results first. The size of a result is
+approximated from the lengths of its trait IDs, property keys and
+string values.
+
+Results are keyed without regard to the @fqref{Context} "Context", so
+a cache should not be shared between contexts that may resolve
+differently (e.g. with different locales).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from openassetio import Context, EntityReference, errors
+from openassetio.access import ResolveAccess
+from openassetio.trait import TraitsData
+
+from .traits.lifecycle import VersionTrait_v1
+
+__all__ = ["ResolveCache"]
+
+# The approximate memory, in bytes, used by each cached result in
+# addition to its traits and properties.
+kEntryOverhead = 256
+# The approximate memory, in bytes, used by each trait and property.
+kItemOverhead = 32
+
+
+def _estimateSize(traitsData):
+    """
+    Returns the approximate memory, in bytes, used by the supplied
+    TraitsData.
+    """
+    size = kEntryOverhead
+    for traitId in traitsData.traitSet():
+        size += kItemOverhead + len(traitId)
+        for key in traitsData.traitPropertyKeys(traitId):
+            value = traitsData.getTraitProperty(traitId, key)
+            size += kItemOverhead + len(key) + (len(value) if isinstance(value, str) else 8)
+    return size
+
+
+def _isStable(traitsData):
+    """
+    Determines whether the supplied resolve result is for a specific,
+    stable, version of an entity.
+    """
+    if not VersionTrait_v1.isImbuedTo(traitsData):
+        return False
+    version = VersionTrait_v1(traitsData)
+    stableTag = version.getStableTag()
+    return stableTag is not None and version.getSpecifiedTag() == stableTag
+
+
+class ResolveCache:
+    """
+    A cache of the results of resolving entity references via a
+    manager.
+
+    The cache is thread safe. Hit, miss, eviction and expiry counts are
+    maintained for monitoring, see @ref stats.
+
+    @param manager The manager to resolve cache misses with.
+
+    @param maxBytes The approximate maximum memory to use for cached
+    results.
+
+    @param dynamicTtl The time, in seconds, after which dynamic results
+    expire. If `None`, dynamic results only expire when invalidated. If
+    zero, dynamic results are not cached.
+
+    @param clock The function providing the current time, in seconds,
+    for expiry.
+    """
+
+    def __init__(
+        self,
+        manager,
+        maxBytes: int = 64 * 1024 * 1024,
+        dynamicTtl: Optional[float] = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxBytes < 1:
+            raise ValueError(f"Invalid maxBytes '{maxBytes}': must be positive.")
+        if dynamicTtl is not None and dynamicTtl < 0:
+            raise ValueError(f"Invalid dynamicTtl '{dynamicTtl}': must not be negative.")
+        self.__manager = manager
+        self.__maxBytes = maxBytes
+        self.__dynamicTtl = dynamicTtl
+        self.__clock = clock
+        # Maps (reference, request) to
+        # (traitsData, size, isStable, expiry), where request is a small
+        # integer identifying the trait set and access, which is much
+        # cheaper to hash.
+        self.__entries = OrderedDict()
+        # Maps (trait set, access) to its request integer, and back,
+        # and each request integer to the number of its entries, such
+        # that requests are dropped along with their last entry.
+        self.__requests = {}
+        self.__requestKeys = {}
+        self.__requestCounts = {}
+        self.__nextRequest = 0
+        # Maps reference to the keys of its entries, for invalidation.
+        self.__keysByReference = {}
+        self.__stableReferences = set()
+        self.__lock = threading.Lock()
+        self.__bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
+
+    @property
+    def manager(self):
+        """
+        The manager used to resolve cache misses.
+        """
+        return self.__manager
+
+    @property
+    def maxBytes(self) -> int:
+        """
+        The approximate maximum memory used for cached results.
+        """
+        return self.__maxBytes
+
+    @property
+    def dynamicTtl(self) -> Optional[float]:
+        """
+        The time, in seconds, after which dynamic results expire.
+        """
+        return self.__dynamicTtl
+
+    @property
+    def hitRate(self) -> float:
+        """
+        The fraction of lookups answered from the cache, or zero if
+        there have been no lookups.
+        """
+        with self.__lock:
+            lookups = self.__hits + self.__misses
+            return self.__hits / lookups if lookups else 0.0
+
+    def resolve(
+        self,
+        entityReference: EntityReference,
+        traitSet: Set[str],
+        resolveAccess: ResolveAccess,
+        context: Context,
+    ) -> TraitsData:
+        """
+        Returns the resolved data for the supplied reference, from the
+        cache if possible.
+
+        @exception openassetio.errors.BatchElementException If the
+        manager fails to resolve the reference.
+        @see batchResolve
+        """
+        return self.batchResolve([entityReference], traitSet, resolveAccess, context)[0]
+
+    def batchResolve(
+        self,
+        entityReferences: List[EntityReference],
+        traitSet: Set[str],
+        resolveAccess: ResolveAccess,
+        context: Context,
+    ) -> List[TraitsData]:
+        """
+        Returns the resolved data for each of the supplied references,
+        from the cache if possible.
+
+        Any references not in the cache (or whose results have expired)
+        are resolved by the manager in a single batch, and their
+        results cached. Each returned TraitsData is a copy, so may be
+        freely modified.
+
+        @exception openassetio.errors.BatchElementException If the
+        manager fails to resolve any of the references, for the first
+        such reference. The results of the references that were
+        resolved are still cached.
+        """
+        requestKey = (frozenset(traitSet), resolveAccess)
+        results = [None] * len(entityReferences)
+        # Maps each missing reference to its indices, such that
+        # duplicates are only resolved once.
+        missing = {}
+
+        now = self.__clock()
+        with self.__lock:
+            # If there is no request integer, nothing is cached for the
+            # request.
+            request = self.__requests.get(requestKey)
+            for index, entityReference in enumerate(entityReferences):
+                reference = entityReference.toString()
+                key = (reference, request)
+                entry = None if request is None else self.__entries.get(key)
+                if entry is not None:
+                    expiry = entry[3]
+                    if expiry is None or expiry > now:
+                        self.__entries.move_to_end(key)
+                        self.__hits += 1
+                        results[index] = entry[0]
+                        continue
+                    self.__remove(key)
+                    self.__expirations += 1
+                    # The request may have been dropped with its last
+                    # entry.
+                    request = self.__requests.get(requestKey)
+                self.__misses += 1
+                missing.setdefault(reference, []).append(index)
+
+        firstError = None
+        if missing:
+            firstError = self.__resolveMissing(
+                entityReferences, missing, requestKey, context, results
+            )
+
+        if firstError is not None:
+            index, error = firstError
+            raise errors.BatchElementException(index, error, error.message)
+        return [TraitsData(traitsData) for traitsData in results]
+
+    def markStable(self, entityReferences: Iterable[EntityReference]):
+        """
+        Marks the supplied references as stable, such that their
+        results are kept until evicted.
+
+        This should be used for references that are known to target a
+        specific version of an entity, e.g. those returned from a
+        `StableEntityVersionsRelationship` or
+        `StableReferenceRelationship` query. Any results already cached
+        for the references no longer expire.
+
+        Markings are retained until @ref clear.
+        """
+        with self.__lock:
+            for entityReference in entityReferences:
+                reference = entityReference.toString()
+                self.__stableReferences.add(reference)
+                for key in self.__keysByReference.get(reference, ()):
+                    traitsData, size, _, _ = self.__entries[key]
+                    self.__entries[key] = (traitsData, size, True, None)
+
+    def invalidate(self, entityReferences: Iterable[EntityReference]) -> int:
+        """
+        Removes all cached results for the supplied references, stable
+        or not, for any trait set and access.
+
+        @return The number of results removed.
+        """
+        removed = 0
+        with self.__lock:
+            for entityReference in entityReferences:
+                for key in list(self.__keysByReference.get(entityReference.toString(), ())):
+                    self.__remove(key)
+                    removed += 1
+        return removed
+
+    def invalidateDynamic(self) -> int:
+        """
+        Removes all cached dynamic results, e.g. following a publish
+        that may have changed what meta-versions resolve to.
+
+        @return The number of results removed.
+        """
+        with self.__lock:
+            keys = [key for key, entry in self.__entries.items() if not entry[2]]
+            for key in keys:
+                self.__remove(key)
+        return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns a snapshot of the cache's counters, with the keys
+        "hits", "misses", "evictions", "expirations", "size",
+        "stableSize", "bytes" and "maxBytes".
+
+        @see hitRate
+        """
+        with self.__lock:
+            return {
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "evictions": self.__evictions,
+                "expirations": self.__expirations,
+                "size": len(self.__entries),
+                "stableSize": sum(1 for entry in self.__entries.values() if entry[2]),
+                "bytes": self.__bytes,
+                "maxBytes": self.__maxBytes,
+            }
+
+    def clear(self):
+        """
+        Removes all results and stable markings, and resets the
+        counters.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__requests.clear()
+            self.__requestKeys.clear()
+            self.__requestCounts.clear()
+            self.__keysByReference.clear()
+            self.__stableReferences.clear()
+            self.__bytes = 0
+            self.__hits = self.__misses = self.__evictions = self.__expirations = 0
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __resolveMissing(self, entityReferences, missing, requestKey, context, results):
+        """
+        Resolves the missing results via the manager, caching and
+        filling in those that succeed.
+
+        @return The `(index, error)` of the first reference that failed
+        to resolve, or `None`.
+        """
+        traitSet, resolveAccess = requestKey
+        references = list(missing)
+        resolved = [None] * len(references)
+        failed = {}
+
+        def onSuccess(index, traitsData):
+            resolved[index] = traitsData
+
+        def onError(index, error):
+            failed[index] = error
+
+        requestedTraitSet = set(traitSet)
+        requestedTraitSet.add(VersionTrait_v1.kId)
+        self.__manager.resolve(
+            [entityReferences[missing[reference][0]] for reference in references],
+            requestedTraitSet,
+            resolveAccess,
+            context,
+            onSuccess,
+            onError,
+        )
+
+        # Size and classify outside the lock.
+        toStore = []
+        for reference, traitsData in zip(references, resolved):
+            if traitsData is None:
+                continue
+            for index in missing[reference]:
+                results[index] = traitsData
+            toStore.append(
+                (
+                    reference,
+                    traitsData,
+                    _estimateSize(traitsData),
+                    _isStable(traitsData),
+                )
+            )
+
+        now = self.__clock()
+        with self.__lock:
+            for reference, traitsData, size, isStable in toStore:
+                self.__store(reference, requestKey, traitsData, size, isStable, now)
+
+        if not failed:
+            return None
+        first = min(failed)
+        return missing[references[first]][0], failed[first]
+
+    def __store(self, reference, requestKey, traitsData, size, isStable, now):
+        """
+        Caches a result, evicting the least recently used results as
+        required. Must be called with the lock held.
+        """
+        isStable = isStable or reference in self.__stableReferences
+        if isStable:
+            expiry = None
+        elif self.__dynamicTtl == 0:
+            return
+        elif self.__dynamicTtl is None:
+            expiry = None
+        else:
+            expiry = now + self.__dynamicTtl
+        if size > self.__maxBytes:
+            return
+
+        # Replace any existing entry first, as removing a request's last
+        # entry drops the request.
+        request = self.__requests.get(requestKey)
+        if request is not None and (reference, request) in self.__entries:
+            self.__remove((reference, request))
+            request = self.__requests.get(requestKey)
+        if request is None:
+            request = self.__requests[requestKey] = self.__nextRequest
+            self.__requestKeys[request] = requestKey
+            self.__requestCounts[request] = 0
+            self.__nextRequest += 1
+
+        key = (reference, request)
+        self.__entries[key] = (traitsData, size, isStable, expiry)
+        self.__requestCounts[request] += 1
+        self.__keysByReference.setdefault(reference, set()).add(key)
+        self.__bytes += size
+        while self.__bytes > self.__maxBytes:
+            self.__remove(next(iter(self.__entries)))
+            self.__evictions += 1
+
+    def __remove(self, key):
+        """
+        Removes a cached result. Must be called with the lock held.
+        """
+        _, size, _, _ = self.__entries.pop(key)
+        self.__bytes -= size
+        request = key[1]
+        self.__requestCounts[request] -= 1
+        if not self.__requestCounts[request]:
+            del self.__requestCounts[request]
+            del self.__requests[self.__requestKeys.pop(request)]
+        keys = self.__keysByReference[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self.__keysByReference[key[0]]
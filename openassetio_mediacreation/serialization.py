@@ -0,0 +1,435 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compact binary serialization of @fqref{TraitsData} "TraitsData".
+
+Trait IDs and property keys of the traits defined in this package are
+encoded as small integers, taken from tables derived from the
+generated `registry`, and property values are stored in their native
+binary form. This makes for a much smaller and faster encoding than
+(e.g.) JSON, where every full trait ID and property key is repeated
+for every TraitsData.
+
+Furthermore, a batch of TraitsData typically holds many with the same
+traits, properties and value types (e.g. data resolved for the same
+specification). Each distinct such "shape" is encoded once, and each
+TraitsData is then encoded as a fixed-size record of values for its
+shape, followed by the bytes of any string values.
+
+Traits and properties not defined in this package are still supported,
+but are encoded by their full ID/key. As the tables are specific to a
+version of this package, encoded buffers hold a hash of the tables, and
+decoding a buffer encoded with different tables is an error.
+
+Many TraitsData can be encoded into, and decoded from, a single
+buffer. For example, to transfer resolved data between processes:
+
+    buffer = serialization.encode(traitsDatas)
+    ...
+    traitsDatas = serialization.decode(buffer)
+"""
+
+import struct
+import zlib
+from typing import Iterable, List, Tuple
+
+from openassetio.trait import TraitsData
+
+from . import registry
+
+__all__ = [
+    "encode",
+    "encodeIndexed",
+    "decode",
+    "encodeTraitsData",
+    "decodeTraitsData",
+    "Reader",
+    "kSchemaHash",
+]
+
+# Code used in place of a trait or property code for IDs and keys not
+# in the tables, which are followed by the full string.
+_kUnknownCode = 0xFFFF
+
+# Value type tags, and the struct format of each in a record. Strings
+# are recorded by their encoded length, with their bytes following the
+# fixed-size part of the record.
+_kBool = 0
+_kInt = 1
+_kFloat = 2
+_kStr = 3
+
+_kTags = {bool: _kBool, int: _kInt, float: _kFloat, str: _kStr}
+_kFormats = {_kBool: "?", _kInt: "q", _kFloat: "d", _kStr: "I"}
+
+_kMagic = b"OMCT"
+_kFormatVersion = 1
+
+# Magic, format version, schema hash, number of shapes, number of
+# records.
+_kHeader = struct.Struct("<4sBIII")
+_kUInt16 = struct.Struct("<H")
+_kUInt32 = struct.Struct("<I")
+_kPropertyHeader = struct.Struct("<HB")
+
+
+def _buildTables():
+    """
+    Assigns codes to each trait ID (sorted, for stability) and, per
+    trait, to each property key.
+    """
+    traitIds = sorted(registry.kTraits)
+    propertyKeys = [sorted(registry.kTraits[traitId].properties) for traitId in traitIds]
+    digest = zlib.crc32(repr((traitIds, propertyKeys)).encode("utf-8"))
+    return traitIds, propertyKeys, digest
+
+
+_kTraitIds, _kPropertyKeys, kSchemaHash = _buildTables()
+_kTraitCodes = {traitId: code for code, traitId in enumerate(_kTraitIds)}
+_kPropertyCodes = [{key: code for code, key in enumerate(keys)} for keys in _kPropertyKeys]
+
+
+def encode(traitsDatas: Iterable[TraitsData]) -> bytes:
+    """
+    Encodes the supplied TraitsData into a single buffer.
+
+    @exception TypeError If any property value is not a bool, int,
+    float or str, or an int does not fit in 64 bits.
+    """
+    return _encode(traitsDatas, None)
+
+
+def encodeIndexed(traitsDatas: Iterable[TraitsData]) -> Tuple[bytes, List[int]]:
+    """
+    Encodes the supplied TraitsData into a single buffer, as per
+    @ref encode, additionally returning the offset of each TraitsData
+    within the buffer, for use with @ref Reader.decodeAt.
+    """
+    offsets = []
+    return _encode(traitsDatas, offsets), offsets
+
+
+def decode(buffer) -> List[TraitsData]:
+    """
+    Decodes all the TraitsData held in a buffer produced by @ref encode.
+
+    The buffer may be any object supporting the buffer protocol (e.g.
+    `bytes`, `memoryview`, `mmap`). Strings are decoded directly from
+    the buffer, without intermediate copies.
+
+    @exception ValueError If the buffer is not a valid encoding, or was
+    encoded with a different version of the trait tables.
+    """
+    reader = Reader(buffer)
+    try:
+        return reader.decodeAll()
+    finally:
+        reader.release()
+
+
+def encodeTraitsData(traitsData: TraitsData) -> bytes:
+    """
+    Encodes a single TraitsData, see @ref encode.
+    """
+    return encode((traitsData,))
+
+
+def decodeTraitsData(buffer) -> TraitsData:
+    """
+    Decodes a single TraitsData, see @ref decode.
+
+    @exception ValueError If the buffer does not hold exactly one
+    TraitsData.
+    """
+    traitsDatas = decode(buffer)
+    if len(traitsDatas) != 1:
+        raise ValueError(f"Expected a single TraitsData, buffer holds {len(traitsDatas)}")
+    return traitsDatas[0]
+
+
+class Reader:
+    """
+    Decodes TraitsData from a buffer produced by @ref encode or
+    @ref encodeIndexed, either all at once or individually by offset.
+
+    The header and shapes of the buffer are decoded on construction,
+    after which any single TraitsData can be decoded without decoding
+    those before it. The buffer is not copied, and must not be modified
+    whilst the reader is in use. @ref release should be called before
+    the buffer is closed (e.g. for an `mmap` or shared memory).
+
+    @exception ValueError If the buffer is not a valid encoding, or was
+    encoded with a different version of the trait tables.
+    """
+
+    __slots__ = ("__view", "__shapes", "__count", "__recordsOffset")
+
+    def __init__(self, buffer):
+        with memoryview(buffer) as raw:
+            view = raw.cast("B")
+        # Any failure must release the view, else the buffer can't be
+        # closed (e.g. `SharedMemory.close` raises `BufferError`).
+        try:
+            shapes, offset, count = self.__decodeHeader(view)
+        except Exception:
+            view.release()
+            raise
+
+        self.__view = view
+        self.__shapes = shapes
+        self.__count = count
+        self.__recordsOffset = offset
+
+    @staticmethod
+    def __decodeHeader(view):
+        """
+        Returns the shapes, records offset and count of the buffer.
+        """
+        try:
+            magic, version, schemaHash, numShapes, count = _kHeader.unpack_from(view, 0)
+        except struct.error as exc:
+            raise ValueError("Invalid TraitsData buffer: too short") from exc
+        if magic != _kMagic or version != _kFormatVersion:
+            raise ValueError("Invalid TraitsData buffer: unrecognised format")
+        if schemaHash != kSchemaHash:
+            raise ValueError(
+                "Invalid TraitsData buffer: encoded with a different version of"
+                " openassetio-mediacreation"
+            )
+
+        offset = _kHeader.size
+        shapes = []
+        try:
+            for _ in range(numShapes):
+                shape, offset = _decodeShape(view, offset)
+                shapes.append(shape)
+        except (struct.error, IndexError, UnicodeDecodeError) as exc:
+            raise ValueError(f"Invalid TraitsData buffer: corrupt at offset {offset}") from exc
+        return shapes, offset, count
+
+    def __len__(self):
+        return self.__count
+
+    def decodeAt(self, offset: int) -> TraitsData:
+        """
+        Decodes the TraitsData at the supplied offset, as returned by
+        @ref encodeIndexed.
+
+        @exception ValueError If there is no valid encoding at offset.
+        """
+        if offset < self.__recordsOffset:
+            raise ValueError(f"Invalid TraitsData offset {offset}")
+        try:
+            traitsData, _ = _decodeRecord(self.__view, offset, self.__shapes)
+        except (struct.error, IndexError, UnicodeDecodeError) as exc:
+            raise ValueError(f"Invalid TraitsData buffer: corrupt at offset {offset}") from exc
+        return traitsData
+
+    def decodeAll(self) -> List[TraitsData]:
+        """
+        Decodes all the TraitsData in the buffer, in order.
+
+        @exception ValueError If the buffer is not a valid encoding.
+        """
+        view = self.__view
+        shapes = self.__shapes
+        offset = self.__recordsOffset
+        traitsDatas = []
+        append = traitsDatas.append
+        try:
+            for _ in range(self.__count):
+                traitsData, offset = _decodeRecord(view, offset, shapes)
+                append(traitsData)
+        except (struct.error, IndexError, UnicodeDecodeError) as exc:
+            raise ValueError(f"Invalid TraitsData buffer: corrupt at offset {offset}") from exc
+        if offset != len(view):
+            raise ValueError("Invalid TraitsData buffer: trailing data")
+        return traitsDatas
+
+    def release(self):
+        """
+        Releases the reader's view of the buffer. The reader cannot be
+        used afterwards.
+        """
+        self.__view.release()
+
+
+def _encode(traitsDatas, offsets):
+    """
+    Encodes the supplied TraitsData, appending the offset of each to
+    offsets, if not None.
+    """
+    shapes = {}
+    shapeParts = []
+    recordParts = []
+    append = recordParts.append
+    recordOffset = 0
+    count = 0
+    for traitsData in traitsDatas:
+        getTraitProperty = traitsData.getTraitProperty
+        traitIds = tuple(traitsData.traitSet())
+        keys = tuple(tuple(traitsData.traitPropertyKeys(traitId)) for traitId in traitIds)
+        values = [
+            getTraitProperty(traitId, key)
+            for traitId, traitKeys in zip(traitIds, keys)
+            for key in traitKeys
+        ]
+        shapeKey = (traitIds, keys, tuple(map(type, values)))
+        shape = shapes.get(shapeKey)
+        if shape is None:
+            shape = shapes[shapeKey] = _encodeShape(len(shapes), *shapeKey, shapeParts)
+        index, packer, stringPositions = shape
+
+        strings = []
+        for position in stringPositions:
+            encoded = values[position].encode("utf-8")
+            values[position] = len(encoded)
+            strings.append(encoded)
+        try:
+            append(packer.pack(index, *values))
+        except struct.error as exc:
+            raise TypeError(f"Integer property value does not fit in 64 bits: {exc}") from exc
+        recordParts.extend(strings)
+        count += 1
+
+        if offsets is not None:
+            offsets.append(recordOffset)
+            recordOffset += packer.size + sum(map(len, strings))
+
+    header = _kHeader.pack(_kMagic, _kFormatVersion, kSchemaHash, len(shapes), count)
+    if offsets:
+        # Offsets so far are relative to the first record.
+        recordsOffset = len(header) + sum(map(len, shapeParts))
+        offsets[:] = [recordsOffset + offset for offset in offsets]
+    return b"".join([header, *shapeParts, *recordParts])
+
+
+def _decodeRecord(view, offset, shapes):
+    """
+    Decodes a single TraitsData record at offset, returning it along
+    with the offset of the end of its encoding.
+    """
+    (index,) = _kUInt32.unpack_from(view, offset)
+    emptyTraitIds, properties, unpacker, stringPositions = shapes[index]
+    values = unpacker.unpack_from(view, offset + 4)
+    offset += 4 + unpacker.size
+    if stringPositions:
+        values = list(values)
+        size = len(view)
+        for position in stringPositions:
+            end = offset + values[position]
+            if end > size:
+                raise IndexError("String extends beyond end of buffer")
+            # Decoding straight from the memoryview slice avoids copying
+            # the bytes before decoding.
+            values[position] = str(view[offset:end], "utf-8")
+            offset = end
+
+    traitsData = TraitsData()
+    setTraitProperty = traitsData.setTraitProperty
+    for traitId in emptyTraitIds:
+        traitsData.addTrait(traitId)
+    for (traitId, key), value in zip(properties, values):
+        setTraitProperty(traitId, key, value)
+    return traitsData, offset
+
+
+# pylint: disable=too-many-arguments
+def _encodeShape(index, traitIds, keys, valueTypes, parts):
+    """
+    Appends the encoding of a shape to parts, returning its index, the
+    struct used to pack its records and the positions of its string
+    values.
+    """
+    append = parts.append
+    append(_kUInt16.pack(len(traitIds)))
+    formats = []
+    valueTypes = iter(valueTypes)
+    for traitId, traitKeys in zip(traitIds, keys):
+        code = _kTraitCodes.get(traitId, _kUnknownCode)
+        append(_kUInt16.pack(code))
+        if code == _kUnknownCode:
+            _appendString(traitId, parts)
+            propertyCodes = {}
+        else:
+            propertyCodes = _kPropertyCodes[code]
+
+        append(_kUInt16.pack(len(traitKeys)))
+        for key in traitKeys:
+            valueType = next(valueTypes)
+            tag = _kTags.get(valueType)
+            if tag is None:
+                raise TypeError(
+                    f"Unsupported value type '{valueType.__name__}' for property '{key}'"
+                    f" of trait '{traitId}'"
+                )
+            keyCode = propertyCodes.get(key, _kUnknownCode)
+            append(_kPropertyHeader.pack(keyCode, tag))
+            if keyCode == _kUnknownCode:
+                _appendString(key, parts)
+            formats.append(_kFormats[tag])
+
+    # Records are prefixed with the index of their shape.
+    packer = struct.Struct("<I" + "".join(formats))
+    return index, packer, _stringPositions(formats)
+
+
+def _decodeShape(view, offset):
+    """
+    Decodes a shape at offset, returning the IDs of any traits without
+    properties, the `(traitId, key)` of each value, the struct used to
+    unpack the values of its records and the positions of its string
+    values, along with the offset of the end of its encoding.
+    """
+    emptyTraitIds = []
+    properties = []
+    formats = []
+    (numTraits,) = _kUInt16.unpack_from(view, offset)
+    offset += 2
+    for _ in range(numTraits):
+        (code,) = _kUInt16.unpack_from(view, offset)
+        offset += 2
+        if code == _kUnknownCode:
+            traitId, offset = _readString(view, offset)
+            propertyKeys = ()
+        else:
+            traitId = _kTraitIds[code]
+            propertyKeys = _kPropertyKeys[code]
+
+        (numProperties,) = _kUInt16.unpack_from(view, offset)
+        offset += 2
+        if not numProperties:
+            emptyTraitIds.append(traitId)
+        for _ in range(numProperties):
+            keyCode, tag = _kPropertyHeader.unpack_from(view, offset)
+            offset += _kPropertyHeader.size
+            if keyCode == _kUnknownCode:
+                key, offset = _readString(view, offset)
+            else:
+                key = propertyKeys[keyCode]
+            if tag not in _kFormats:
+                raise ValueError(f"Invalid TraitsData buffer: unknown value type {tag}")
+            properties.append((traitId, key))
+            formats.append(_kFormats[tag])
+
+    unpacker = struct.Struct("<" + "".join(formats))
+    return (emptyTraitIds, properties, unpacker, _stringPositions(formats)), offset
+
+
+def _stringPositions(formats):
+    return [position for position, format_ in enumerate(formats) if format_ == _kFormats[_kStr]]
+
+
+def _appendString(string, parts):
+    encoded = string.encode("utf-8")
+    parts.append(_kUInt32.pack(len(encoded)))
+    parts.append(encoded)
+
+
+def _readString(view, offset):
+    (length,) = _kUInt32.unpack_from(view, offset)
+    offset += 4
+    end = offset + length
+    if end > len(view):
+        raise IndexError("String extends beyond end of buffer")
+    return str(view[offset:end], "utf-8"), end
@@ -0,0 +1,236 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Batches of @fqref{TraitsData} "TraitsData" shared between processes.
+
+A `SharedTraitsDataBatch` is written once, by the creating process,
+into a block of shared memory, using the compact `serialization`
+encoding along with a table of the offset of each TraitsData. Pickling
+a batch (e.g. to send it to a `ProcessPoolExecutor` worker) pickles
+only the name of the shared memory block, which workers map on first
+use. Workers then decode only the TraitsData they access, rather than
+each receiving a pickled copy of the whole batch. For example
+
+    def work(batch, index):
+        return FrameRangedTrait_v1(batch[index]).getStartFrame()
+
+    with SharedTraitsDataBatch.create(traitsDatas) as batch:
+        with ProcessPoolExecutor() as pool:
+            startFrames = list(pool.map(work, repeat(batch), range(len(batch))))
+
+Batches should only be shared with processes started by the creating
+process via `multiprocessing`, such that they share its shared memory
+resource tracker.
+"""
+
+import array
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Optional
+
+from openassetio.trait import TraitsData
+
+from . import serialization
+
+__all__ = ["SharedTraitsDataBatch"]
+
+_kMagic = b"OMCB"
+_kFormatVersion = 1
+
+# Magic, format version, number of TraitsData, size of the serialized
+# TraitsData. The serialized TraitsData follow the header, then the
+# (8-byte aligned) table of their offsets within it.
+_kHeader = struct.Struct("<4sBQQ")
+_kOffsetFormat = "Q"
+_kOffsetSize = struct.calcsize(_kOffsetFormat)
+
+# Bound on the number of batches attached by name that are kept mapped
+# by a process, such that long-lived workers do not accumulate the
+# mappings of batches that have since been discarded.
+_kMaxAttached = 8
+
+
+class SharedTraitsDataBatch(Sequence):
+    """
+    A read-only sequence of TraitsData, held in shared memory.
+
+    Use @ref create to write a new batch, and @ref attach (or
+    unpickling) to access an existing one from another process.
+    Indexing decodes the TraitsData at that index, returning a new
+    TraitsData that can be wrapped by any trait or specification view
+    class.
+
+    When used as a context manager, the batch is closed on exit and, if
+    it was created by this object, its shared memory is unlinked.
+    """
+
+    __slots__ = ("__memory", "__reader", "__offsets", "__isOwner", "__closed")
+
+    def __init__(self, memory: SharedMemory, isOwner: bool = False):
+        """
+        Wraps a shared memory block already holding a batch. Prefer
+        @ref create or @ref attach.
+
+        @exception ValueError If the shared memory does not hold a
+        valid batch.
+        """
+        buffer = memory.buf
+        try:
+            magic, version, count, payloadSize = _kHeader.unpack_from(buffer, 0)
+        except struct.error as exc:
+            raise ValueError("Invalid TraitsData batch: too short") from exc
+        if magic != _kMagic or version != _kFormatVersion:
+            raise ValueError("Invalid TraitsData batch: unrecognised format")
+
+        payloadEnd = _kHeader.size + payloadSize
+        tableOffset = _aligned(payloadEnd)
+        tableEnd = tableOffset + count * _kOffsetSize
+        if tableEnd > len(buffer):
+            raise ValueError("Invalid TraitsData batch: too short")
+
+        self.__reader = serialization.Reader(buffer[_kHeader.size : payloadEnd])
+        self.__offsets = buffer[tableOffset:tableEnd].cast(_kOffsetFormat)
+        self.__memory = memory
+        self.__isOwner = isOwner
+        self.__closed = False
+
+    @classmethod
+    def create(
+        cls, traitsDatas: Iterable[TraitsData], name: Optional[str] = None
+    ) -> "SharedTraitsDataBatch":
+        """
+        Writes the supplied TraitsData into a new shared memory block.
+
+        The returned batch owns the block, and must be unlinked (see
+        @ref unlink) once no longer needed by any process.
+
+        @param name The name of the shared memory block, if not
+        supplied then a unique name is generated.
+
+        @exception TypeError If any property value cannot be
+        serialized, see `serialization.encode`.
+        """
+        payload, offsets = serialization.encodeIndexed(traitsDatas)
+        payloadEnd = _kHeader.size + len(payload)
+        tableOffset = _aligned(payloadEnd)
+        table = array.array(_kOffsetFormat, offsets)
+        size = tableOffset + len(table) * table.itemsize
+
+        memory = SharedMemory(name=name, create=True, size=size)
+        try:
+            buffer = memory.buf
+            _kHeader.pack_into(buffer, 0, _kMagic, _kFormatVersion, len(offsets), len(payload))
+            buffer[_kHeader.size : payloadEnd] = payload
+            buffer[tableOffset:size] = memoryview(table).cast("B")
+            return cls(memory, isOwner=True)
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedTraitsDataBatch":
+        """
+        Returns the batch held in the named shared memory block.
+
+        Batches are cached by name, such that repeatedly attaching to
+        (or unpickling) the same batch in a process maps it only once.
+
+        @exception FileNotFoundError If there is no such shared memory
+        block.
+        """
+        with _attachedLock:
+            batch = _attached.get(name)
+            if batch is not None and not batch.closed:
+                _attached.move_to_end(name)
+                return batch
+
+        kwargs = {}
+        if sys.version_info >= (3, 13):
+            # The creating process's resource tracker is responsible for
+            # the block.
+            kwargs["track"] = False
+        batch = cls(SharedMemory(name=name, create=False, **kwargs))
+
+        with _attachedLock:
+            _attached[name] = batch
+            _attached.move_to_end(name)
+            while len(_attached) > _kMaxAttached:
+                # Evicted batches remain usable by any existing
+                # references, and are closed when collected.
+                _attached.popitem(last=False)
+        return batch
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the shared memory block holding the batch.
+        """
+        return self.__memory.name
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether @ref close has been called.
+        """
+        return self.__closed
+
+    def __len__(self):
+        return len(self.__offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self.__closed:
+            raise ValueError("Operation on a closed TraitsData batch")
+        return self.__reader.decodeAt(self.__offsets[index])
+
+    def __reduce__(self):
+        return type(self).attach, (self.name,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+        if self.__isOwner:
+            self.unlink()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """
+        Unmaps the batch from this process. The batch cannot be used
+        afterwards. Does not destroy the shared memory, see
+        @ref unlink.
+        """
+        # May be called by __del__ after a failed __init__.
+        if getattr(self, "_SharedTraitsDataBatch__closed", True):
+            return
+        self.__closed = True
+        # All views of the shared memory must be released before it can
+        # be closed.
+        self.__reader.release()
+        self.__offsets.release()
+        self.__memory.close()
+
+    def unlink(self):
+        """
+        Requests that the shared memory be destroyed once it has been
+        closed by all processes. Should only be called by the creating
+        process.
+        """
+        self.__memory.unlink()
+
+
+def _aligned(offset):
+    return -(-offset // _kOffsetSize) * _kOffsetSize
+
+
+_attached = OrderedDict()
+_attachedLock = threading.Lock()
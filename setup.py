@@ -1,34 +1,58 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2013-2022 The Foundry Visionmongers Ltd
+from distutils import log
 from distutils.command.build_py import build_py
 import logging
 import os
+import sys
+import time
 from shutil import copyfile
 from setuptools import setup
 
-import openassetio_traitgen
+# The build-time code generation package lives alongside this script,
+# which isn't necessarily on sys.path under a PEP 517 build.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import codegen.incremental
+
 
 # The python sources don't exist in this repo, but are generated via
-# openassetio-traitgen at point of build.
+# openassetio-traitgen (plus MediaCreation supplements, see codegen) at
+# point of build.
 # We generate them directly into the build directory structured as a
 # package.
+# A manifest of content hashes is kept in the build's temporary
+# directory, so that repeated builds skip generation if traits.yml,
+# constraints.yml, traitgen and codegen are unchanged, and otherwise
+# only regenerate the namespaces that have changed.
 class GenerateThenBuild(build_py):
     def run(self):
+        manifest_path = os.path.join(
+            self.get_finalized_command("build").build_temp, "codegen-python.json"
+        )
         # Generate traits package directly into the package directory.
-        openassetio_traitgen.generate(
+        start = time.perf_counter()
+        regenerated = codegen.incremental.generate(
             "traits.yml",
             self.build_lib,
             "python",
+            manifest_path,
             lambda _: _,
             logging.Logger("openassetio-mediacreation-traitgen"),
-            False,
-            None,
         )
+        if regenerated:
+            self.announce(
+                f"Generated {len(regenerated)} namespace(s) in"
+                f" {time.perf_counter() - start:.2f}s: {', '.join(regenerated)}",
+                level=log.INFO,
+            )
+        else:
+            self.announce("Generated sources are up to date, skipping", level=log.INFO)
 
-        # Move the source trait yaml to the package directory.
-        copyfile(
-            "traits.yml", os.path.join(self.build_lib, "openassetio_mediacreation", "traits.yml")
-        )
+        # Move the source trait yaml, and property constraints, to the
+        # package directory.
+        for filename in ("traits.yml", "constraints.yml"):
+            copyfile(filename, os.path.join(self.build_lib, "openassetio_mediacreation", filename))
 
         build_py.run(self)
 
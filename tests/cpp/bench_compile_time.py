@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Compile-time benchmark for consumers of the C++ headers.
+
+Compares the time to compile a translation unit that uses a single
+trait and specification, when including:
+
+- the umbrella header, `openassetio_mediacreation.hpp`;
+- the umbrella header, precompiled (as per the
+  OPENASSETIO_MEDIACREATION_ENABLE_PCH CMake option);
+- the per-namespace aggregate headers, e.g. `traits/timeDomain.hpp`;
+- the individual trait and specification headers.
+
+Invoked via the `openassetio-mediacreation.benchmarks.compile-time`
+CMake target when tests are enabled, or directly, e.g.
+
+    python bench_compile_time.py -I <mediacreation include dir> \\
+        -I <openassetio include dir> [--compiler g++] [--repeat 5]
+
+Only GCC and Clang compatible compilers are supported.
+"""
+
+# pylint: disable=missing-function-docstring
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+kBody = """
+int main() {
+  auto data = openassetio::trait::TraitsData::make();
+  openassetio_mediacreation::traits::timeDomain::FrameRangedTrait_v1 trait(data);
+  trait.setStartFrame(1);
+  auto spec = openassetio_mediacreation::specifications::twoDimensional::
+      BitmapImageResourceSpecification_v1::create();
+  return static_cast<int>(trait.getStartFrame().value_or(0)) +
+         static_cast<int>(spec.traitsData() == nullptr);
+}
+"""
+
+kUmbrellaHeader = "openassetio_mediacreation/openassetio_mediacreation.hpp"
+
+kCases = {
+    "umbrella": [kUmbrellaHeader],
+    "namespace aggregates": [
+        "openassetio_mediacreation/traits/timeDomain.hpp",
+        "openassetio_mediacreation/specifications/twoDimensional.hpp",
+    ],
+    "individual headers": [
+        "openassetio_mediacreation/traits/timeDomain/FrameRangedTrait.hpp",
+        "openassetio_mediacreation/specifications/twoDimensional/"
+        "BitmapImageResourceSpecification.hpp",
+    ],
+}
+
+
+def writeSource(directory, name, headers):
+    path = os.path.join(directory, f"{name.replace(' ', '_')}.cpp")
+    with open(path, "w", encoding="utf-8") as file:
+        file.writelines(f"#include <{header}>\n" for header in headers)
+        file.write(kBody)
+    return path
+
+
+def timeCompile(command, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, check=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def precompileUmbrella(compiler, flags, directory):
+    """
+    Precompiles the umbrella header, returning the flags needed to use
+    it. GCC uses a .gch alongside a forwarding header, Clang an explicit
+    -include-pch.
+    """
+    header = os.path.join(directory, "pch.hpp")
+    with open(header, "w", encoding="utf-8") as file:
+        file.write(f"#include <{kUmbrellaHeader}>\n")
+    isClang = (
+        "clang"
+        in subprocess.run(
+            [compiler, "--version"], check=True, capture_output=True, text=True
+        ).stdout
+    )
+    if isClang:
+        pch = header + ".pch"
+        subprocess.run([compiler, *flags, "-x", "c++-header", header, "-o", pch], check=True)
+        return ["-include-pch", pch]
+    subprocess.run(
+        [compiler, *flags, "-x", "c++-header", header, "-o", header + ".gch"], check=True
+    )
+    return ["-include", header]
+
+
+def main(argv=None):
+    cmdline = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0])
+    cmdline.add_argument("-I", dest="include_dirs", action="append", default=[])
+    cmdline.add_argument("--compiler", default=os.environ.get("CXX", "c++"))
+    cmdline.add_argument("--repeat", type=int, default=5)
+    args = cmdline.parse_args(argv)
+
+    if shutil.which(args.compiler) is None:
+        cmdline.error(f"Compiler '{args.compiler}' not found")
+
+    flags = ["-std=c++17", *(f"-I{includeDir}" for includeDir in args.include_dirs)]
+    compileFlags = [*flags, "-fsyntax-only"]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, headers in kCases.items():
+            source = writeSource(directory, name, headers)
+            results[name] = timeCompile([args.compiler, *compileFlags, source], args.repeat)
+        pchFlags = precompileUmbrella(args.compiler, flags, directory)
+        source = writeSource(directory, "umbrella precompiled", [kUmbrellaHeader])
+        results["umbrella (precompiled)"] = timeCompile(
+            [args.compiler, *compileFlags, *pchFlags, source], args.repeat
+        )
+
+    baseline = results["umbrella"]
+    for name, seconds in results.items():
+        print(f"{name:<30} {seconds * 1e3:>10.1f} ms  ({baseline / seconds:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,13 +4,56 @@
 // Include all headers to test they can be compiled.
 
 #include <openassetio_mediacreation/openassetio_mediacreation.hpp>
+#include <openassetio_mediacreation/registry.hpp>
+#include <openassetio_mediacreation/specificationTraitSets.hpp>
 
 using namespace openassetio_mediacreation;
 
+// Specification trait sets are usable in constant expressions.
+static_assert(specificationTraitSets::contains(
+    specificationTraitSets::twoDimensional::kPlanarBitmapImageResourceSpecification_v1,
+    "openassetio-mediacreation:twoDimensional.Planar"));
+static_assert(!specificationTraitSets::contains(
+    specificationTraitSets::twoDimensional::kBitmapImageResourceSpecification_v1,
+    "openassetio-mediacreation:twoDimensional.Planar"));
+static_assert(specificationTraitSets::isSubset(
+    specificationTraitSets::twoDimensional::kBitmapImageResourceSpecification_v1,
+    specificationTraitSets::twoDimensional::kPlanarBitmapImageResourceSpecification_v1));
+
 int main() {
   auto traits = openassetio::trait::TraitsData::make();
   auto deprecated = traits::managementPolicy::ManagedTrait(traits);
   auto trait = traits::managementPolicy::ManagedTrait_v1(traits);
   trait.imbue();
+
+  // Registry lookup and dispatch to a view class.
+  const auto* info = registry::findTrait(traits::timeDomain::FrameRangedTrait_v1::kId);
+  if (info == nullptr || info->numProperties != 6) {
+    return 1;
+  }
+  const bool visited = registry::visitTrait(info->id, [&](auto tag) {
+    using View = typename decltype(tag)::Type;
+    View::imbueTo(traits);
+  });
+  if (!visited || !traits::timeDomain::FrameRangedTrait_v1::isImbuedTo(traits)) {
+    return 1;
+  }
+  if (registry::findTrait("not:a.Trait") != nullptr) {
+    return 1;
+  }
+
+  // Specification trait sets match the view classes' kTraitSet.
+  const auto& sortedIds =
+      specificationTraitSets::twoDimensional::kPlanarBitmapImageResourceSpecification_v1;
+  const auto& traitSet =
+      specifications::twoDimensional::PlanarBitmapImageResourceSpecification_v1::kTraitSet;
+  if (sortedIds.size() != traitSet.size()) {
+    return 1;
+  }
+  for (const std::string_view traitId : sortedIds) {
+    if (traitSet.count(std::string{traitId}) == 0) {
+      return 1;
+    }
+  }
   return 0;
 }
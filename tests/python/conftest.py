@@ -4,7 +4,6 @@
 Shared fixtures/code for pytest cases.
 """
 
-
 import sys
 
 import pytest
@@ -0,0 +1,186 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests for the frame range interval index.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import random
+
+import pytest
+
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+
+pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from openassetio_mediacreation import frameRangeIndex
+from openassetio_mediacreation.frameRangeIndex import FrameRangeIndex
+
+
+def makeData(**properties):
+    data = TraitsData()
+    trait = FrameRangedTrait_v1(data)
+    for name, value in properties.items():
+        getattr(trait, f"set{name[0].upper()}{name[1:]}")(value)
+    return data
+
+
+@pytest.fixture
+def index():
+    # IDs 10: 1-100, 11: 50-60, 12: 1-99 every 10th frame, 13: 200-300
+    return FrameRangeIndex.fromArrays(
+        [10, 11, 12, 13], [1, 50, 1, 200], [100, 60, 99, 300], [1, 1, 10, 1]
+    )
+
+
+class Test_FrameRangeIndex_covering:
+    def test_returns_sorted_ids_covering_frame(self, index):
+        assert index.covering(55).tolist() == [10, 11]
+
+    def test_when_on_step_then_stepped_range_included(self, index):
+        assert index.covering(51).tolist() == [10, 11, 12]
+
+    def test_when_not_honouring_step_then_whole_range_included(self, index):
+        assert index.covering(55, honourStep=False).tolist() == [10, 11, 12]
+
+    def test_range_bounds_are_inclusive(self, index):
+        assert index.covering(100).tolist() == [10]
+        assert index.covering(200).tolist() == [13]
+
+    def test_when_no_ranges_cover_frame_then_empty(self, index):
+        assert index.covering(150).tolist() == []
+        assert FrameRangeIndex().covering(1).tolist() == []
+
+
+class Test_FrameRangeIndex_overlapping:
+    def test_returns_ids_overlapping_range(self, index):
+        assert index.overlapping(95, 250).tolist() == [10, 13]
+
+    def test_when_range_straddles_step_then_stepped_range_included(self, index):
+        assert index.overlapping(89, 92).tolist() == [10, 12]
+
+    def test_when_range_between_steps_then_stepped_range_excluded(self, index):
+        assert index.overlapping(92, 95).tolist() == [10]
+        assert index.overlapping(92, 95, honourStep=False).tolist() == [10, 12]
+
+
+class Test_FrameRangeIndex_fromArrays:
+    def test_when_lengths_differ_then_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            FrameRangeIndex.fromArrays([1, 2], [1], [2])
+
+    def test_when_ids_repeated_then_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            FrameRangeIndex.fromArrays([1, 1], [1, 2], [3, 4])
+
+    @pytest.mark.parametrize("first,last,step", [(10, 9, 1), (1, 10, 0)])
+    def test_when_range_invalid_then_raises_ValueError(self, first, last, step):
+        with pytest.raises(ValueError):
+            FrameRangeIndex.fromArrays([1], [first], [last], [step])
+
+
+class Test_FrameRangeIndex_fromTraitsData:
+    def test_indexes_frame_ranges_of_data(self):
+        datas = [
+            makeData(startFrame=1, endFrame=10),
+            makeData(startFrame=1, endFrame=100, inFrame=20, outFrame=30),
+            makeData(startFrame=1, endFrame=100, step=10),
+        ]
+
+        index = FrameRangeIndex.fromTraitsData(datas)
+
+        assert index.covering(5).tolist() == [0]
+        assert index.covering(25).tolist() == [1]
+        assert index.covering(21).tolist() == [1, 2]
+        assert index.frameRange(2) == range(1, 101, 10)
+
+    def test_when_step_then_first_frame_aligned_to_start_frame(self):
+        index = FrameRangeIndex.fromTraitsData(
+            [makeData(startFrame=1, endFrame=100, inFrame=5, step=10)]
+        )
+
+        assert index.frameRange(0) == range(11, 101, 10)
+
+    def test_when_range_unknown_then_not_indexed(self):
+        index = FrameRangeIndex.fromTraitsData(
+            [makeData(startFrame=1), TraitsData(), makeData(inFrame=5, outFrame=6)],
+            ids=[7, 8, 9],
+        )
+
+        assert len(index) == 1
+        assert 9 in index
+
+    def test_when_step_not_positive_then_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            FrameRangeIndex.fromTraitsData([makeData(startFrame=1, endFrame=2, step=0)])
+
+
+class Test_FrameRangeIndex_incremental:
+    def test_when_inserted_then_queryable(self, index):
+        index.insert(20, 150, 160)
+
+        assert index.covering(155).tolist() == [20]
+        assert len(index) == 5
+
+    def test_when_id_reinserted_then_range_replaced(self, index):
+        index.insert(11, 400, 500)
+
+        assert index.covering(55).tolist() == [10]
+        assert index.covering(450).tolist() == [11]
+        assert index.frameRange(11) == range(400, 501)
+        assert len(index) == 4
+
+    def test_when_removed_then_not_queryable(self, index):
+        index.remove(10)
+
+        assert index.covering(55).tolist() == [11]
+        assert 10 not in index
+        assert len(index) == 3
+
+    def test_when_removing_unknown_id_then_raises_KeyError(self, index):
+        with pytest.raises(KeyError):
+            index.remove(99)
+
+    def test_insertTraitsData_uses_frame_range(self):
+        index = FrameRangeIndex()
+
+        index.insertTraitsData(1, makeData(startFrame=10, endFrame=20, step=5))
+
+        assert index.frameRange(1) == range(10, 21, 5)
+
+    def test_when_frame_range_unknown_then_insertTraitsData_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            FrameRangeIndex().insertTraitsData(1, makeData(startFrame=10))
+
+    def test_matches_linear_scan_across_merges(self, monkeypatch):
+        monkeypatch.setattr(frameRangeIndex, "kMinBufferSize", 8)
+        rng = random.Random(0)
+        index = FrameRangeIndex()
+        ranges = {}
+
+        for _ in range(1000):
+            if rng.random() < 0.3:
+                entityId = rng.randrange(200)
+                first = rng.randrange(500)
+                ranges[entityId] = range(first, first + rng.randrange(100) + 1, rng.choice((1, 4)))
+                index.insert(entityId, first, ranges[entityId].stop - 1, ranges[entityId].step)
+            elif rng.random() < 0.3 and ranges:
+                entityId = rng.choice(list(ranges))
+                del ranges[entityId]
+                index.remove(entityId)
+            else:
+                first = rng.randrange(-10, 620)
+                last = first + rng.choice((0, 3, 50))
+                expected = sorted(
+                    entityId
+                    for entityId, frames in ranges.items()
+                    if any(first <= frame <= last for frame in frames)
+                )
+                assert index.overlapping(first, last).tolist() == expected
+            assert len(index) == len(ranges)
@@ -9,6 +9,9 @@ Test MediaCreation traits and specifications can be imported
 # pylint: disable=unused-import,import-outside-toplevel
 # pylint: disable=missing-class-docstring,missing-function-docstring
 
+import subprocess
+import sys
+
 import pytest
 
 
@@ -33,6 +36,71 @@ class Test_package_imports:
         from openassetio_mediacreation import specifications
 
 
+class Test_package_imports_lazy:
+    def test_importing_openassetio_mediacreation_loads_only_the_package(self):
+        # Run in a fresh interpreter so that modules imported by other
+        # tests (e.g. openassetio itself) don't mask the result.
+        assert modulesLoadedBy("import openassetio_mediacreation") == ["openassetio_mediacreation"]
+
+    def test_importing_traits_loads_no_namespaces(self):
+        loaded = modulesLoadedBy("from openassetio_mediacreation import traits")
+        assert [name for name in loaded if name.startswith("openassetio_mediacreation")] == [
+            "openassetio_mediacreation",
+            "openassetio_mediacreation.traits",
+        ]
+
+    def test_importing_trait_loads_only_its_namespace(self):
+        loaded = modulesLoadedBy(
+            "from openassetio_mediacreation.traits.content import LocatableContentTrait_v1"
+        )
+        assert [name for name in loaded if name.startswith("openassetio_mediacreation")] == [
+            "openassetio_mediacreation",
+            "openassetio_mediacreation._batch",
+            "openassetio_mediacreation._extensions",
+            "openassetio_mediacreation._extensions.traits",
+            "openassetio_mediacreation._extensions.traits.content",
+            "openassetio_mediacreation._views",
+            "openassetio_mediacreation.traits",
+            "openassetio_mediacreation.traits.content",
+        ]
+
+    def test_accessing_namespace_attribute_imports_namespace(self):
+        import openassetio_mediacreation
+
+        assert openassetio_mediacreation.traits.content.LocatableContentTrait_v1.kId == (
+            "openassetio-mediacreation:content.LocatableContent"
+        )
+
+    def test_dir_lists_lazy_namespaces(self):
+        from openassetio_mediacreation import traits, specifications
+
+        assert {"content", "timeDomain", "usage"} <= set(dir(traits))
+        assert {"twoDimensional", "threeDimensional"} <= set(dir(specifications))
+
+    def test_unknown_namespace_raises_AttributeError(self):
+        from openassetio_mediacreation import traits
+
+        with pytest.raises(AttributeError):
+            _ = traits.notANamespace
+
+
+def modulesLoadedBy(statement):
+    """
+    Returns the sorted names of the modules newly loaded by executing
+    the supplied statement in a fresh interpreter.
+    """
+    script = (
+        "import sys\n"
+        "before = set(sys.modules)\n"
+        f"{statement}\n"
+        "print('\\n'.join(sorted(set(sys.modules) - before)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    )
+    return result.stdout.split()
+
+
 class Test_trait_imports_content:
     def test_importing_namespace_succeeds(self):
         from openassetio_mediacreation.traits import content
@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests for the opt-in instrumentation of the generated trait view
+classes.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+# pylint: disable=redefined-outer-name,unused-argument
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation import instrumentation
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class Test_instrumentation_disabled:
+    def test_is_disabled_by_default(self):
+        assert not instrumentation.isEnabled()
+
+    def test_view_classes_are_untouched(self):
+        original = dict(vars(LocatableContentTrait_v1))
+
+        instrumentation.enable()
+        instrumentation.disable()
+
+        assert dict(vars(LocatableContentTrait_v1)) == original
+
+    def test_nothing_is_counted(self):
+        instrumentation.reset()
+
+        LocatableContentTrait_v1(TraitsData()).getLocation()
+
+        assert instrumentation.snapshot() == {}
+
+
+class Test_instrumentation_enabled:
+    def test_counts_view_constructions(self, enabled):
+        data = TraitsData()
+        LocatableContentTrait_v1(data)
+        LocatableContentTrait_v1(data)
+
+        assert instrumentation.snapshot()[LocatableContentTrait_v1.kId]["constructed"] == 2
+
+    def test_counts_imbue_and_isImbued(self, enabled):
+        data = TraitsData()
+        LocatableContentTrait_v1(data).imbue()
+        LocatableContentTrait_v1.imbueTo(data)
+        FrameRangedTrait_v1.isImbuedTo(data)
+        FrameRangedTrait_v1(data).isImbued()
+
+        snapshot = instrumentation.snapshot()
+
+        assert snapshot[LocatableContentTrait_v1.kId]["imbue"] == 2
+        assert snapshot[FrameRangedTrait_v1.kId]["isImbued"] == 2
+
+    def test_counts_property_hits_misses_and_sets(self, enabled):
+        trait = LocatableContentTrait_v1(TraitsData())
+        trait.getLocation()
+        trait.setLocation("file:///a")
+        trait.getLocation()
+        trait.getLocation("default")
+
+        assert instrumentation.snapshot()[LocatableContentTrait_v1.kId]["properties"] == {
+            "location": {"getHits": 2, "getMisses": 1, "sets": 1}
+        }
+
+    def test_instrumented_views_behave_as_before(self, enabled):
+        trait = LocatableContentTrait_v1(TraitsData())
+
+        assert trait.getMimeType("default") == "default"
+        with pytest.raises(TypeError):
+            trait.setLocation(1)
+
+    def test_snapshot_is_a_copy(self, enabled):
+        LocatableContentTrait_v1(TraitsData())
+
+        snapshot = instrumentation.snapshot()
+        LocatableContentTrait_v1(TraitsData())
+
+        assert snapshot[LocatableContentTrait_v1.kId]["constructed"] == 1
+
+    def test_when_reset_then_counts_cleared(self, enabled):
+        LocatableContentTrait_v1(TraitsData())
+
+        instrumentation.reset()
+
+        assert instrumentation.snapshot() == {}
+
+    def test_when_enabled_twice_then_counted_once(self, enabled):
+        instrumentation.enable()
+
+        LocatableContentTrait_v1(TraitsData())
+
+        assert instrumentation.snapshot()[LocatableContentTrait_v1.kId]["constructed"] == 1
+
+
+def test_when_environment_variable_set_then_enabled_on_import():
+    script = (
+        "import openassetio_mediacreation\n"
+        "from openassetio_mediacreation import instrumentation\n"
+        "print(instrumentation.isEnabled())\n"
+    )
+    env = dict(os.environ, **{instrumentation.kEnvVar: "1"})
+
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True, env=env
+    )
+
+    assert result.stdout.strip() == "True"
@@ -0,0 +1,306 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests for the templated location expansion utilities.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pytest
+
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation import locationTemplate
+from openassetio_mediacreation.locationTemplate import (
+    LocationTemplate,
+    LocationTemplateCache,
+    compileTemplate,
+    frameRange,
+    iterLocations,
+    substitute,
+)
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+
+
+class Test_LocationTemplate_variables:
+    def test_when_frame_and_view_then_needs_both(self):
+        template = LocationTemplate("file:///shot/image.{frame:04d}.{view}.exr")
+
+        assert template.variables == {"frame", "view"}
+        assert template.needsFrame
+        assert template.needsView
+
+    def test_when_static_then_needs_neither(self):
+        template = LocationTemplate("file:///shot/image.exr")
+
+        assert template.variables == frozenset()
+        assert not template.needsFrame
+        assert not template.needsView
+
+    def test_when_braces_percent_encoded_then_parsed_as_variables(self):
+        template = LocationTemplate("file:///shot/image.%7Bframe:04d%7d.exr")
+
+        assert template.variables == {"frame"}
+        assert template.substitute(frame=7) == "file:///shot/image.0007.exr"
+
+    @pytest.mark.parametrize(
+        "location", ["image.{}.exr", "image.{0}.exr", "image.{frame[0]}.exr", "image.{frame"]
+    )
+    def test_when_unsupported_then_raises_ValueError(self, location):
+        with pytest.raises(ValueError):
+            LocationTemplate(location)
+
+
+class Test_LocationTemplate_substitute:
+    def test_substitutes_all_variables(self):
+        template = LocationTemplate("file:///{shot}/image.{frame:04d}.{view}.exr")
+
+        assert (
+            template.substitute(frame=12, view="left", shot="sh010")
+            == "file:///sh010/image.0012.left.exr"
+        )
+
+    def test_url_encodes_substituted_values(self):
+        template = LocationTemplate("file:///image.{frame:4d}.{view}.exr")
+
+        assert template.substitute(frame=1, view="a b") == "file:///image.%20%20%201.a%20b.exr"
+
+    def test_when_variable_missing_then_raises_KeyError(self):
+        template = LocationTemplate("file:///image.{frame:04d}.{view}.exr")
+
+        with pytest.raises(KeyError):
+            template.substitute(view="left")
+        with pytest.raises(KeyError):
+            template.substitute(frame=1)
+
+
+class Test_LocationTemplate_iterFrames:
+    def test_is_lazy(self):
+        template = LocationTemplate("file:///image.{frame:04d}.exr")
+
+        locations = template.iterFrames(range(1, 10**9))
+
+        assert iter(locations) is locations
+        assert next(locations) == "file:///image.0001.exr"
+        assert next(locations) == "file:///image.0002.exr"
+
+    def test_when_frame_used_more_than_once_then_all_substituted(self):
+        template = LocationTemplate("file:///{frame}/image.{frame:03d}.{view}.exr")
+
+        assert list(template.iterFrames([5, 6], view="r")) == [
+            "file:///5/image.005.r.exr",
+            "file:///6/image.006.r.exr",
+        ]
+
+
+class Test_LocationTemplate_expandFrames:
+    def test_returns_location_per_frame(self):
+        template = LocationTemplate("file:///image.{frame:04d}.exr")
+
+        assert template.expandFrames(range(99, 102)) == [
+            "file:///image.0099.exr",
+            "file:///image.0100.exr",
+            "file:///image.0101.exr",
+        ]
+
+
+class Test_LocationTemplate_views:
+    def test_iterViews_fans_out_per_view(self):
+        template = LocationTemplate("file:///image.{frame:04d}.{view}.exr")
+
+        assert list(template.iterViews(range(1, 3), ["left", "right"])) == [
+            ("left", 1, "file:///image.0001.left.exr"),
+            ("left", 2, "file:///image.0002.left.exr"),
+            ("right", 1, "file:///image.0001.right.exr"),
+            ("right", 2, "file:///image.0002.right.exr"),
+        ]
+
+    def test_expandViews_returns_locations_per_view(self):
+        template = LocationTemplate("file:///{view}/image.{frame}.exr")
+
+        assert template.expandViews([1], ["left", "right"]) == {
+            "left": ["file:///left/image.1.exr"],
+            "right": ["file:///right/image.1.exr"],
+        }
+
+
+class Test_LocationTemplateCache:
+    def test_when_location_repeated_then_template_reused(self):
+        cache = LocationTemplateCache()
+
+        template = cache.get("file:///image.{frame}.exr")
+
+        assert cache.get("file:///image.{frame}.exr") is template
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "size": 1,
+            "maxSize": 1024,
+        }
+
+    def test_when_full_then_evicts_least_recently_used(self):
+        cache = LocationTemplateCache(maxSize=2)
+        first = cache.get("a{frame}")
+        cache.get("b{frame}")
+        cache.get("a{frame}")
+
+        cache.get("c{frame}")
+
+        assert len(cache) == 2
+        assert cache.get("a{frame}") is first
+        assert cache.stats()["evictions"] == 1
+        cache.get("b{frame}")
+        assert cache.stats() == {"hits": 2, "misses": 4, "evictions": 2, "size": 2, "maxSize": 2}
+
+    def test_when_invalid_then_raises_ValueError_and_not_cached(self):
+        cache = LocationTemplateCache()
+
+        with pytest.raises(ValueError):
+            cache.get("image.{0}.exr")
+
+        assert len(cache) == 0
+
+    def test_clear_resets_templates_and_counters(self):
+        cache = LocationTemplateCache()
+        cache.get("a{frame}")
+        cache.get("a{frame}")
+
+        cache.clear()
+
+        assert cache.stats() == {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "size": 0,
+            "maxSize": 1024,
+        }
+
+    def test_when_max_size_not_positive_then_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            LocationTemplateCache(maxSize=0)
+
+
+class Test_compileTemplate:
+    def test_uses_default_cache(self):
+        locationTemplate.kDefaultCache.clear()
+
+        template = compileTemplate("file:///image.{view}.exr")
+
+        assert compileTemplate("file:///image.{view}.exr") is template
+        assert not template.needsFrame
+        assert template.needsView
+        assert locationTemplate.kDefaultCache.stats()["hits"] == 1
+
+
+class Test_substitute:
+    def test_substitutes_using_cached_template(self):
+        locationTemplate.kDefaultCache.clear()
+
+        assert substitute("file:///{view}.{frame:03d}.exr", 1, "l") == "file:///l.001.exr"
+        assert substitute("file:///{view}.{frame:03d}.exr", 2, "r") == "file:///r.002.exr"
+        assert locationTemplate.kDefaultCache.stats()["misses"] == 1
+
+
+class Test_frameRange:
+    def test_when_start_and_end_then_inclusive_range(self):
+        data = TraitsData()
+        trait = FrameRangedTrait_v1(data)
+        trait.setStartFrame(1001)
+        trait.setEndFrame(1100)
+
+        assert frameRange(data) == range(1001, 1101)
+
+    def test_when_in_and_out_then_used_in_preference(self):
+        data = TraitsData()
+        trait = FrameRangedTrait_v1(data)
+        trait.setStartFrame(1001)
+        trait.setEndFrame(1100)
+        trait.setInFrame(1010)
+        trait.setOutFrame(1020)
+
+        assert frameRange(data) == range(1010, 1021)
+
+    def test_when_step_then_aligned_to_start_frame(self):
+        data = TraitsData()
+        trait = FrameRangedTrait_v1(data)
+        trait.setStartFrame(21)
+        trait.setEndFrame(100)
+        trait.setInFrame(35)
+        trait.setStep(10)
+
+        assert list(frameRange(data)) == [41, 51, 61, 71, 81, 91]
+
+    def test_when_no_frames_then_raises_ValueError(self):
+        data = TraitsData()
+        FrameRangedTrait_v1(data).setStartFrame(1)
+
+        with pytest.raises(ValueError):
+            frameRange(data)
+
+    def test_when_step_not_positive_then_raises_ValueError(self):
+        data = TraitsData()
+        trait = FrameRangedTrait_v1(data)
+        trait.setStartFrame(1)
+        trait.setEndFrame(2)
+        trait.setStep(0)
+
+        with pytest.raises(ValueError):
+            frameRange(data)
+
+
+class Test_iterLocations:
+    def test_when_not_templated_then_yields_location_once(self):
+        data = TraitsData()
+        LocatableContentTrait_v1(data).setLocation("file:///image.{frame}.exr")
+
+        assert list(iterLocations(data)) == [(None, None, "file:///image.{frame}.exr")]
+
+    def test_when_templated_then_expands_frames_and_views(self):
+        data = TraitsData()
+        locatable = LocatableContentTrait_v1(data)
+        locatable.setLocation("file:///image.{frame:04d}.{view}.exr")
+        locatable.setIsTemplated(True)
+        frameRanged = FrameRangedTrait_v1(data)
+        frameRanged.setStartFrame(1)
+        frameRanged.setEndFrame(2)
+
+        assert list(iterLocations(data, ["l", "r"])) == [
+            ("l", 1, "file:///image.0001.l.exr"),
+            ("l", 2, "file:///image.0002.l.exr"),
+            ("r", 1, "file:///image.0001.r.exr"),
+            ("r", 2, "file:///image.0002.r.exr"),
+        ]
+
+    def test_when_templated_view_only_then_frame_is_None(self):
+        data = TraitsData()
+        locatable = LocatableContentTrait_v1(data)
+        locatable.setLocation("file:///image.{view}.exr")
+        locatable.setIsTemplated(True)
+
+        assert list(iterLocations(data, ["l"])) == [("l", None, "file:///image.l.exr")]
+
+    def test_when_views_required_but_not_supplied_then_raises_ValueError(self):
+        data = TraitsData()
+        locatable = LocatableContentTrait_v1(data)
+        locatable.setLocation("file:///image.{view}.exr")
+        locatable.setIsTemplated(True)
+
+        with pytest.raises(ValueError):
+            list(iterLocations(data))
+
+    def test_when_unknown_variable_then_raises_ValueError(self):
+        data = TraitsData()
+        locatable = LocatableContentTrait_v1(data)
+        locatable.setLocation("file:///{shot}/image.exr")
+        locatable.setIsTemplated(True)
+
+        with pytest.raises(ValueError):
+            list(iterLocations(data))
+
+    def test_when_no_location_then_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            list(iterLocations(TraitsData()))
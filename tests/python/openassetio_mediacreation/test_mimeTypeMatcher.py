@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests for the compiled MIME type matcher.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pytest
+
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation import mimeTypeMatcher
+from openassetio_mediacreation.mimeTypeMatcher import (
+    MimeTypeMatcher,
+    MimeTypeMatcherCache,
+    compileMatcher,
+    matches,
+)
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+
+
+class Test_MimeTypeMatcher_compile:
+    def test_buckets_exact_types_and_wildcards(self):
+        matcher = MimeTypeMatcher("image/*, video/MP4; codecs=avc1,image/png")
+
+        assert matcher.exactTypes == {"video/mp4", "image/png"}
+        assert matcher.wildcardMajors == {"image"}
+        assert not matcher.matchesAll
+
+    @pytest.mark.parametrize("predicate", ["*/*", "*", "image/png,*/*"])
+    def test_when_any_wildcard_then_matches_all(self, predicate):
+        assert MimeTypeMatcher(predicate).matchesAll
+
+    @pytest.mark.parametrize("predicate", ["", " , ", "image", "image/", "/png", "*/png", "a/b/c"])
+    def test_when_invalid_then_raises_ValueError(self, predicate):
+        with pytest.raises(ValueError):
+            MimeTypeMatcher(predicate)
+
+
+class Test_MimeTypeMatcher_matches:
+    @pytest.mark.parametrize(
+        "mimeType",
+        ["image/png", "IMAGE/PNG", "image/jpeg", "image/*", "text/plain,video/mp4", "video/mp4"],
+    )
+    def test_when_matching_then_true(self, mimeType):
+        assert MimeTypeMatcher("image/*,video/mp4").matches(mimeType)
+
+    @pytest.mark.parametrize("mimeType", ["video/quicktime", "text/plain", "audio/*,text/plain"])
+    def test_when_not_matching_then_false(self, mimeType):
+        assert not MimeTypeMatcher("image/*,video/mp4").matches(mimeType)
+
+    def test_when_wildcard_mime_type_then_matches_exact_type_with_same_major(self):
+        matcher = MimeTypeMatcher("video/mp4")
+
+        assert matcher.matches("video/*")
+        assert matcher.matches("*/*")
+        assert not matcher.matches("image/*")
+
+    @pytest.mark.parametrize("mimeType", [None, ""])
+    def test_when_missing_then_false(self, mimeType):
+        assert not MimeTypeMatcher("*/*").matches(mimeType)
+
+    @pytest.mark.parametrize("predicate", ["image/png", "image/*", "*/*"])
+    def test_when_invalid_then_raises_ValueError(self, predicate):
+        with pytest.raises(ValueError):
+            MimeTypeMatcher(predicate).matches("not a mime")
+
+
+class Test_MimeTypeMatcher_batch:
+    def test_batchMatches_returns_mask(self):
+        matcher = MimeTypeMatcher("image/*")
+
+        assert matcher.batchMatches(["image/png", None, "video/mp4", "image/png"]) == [
+            True,
+            False,
+            False,
+            True,
+        ]
+
+    def test_batchMatchesTraitsData_reads_mime_type(self):
+        datas = [TraitsData() for _ in range(3)]
+        LocatableContentTrait_v1(datas[0]).setMimeType("image/exr")
+        LocatableContentTrait_v1(datas[1]).setMimeType("text/plain")
+
+        assert MimeTypeMatcher("image/*").batchMatchesTraitsData(datas) == [True, False, False]
+
+    @pytest.mark.parametrize("predicate", ["image/*", "*/*"])
+    def test_when_mime_type_invalid_then_not_matched(self, predicate):
+        assert MimeTypeMatcher(predicate).batchMatches(["image/png", "jpeg", "image/png"]) == [
+            True,
+            False,
+            True,
+        ]
+
+    def test_batchMatchesTraitsData_when_mime_type_invalid_then_not_matched(self):
+        datas = [TraitsData() for _ in range(3)]
+        for data, mimeType in zip(datas, ["image/png", "jpeg", "video/mp4"]):
+            LocatableContentTrait_v1(data).setMimeType(mimeType)
+
+        assert MimeTypeMatcher("image/*,video/*").batchMatchesTraitsData(datas) == [
+            True,
+            False,
+            True,
+        ]
+
+    def test_when_mime_type_wrong_type_then_raises_TypeError(self):
+        data = TraitsData()
+        data.setTraitProperty(LocatableContentTrait_v1.kId, "mimeType", 1)
+
+        with pytest.raises(TypeError):
+            MimeTypeMatcher("image/*").batchMatchesTraitsData([data])
+
+
+class Test_MimeTypeMatcherCache:
+    def test_when_predicate_repeated_then_matcher_reused(self):
+        cache = MimeTypeMatcherCache()
+
+        matcher = cache.get("image/*")
+
+        assert cache.get("image/*") is matcher
+        assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1, "maxSize": 256}
+
+    def test_when_full_then_evicts_least_recently_used(self):
+        cache = MimeTypeMatcherCache(maxSize=2)
+        first = cache.get("a/*")
+        cache.get("b/*")
+        cache.get("a/*")
+
+        cache.get("c/*")
+
+        assert len(cache) == 2
+        assert cache.get("a/*") is first
+        assert cache.stats()["evictions"] == 1
+
+    def test_when_invalid_then_raises_ValueError_and_not_cached(self):
+        cache = MimeTypeMatcherCache()
+
+        with pytest.raises(ValueError):
+            cache.get("image")
+
+        assert len(cache) == 0
+
+    def test_clear_resets_matchers_and_counters(self):
+        cache = MimeTypeMatcherCache()
+        cache.get("a/*")
+        cache.get("a/*")
+
+        cache.clear()
+
+        assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "maxSize": 256}
+
+    def test_when_max_size_not_positive_then_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            MimeTypeMatcherCache(maxSize=0)
+
+
+class Test_compileMatcher:
+    def test_uses_default_cache(self):
+        mimeTypeMatcher.kDefaultCache.clear()
+
+        matcher = compileMatcher("image/*")
+
+        assert compileMatcher("image/*") is matcher
+        assert mimeTypeMatcher.kDefaultCache.stats()["hits"] == 1
+
+
+class Test_matches:
+    def test_matches_using_cached_matcher(self):
+        mimeTypeMatcher.kDefaultCache.clear()
+
+        assert matches("image/*", "image/png")
+        assert not matches("image/*", "video/mp4")
+        assert mimeTypeMatcher.kDefaultCache.stats()["misses"] == 1
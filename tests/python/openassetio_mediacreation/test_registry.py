@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests the generated trait registry.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import inspect
+
+from openassetio_mediacreation import registry, traits
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+from openassetio_mediacreation.traits.usage import EntityTrait_v1
+
+
+class Test_registry_kTraits:
+    def test_contains_every_trait_view_class(self):
+        expected = {}
+        for namespaceName, namespace in inspect.getmembers(traits, inspect.ismodule):
+            for name, cls in inspect.getmembers(namespace, inspect.isclass):
+                if "_v" in name:
+                    expected[cls.kId] = (namespaceName, name)
+
+        assert {
+            traitId: (info.namespace, info.className) for traitId, info in registry.kTraits.items()
+        } == expected
+
+    def test_entries_are_keyed_by_id(self):
+        for traitId, info in registry.kTraits.items():
+            assert info.id == traitId
+
+    def test_entry_describes_trait(self):
+        info = registry.kTraits[FrameRangedTrait_v1.kId]
+
+        assert info.namespace == "timeDomain"
+        assert info.name == "FrameRanged"
+        assert info.version == 1
+        assert info.className == "FrameRangedTrait_v1"
+        assert info.properties == {
+            "endFrame": int,
+            "framesPerSecond": float,
+            "inFrame": int,
+            "outFrame": int,
+            "startFrame": int,
+            "step": int,
+        }
+
+    def test_trait_without_properties_has_empty_schema(self):
+        assert registry.kTraits[EntityTrait_v1.kId].properties == {}
+
+
+class Test_registry_traitInfo:
+    def test_when_known_then_returns_entry(self):
+        assert registry.traitInfo(LocatableContentTrait_v1.kId) is (
+            registry.kTraits[LocatableContentTrait_v1.kId]
+        )
+
+    def test_when_unknown_then_returns_None(self):
+        assert registry.traitInfo("some:unknown.Trait") is None
+
+
+class Test_registry_viewClass:
+    def test_when_known_then_returns_versioned_view_class(self):
+        assert registry.viewClass(LocatableContentTrait_v1.kId) is LocatableContentTrait_v1
+
+    def test_when_unknown_then_returns_None(self):
+        assert registry.viewClass("some:unknown.Trait") is None
+
+
+class Test_registry_viewClasses:
+    def test_returns_view_classes_for_known_ids_only(self):
+        traitSet = {LocatableContentTrait_v1.kId, EntityTrait_v1.kId, "some:unknown.Trait"}
+
+        assert registry.viewClasses(traitSet) == {
+            LocatableContentTrait_v1.kId: LocatableContentTrait_v1,
+            EntityTrait_v1.kId: EntityTrait_v1,
+        }
@@ -0,0 +1,261 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests for the streaming paged relationship helpers.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import threading
+import time
+
+import pytest
+
+from openassetio import EntityReference
+from openassetio.access import RelationsAccess
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation.relationshipPaging import PageSizer, iterPages, iterReferences
+from openassetio_mediacreation.specifications.lifecycle import (
+    EntityVersionsRelationshipSpecification_v1,
+)
+
+
+class FakePager:
+    def __init__(self, refs, pageSize, failAfter=None):
+        self.refs = refs
+        self.pageSize = pageSize
+        self.failAfter = failAfter
+        self.offset = 0
+        self.numNexts = 0
+
+    def hasNext(self):
+        return self.offset + self.pageSize < len(self.refs)
+
+    def get(self):
+        return self.refs[self.offset : self.offset + self.pageSize]
+
+    def next(self):
+        if self.numNexts == self.failAfter:
+            raise RuntimeError("Pager failed")
+        self.numNexts += 1
+        self.offset += self.pageSize
+
+
+class FakeManager:
+    def __init__(self, numRefs, failAfter=None):
+        self.refs = [EntityReference(f"ref:v{index}") for index in range(numRefs)]
+        self.failAfter = failAfter
+        self.calls = []
+        self.pagers = []
+
+    def getWithRelationship(self, ref, traitsData, pageSize, access, context, resultTraitSet):
+        # pylint: disable=too-many-arguments
+        self.calls.append((ref, traitsData, pageSize, access, context, resultTraitSet))
+        pager = FakePager(self.refs, pageSize, self.failAfter)
+        self.pagers.append(pager)
+        return pager
+
+
+def pages(manager, **kwargs):
+    kwargs.setdefault("pageSizer", PageSizer(initialPageSize=10))
+    return iterPages(
+        manager,
+        EntityReference("ref:entity"),
+        EntityVersionsRelationshipSpecification_v1.create(),
+        None,
+        **kwargs,
+    )
+
+
+def waitFor(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def prefetchThreads():
+    return [thread for thread in threading.enumerate() if thread.name == "iterPages prefetch"]
+
+
+class Test_iterPages:
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test_yields_all_pages_in_order(self, prefetch):
+        manager = FakeManager(25)
+
+        result = list(pages(manager, prefetch=prefetch))
+
+        assert [len(page) for page in result] == [10, 10, 5]
+        assert [ref for page in result for ref in page] == manager.refs
+
+    def test_queries_relationship_of_specification(self):
+        manager = FakeManager(1)
+
+        list(pages(manager, resultTraitSet={"a"}, relationsAccess=RelationsAccess.kWrite))
+
+        ref, traitsData, pageSize, access, _, resultTraitSet = manager.calls[0]
+        assert ref == EntityReference("ref:entity")
+        assert traitsData == EntityVersionsRelationshipSpecification_v1.create().traitsData()
+        assert pageSize == 10
+        assert access == RelationsAccess.kWrite
+        assert resultTraitSet == {"a"}
+
+    def test_when_relationship_is_traits_data_then_used_directly(self):
+        manager = FakeManager(1)
+        traitsData = TraitsData({"a"})
+
+        list(iterPages(manager, EntityReference("ref:entity"), traitsData, None))
+
+        assert manager.calls[0][1] is traitsData
+
+    def test_when_no_results_then_yields_nothing(self):
+        assert not list(pages(FakeManager(0)))
+
+    def test_when_limit_then_truncated(self):
+        manager = FakeManager(25)
+
+        result = list(pages(manager, limit=15))
+
+        assert [len(page) for page in result] == [10, 5]
+
+    def test_when_limit_smaller_than_page_then_single_small_page_requested(self):
+        manager = FakeManager(25)
+
+        result = list(pages(manager, limit=3))
+
+        assert result == [manager.refs[:3]]
+        assert manager.calls[0][2] == 3
+        assert manager.pagers[0].numNexts == 0
+
+    def test_when_not_prefetching_then_pages_retrieved_on_demand(self):
+        manager = FakeManager(100)
+        generator = pages(manager, prefetch=0)
+
+        next(generator)
+        next(generator)
+
+        assert manager.pagers[0].numNexts == 1
+
+    def test_when_prefetching_then_bounded_number_of_pages_retrieved_ahead(self):
+        manager = FakeManager(100)
+        generator = pages(manager, prefetch=2)
+
+        next(generator)
+
+        # Two queued, and one waiting to be queued.
+        waitFor(lambda: manager.pagers[0].numNexts == 3)
+        time.sleep(0.05)
+        assert manager.pagers[0].numNexts == 3
+        generator.close()
+
+    def test_when_closed_then_prefetching_stops(self):
+        generator = pages(FakeManager(100), prefetch=1)
+        next(generator)
+
+        generator.close()
+
+        waitFor(lambda: not prefetchThreads())
+
+    def test_when_pager_fails_then_error_raised_in_order(self):
+        generator = pages(FakeManager(100, failAfter=1))
+
+        assert len(next(generator)) == 10
+        assert len(next(generator)) == 10
+        with pytest.raises(RuntimeError):
+            next(generator)
+
+    @pytest.mark.parametrize("kwargs", [{"limit": 0}, {"prefetch": -1}])
+    def test_when_invalid_then_raises_ValueError(self, kwargs):
+        with pytest.raises(ValueError):
+            next(pages(FakeManager(1), **kwargs))
+
+    def test_records_latency_with_page_sizer(self):
+        sizer = PageSizer(targetLatency=10, initialPageSize=10)
+
+        list(pages(FakeManager(25), pageSizer=sizer))
+
+        assert sizer.pageSize > 10
+
+
+class Test_iterReferences:
+    def test_yields_references_across_pages(self):
+        manager = FakeManager(25)
+
+        refs = list(
+            iterReferences(
+                manager,
+                EntityReference("ref:entity"),
+                EntityVersionsRelationshipSpecification_v1.create(),
+                None,
+                limit=21,
+                pageSizer=PageSizer(initialPageSize=10),
+            )
+        )
+
+        assert refs == manager.refs[:21]
+
+
+class Test_PageSizer:
+    def test_when_fast_then_grows(self):
+        sizer = PageSizer(targetLatency=0.1, initialPageSize=100)
+
+        sizer.record(100, 100, 0.001)
+
+        assert sizer.pageSize == 200
+
+    def test_when_slow_then_shrinks(self):
+        sizer = PageSizer(targetLatency=0.1, initialPageSize=100)
+
+        sizer.record(100, 100, 1.0)
+
+        assert sizer.pageSize == 50
+
+    def test_converges_on_target_latency(self):
+        sizer = PageSizer(targetLatency=0.1, initialPageSize=10)
+
+        for _ in range(50):
+            pageSize = sizer.pageSize
+            # 20ms per page, plus 0.1ms per reference.
+            sizer.record(pageSize, pageSize, 0.02 + 0.0001 * pageSize)
+
+        assert sizer.pageSize == pytest.approx(800, abs=5)
+
+    def test_when_partial_page_fast_then_ignored(self):
+        sizer = PageSizer(initialPageSize=100)
+
+        sizer.record(100, 5, 0.001)
+
+        assert sizer.pageSize == 100
+
+    def test_clamped_to_bounds(self):
+        sizer = PageSizer(initialPageSize=20, minPageSize=10, maxPageSize=30)
+
+        sizer.record(20, 20, 0.0)
+        assert sizer.pageSize == 30
+        for _ in range(5):
+            sizer.record(20, 20, 100.0)
+        assert sizer.pageSize == 10
+
+    def test_reset_reverts_to_initial_page_size(self):
+        sizer = PageSizer(initialPageSize=100)
+        sizer.record(100, 100, 0.0)
+
+        sizer.reset()
+
+        assert sizer.pageSize == 100
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"targetLatency": 0},
+            {"minPageSize": 0, "initialPageSize": 1},
+            {"minPageSize": 20, "initialPageSize": 10},
+            {"initialPageSize": 10, "maxPageSize": 5},
+        ],
+    )
+    def test_when_invalid_then_raises_ValueError(self, kwargs):
+        with pytest.raises(ValueError):
+            PageSizer(**kwargs)
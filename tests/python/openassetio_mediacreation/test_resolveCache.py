@@ -0,0 +1,292 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests for the version-aware resolve cache.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pytest
+
+from openassetio import EntityReference, errors
+from openassetio.access import ResolveAccess
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation.resolveCache import ResolveCache
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+from openassetio_mediacreation.traits.lifecycle import VersionTrait_v1
+
+kTraitSet = {LocatableContentTrait_v1.kId}
+
+
+class FakeManager:
+    """
+    Resolves "ref:<name>@<tag>" references, where a tag starting with a
+    digit is stable, and "ref:missing" fails.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def resolve(self, refs, traitSet, access, context, successCallback, errorCallback):
+        # pylint: disable=too-many-arguments,unused-argument
+        self.calls.append(([ref.toString() for ref in refs], set(traitSet)))
+        for index, ref in enumerate(refs):
+            name, _, tag = ref.toString().partition("@")
+            if name == "ref:missing":
+                errorCallback(
+                    index,
+                    errors.BatchElementError(
+                        errors.BatchElementError.ErrorCode.kEntityResolutionError, "missing"
+                    ),
+                )
+                continue
+            data = TraitsData()
+            LocatableContentTrait_v1(data).setLocation(f"file:///{name[4:]}")
+            if tag and VersionTrait_v1.kId in traitSet:
+                version = VersionTrait_v1(data)
+                version.setSpecifiedTag(tag)
+                version.setStableTag(tag if tag[0].isdigit() else "3")
+            successCallback(index, data)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def refs(*strings):
+    return [EntityReference(string) for string in strings]
+
+
+@pytest.fixture
+def manager():
+    return FakeManager()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(manager, clock):
+    return ResolveCache(manager, dynamicTtl=10, clock=clock)
+
+
+def resolve(cache, *strings):
+    return cache.batchResolve(refs(*strings), kTraitSet, ResolveAccess.kRead, None)
+
+
+class Test_ResolveCache_batchResolve:
+    def test_when_cached_then_manager_not_called(self, cache, manager):
+        first = resolve(cache, "ref:a@1", "ref:b@2")
+
+        second = resolve(cache, "ref:b@2", "ref:a@1")
+
+        assert len(manager.calls) == 1
+        assert second == [first[1], first[0]]
+        assert LocatableContentTrait_v1(second[0]).getLocation() == "file:///b"
+
+    def test_only_misses_resolved_in_single_batch(self, cache, manager):
+        resolve(cache, "ref:a@1")
+
+        resolve(cache, "ref:a@1", "ref:b@1", "ref:c@1", "ref:b@1")
+
+        assert manager.calls[1][0] == ["ref:b@1", "ref:c@1"]
+
+    def test_requests_version_trait_in_addition(self, cache, manager):
+        resolve(cache, "ref:a")
+
+        assert manager.calls[0][1] == kTraitSet | {VersionTrait_v1.kId}
+
+    def test_keyed_by_trait_set_and_access(self, cache, manager):
+        resolve(cache, "ref:a@1")
+
+        cache.batchResolve(refs("ref:a@1"), set(), ResolveAccess.kRead, None)
+        cache.batchResolve(refs("ref:a@1"), kTraitSet, ResolveAccess.kManagerDriven, None)
+
+        assert len(manager.calls) == 3
+
+    def test_returns_copies(self, cache):
+        resolve(cache, "ref:a@1")[0].setTraitProperty("x", "y", 1)
+
+        assert not resolve(cache, "ref:a@1")[0].hasTrait("x")
+
+    def test_when_error_then_raises_and_successes_cached(self, cache, manager):
+        with pytest.raises(errors.BatchElementException) as exc:
+            resolve(cache, "ref:a@1", "ref:missing", "ref:missing")
+
+        assert exc.value.index == 1
+        resolve(cache, "ref:a@1")
+        assert len(manager.calls) == 1
+
+    def test_resolve_returns_single_result(self, cache):
+        data = cache.resolve(EntityReference("ref:a@1"), kTraitSet, ResolveAccess.kRead, None)
+
+        assert LocatableContentTrait_v1(data).getLocation() == "file:///a"
+
+
+class Test_ResolveCache_expiry:
+    def test_when_stable_then_never_expires(self, cache, manager, clock):
+        resolve(cache, "ref:a@1")
+        clock.now = 1e9
+
+        resolve(cache, "ref:a@1")
+
+        assert len(manager.calls) == 1
+        assert cache.stats()["stableSize"] == 1
+
+    @pytest.mark.parametrize("reference", ["ref:a@latest", "ref:a"])
+    def test_when_dynamic_then_expires_after_ttl(self, cache, manager, clock, reference):
+        resolve(cache, reference)
+        clock.now = 9.9
+        resolve(cache, reference)
+        clock.now = 10
+
+        resolve(cache, reference)
+
+        assert len(manager.calls) == 2
+        assert cache.stats()["expirations"] == 1
+
+    def test_when_ttl_none_then_dynamic_never_expires(self, manager, clock):
+        cache = ResolveCache(manager, dynamicTtl=None, clock=clock)
+        resolve(cache, "ref:a@latest")
+        clock.now = 1e9
+
+        resolve(cache, "ref:a@latest")
+
+        assert len(manager.calls) == 1
+
+    def test_when_ttl_zero_then_dynamic_not_cached(self, manager, clock):
+        cache = ResolveCache(manager, dynamicTtl=0, clock=clock)
+
+        resolve(cache, "ref:a@latest", "ref:b@1")
+
+        assert cache.stats()["size"] == 1
+
+    def test_when_marked_stable_then_never_expires(self, cache, manager, clock):
+        resolve(cache, "ref:a@latest")
+        cache.markStable(refs("ref:a@latest", "ref:b@latest"))
+        resolve(cache, "ref:b@latest")
+        clock.now = 1e9
+
+        resolve(cache, "ref:a@latest", "ref:b@latest")
+
+        assert len(manager.calls) == 2
+        assert cache.stats()["stableSize"] == 2
+
+
+class Test_ResolveCache_invalidation:
+    def test_invalidate_removes_all_results_for_references(self, cache, manager):
+        resolve(cache, "ref:a@1", "ref:b@1")
+        cache.batchResolve(refs("ref:a@1"), set(), ResolveAccess.kRead, None)
+
+        assert cache.invalidate(refs("ref:a@1", "ref:c@1")) == 2
+
+        assert len(cache) == 1
+        resolve(cache, "ref:a@1")
+        assert manager.calls[-1][0] == ["ref:a@1"]
+
+    def test_invalidateDynamic_removes_only_dynamic_results(self, cache):
+        resolve(cache, "ref:a@1", "ref:b@latest", "ref:c")
+
+        assert cache.invalidateDynamic() == 2
+
+        assert len(cache) == 1
+
+
+class Test_ResolveCache_budget:
+    def test_when_over_budget_then_evicts_least_recently_used(self, manager):
+        cache = ResolveCache(manager)
+        resolve(cache, "ref:a@1")
+        entrySize = cache.stats()["bytes"]
+        cache = ResolveCache(manager, maxBytes=entrySize * 2)
+        resolve(cache, "ref:a@1", "ref:b@1")
+        resolve(cache, "ref:a@1")
+
+        resolve(cache, "ref:c@1")
+
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] == entrySize * 2
+        resolve(cache, "ref:a@1")
+        assert stats["hits"] + 1 == cache.stats()["hits"]
+
+    def test_when_result_larger_than_budget_then_not_cached(self, manager):
+        cache = ResolveCache(manager, maxBytes=1)
+
+        resolve(cache, "ref:a@1")
+
+        assert len(cache) == 0
+
+    def test_when_results_removed_then_trait_sets_not_retained(self, manager):
+        # pylint: disable=protected-access
+        cache = ResolveCache(manager)
+        resolve(cache, "ref:a@1")
+        cache = ResolveCache(manager, maxBytes=cache.stats()["bytes"])
+
+        for index in range(10):
+            cache.batchResolve(refs("ref:a@1"), {f"trait{index}"}, ResolveAccess.kRead, None)
+        assert len(cache._ResolveCache__requests) == 1
+
+        cache.invalidate(refs("ref:a@1"))
+        assert not cache._ResolveCache__requests
+
+        cache = ResolveCache(manager)
+        resolve(cache, "ref:b@latest")
+        cache.invalidateDynamic()
+        assert not cache._ResolveCache__requests
+
+    def test_when_last_result_expires_then_recached(self, cache, manager, clock):
+        resolve(cache, "ref:a@latest")
+        clock.now = 11
+
+        resolve(cache, "ref:a@latest")
+        resolve(cache, "ref:a@latest")
+
+        assert len(manager.calls) == 2
+        assert len(cache) == 1
+
+    @pytest.mark.parametrize("kwargs", [{"maxBytes": 0}, {"dynamicTtl": -1}])
+    def test_when_invalid_then_raises_ValueError(self, manager, kwargs):
+        with pytest.raises(ValueError):
+            ResolveCache(manager, **kwargs)
+
+
+class Test_ResolveCache_stats:
+    def test_counts_hits_and_misses(self, cache):
+        resolve(cache, "ref:a@1", "ref:b@1")
+        resolve(cache, "ref:a@1", "ref:b@1", "ref:c@1")
+
+        stats = cache.stats()
+
+        assert (stats["hits"], stats["misses"], stats["size"]) == (2, 3, 3)
+        assert cache.hitRate == pytest.approx(0.4)
+
+    def test_clear_resets_results_markings_and_counters(self, cache, manager, clock):
+        cache.markStable(refs("ref:a@latest"))
+        resolve(cache, "ref:a@latest")
+
+        cache.clear()
+
+        assert cache.stats() == {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "size": 0,
+            "stableSize": 0,
+            "bytes": 0,
+            "maxBytes": 64 * 1024 * 1024,
+        }
+        assert cache.hitRate == 0
+        resolve(cache, "ref:a@latest")
+        clock.now = 10
+        resolve(cache, "ref:a@latest")
+        assert len(manager.calls) == 3
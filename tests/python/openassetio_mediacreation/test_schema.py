@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests the generated, precompiled package schema.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import os
+import subprocess
+import sys
+
+import pytest
+import yaml
+
+import openassetio_mediacreation
+from openassetio_mediacreation import registry, schema
+from openassetio_mediacreation.specifications.twoDimensional import (
+    BitmapImageResourceSequenceSpecification_v1,
+)
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+from openassetio_mediacreation.traits.usage import EntityTrait_v1, RelationshipTrait_v1
+
+
+@pytest.fixture(scope="module")
+def description():
+    path = os.path.join(os.path.dirname(openassetio_mediacreation.__file__), "traits.yml")
+    with open(path, encoding="utf-8") as file:
+        return yaml.safe_load(file)
+
+
+class Test_traitSchemas:
+    def test_contains_every_registered_trait(self):
+        assert set(schema.traitSchemas()) == set(registry.kTraits)
+
+    def test_property_types_match_registry(self):
+        kTypes = {"string": str, "integer": int, "float": float, "boolean": bool}
+        for traitId, info in registry.kTraits.items():
+            assert {
+                prop.id: kTypes[prop.type] for prop in schema.traitSchema(traitId).properties
+            } == info.properties
+
+    def test_matches_description(self, description):
+        for namespace, namespaceDescription in description["traits"].items():
+            for name, trait in namespaceDescription["members"].items():
+                for version, declaration in trait["versions"].items():
+                    traitSchema = next(
+                        s
+                        for s in schema.traitSchemas().values()
+                        if (s.namespace, s.name, s.version) == (namespace, name, int(version))
+                    )
+                    assert traitSchema.description == declaration["description"].strip()
+                    assert traitSchema.usage == tuple(declaration.get("usage", ()))
+                    assert [prop.id for prop in traitSchema.properties] == sorted(
+                        declaration.get("properties", {})
+                    )
+
+
+class Test_traitSchema:
+    def test_when_known_then_returns_schema(self):
+        traitSchema = schema.traitSchema(FrameRangedTrait_v1.kId)
+
+        assert traitSchema.id == FrameRangedTrait_v1.kId
+        assert traitSchema.namespace == "timeDomain"
+        assert traitSchema.name == "FrameRanged"
+        assert traitSchema.version == 1
+        assert not traitSchema.deprecated
+
+    def test_when_unknown_then_returns_None(self):
+        assert schema.traitSchema("not:a.Trait") is None
+
+
+class Test_traitProperties:
+    def test_maps_property_name_to_schema(self):
+        properties = schema.traitProperties(FrameRangedTrait_v1.kId)
+
+        assert properties["framesPerSecond"].type == "float"
+        assert properties["startFrame"].type == "integer"
+        assert properties["startFrame"].description
+
+    def test_when_no_properties_then_empty(self):
+        assert schema.traitProperties(EntityTrait_v1.kId) == {}
+
+    def test_when_unknown_then_returns_None(self):
+        assert schema.traitProperties("not:a.Trait") is None
+
+
+class Test_traitUsage:
+    def test_returns_usage(self):
+        assert schema.traitUsage(RelationshipTrait_v1.kId) == ("relationship",)
+
+    def test_when_unknown_then_returns_None(self):
+        assert schema.traitUsage("not:a.Trait") is None
+
+
+class Test_specificationsWithTrait:
+    def test_returns_specifications_composing_trait(self):
+        assert [
+            spec.className for spec in schema.specificationsWithTrait(FrameRangedTrait_v1.kId)
+        ] == [BitmapImageResourceSequenceSpecification_v1.__name__]
+
+    def test_trait_sets_match_view_classes(self):
+        spec = schema.specificationsWithTrait(FrameRangedTrait_v1.kId)[0]
+
+        assert set(spec.traitSet) == BitmapImageResourceSequenceSpecification_v1.kTraitSet
+
+    def test_when_no_specifications_then_empty(self):
+        assert schema.specificationsWithTrait("not:a.Trait") == ()
+
+
+def test_does_not_import_yaml_or_view_classes():
+    script = (
+        "import sys\n"
+        "from openassetio_mediacreation import schema\n"
+        f"schema.specificationsWithTrait({FrameRangedTrait_v1.kId!r})\n"
+        "print(sorted(m for m in sys.modules if m == 'yaml' or m.endswith('.traits.timeDomain')))\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    )
+
+    assert result.stdout.strip() == "[]"
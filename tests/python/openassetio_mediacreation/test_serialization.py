@@ -0,0 +1,208 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests for the compact binary TraitsData serialization.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+from multiprocessing import shared_memory
+
+import pytest
+
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation import serialization
+from openassetio_mediacreation.specifications.twoDimensional import (
+    BitmapImageResourceSequenceSpecification_v1,
+)
+
+
+@pytest.fixture
+def sequenceData():
+    spec = BitmapImageResourceSequenceSpecification_v1.create()
+    spec.locatableContentTrait().setLocation("file:///shot/beauty.{frame:04d}.exr")
+    spec.locatableContentTrait().setIsTemplated(True)
+    spec.frameRangedTrait().setStartFrame(1001)
+    spec.frameRangedTrait().setFramesPerSecond(23.976)
+    spec.pixelBasedTrait().setPixelAspectRatio(1.0)
+    return spec.traitsData()
+
+
+class Test_encode_decode:
+    def test_round_trips_package_traits(self, sequenceData):
+        decoded = serialization.decode(serialization.encode([sequenceData]))
+
+        assert decoded == [sequenceData]
+
+    def test_round_trips_many(self, sequenceData):
+        other = TraitsData()
+        other.setTraitProperty("openassetio-mediacreation:identity.DisplayName", "name", "ü ✓")
+
+        decoded = serialization.decode(serialization.encode([sequenceData, other, TraitsData()]))
+
+        assert decoded == [sequenceData, other, TraitsData()]
+
+    def test_round_trips_traits_without_properties(self):
+        data = TraitsData({"openassetio-mediacreation:usage.Entity", "other:package.Trait"})
+
+        assert serialization.decode(serialization.encode([data])) == [data]
+
+    def test_round_trips_differing_value_types_for_same_property(self):
+        first, second = TraitsData(), TraitsData()
+        first.setTraitProperty("other:package.Trait", "value", 1)
+        second.setTraitProperty("other:package.Trait", "value", "one")
+
+        decoded = serialization.decode(serialization.encode([first, second, first]))
+
+        assert decoded == [first, second, first]
+
+    def test_encodes_shared_shape_once(self, sequenceData):
+        single = serialization.encode([sequenceData])
+        double = serialization.encode([sequenceData, sequenceData])
+
+        # The second TraitsData adds only a record, not the shape.
+        assert len(double) - len(single) < len(single) - len(serialization.encode([]))
+
+    def test_round_trips_unknown_traits_and_properties(self):
+        data = TraitsData()
+        data.setTraitProperty("other:package.Trait", "someKey", -(2**63))
+        data.setTraitProperty("openassetio-mediacreation:timeDomain.FrameRanged", "extra", False)
+
+        assert serialization.decode(serialization.encode([data])) == [data]
+
+    def test_round_trips_version_suffixed_ids_exactly(self):
+        data = TraitsData()
+        data.setTraitProperty("openassetio-mediacreation:timeDomain.FrameRanged", "step", 1)
+        data.setTraitProperty("openassetio-mediacreation:timeDomain.FrameRanged.v2", "step", 2)
+
+        (decoded,) = serialization.decode(serialization.encode([data]))
+
+        assert decoded.traitSet() == {
+            "openassetio-mediacreation:timeDomain.FrameRanged",
+            "openassetio-mediacreation:timeDomain.FrameRanged.v2",
+        }
+        assert decoded == data
+
+    def test_uses_compact_codes_for_package_traits(self, sequenceData):
+        encoded = serialization.encode([sequenceData])
+
+        assert b"openassetio-mediacreation" not in encoded
+        assert b"location" not in encoded
+
+    def test_accepts_memoryview(self, sequenceData):
+        encoded = serialization.encode([sequenceData])
+
+        assert serialization.decode(memoryview(encoded)) == [sequenceData]
+
+    def test_when_value_type_unsupported_then_raises_TypeError(self):
+        with pytest.raises(TypeError):
+            serialization.encode([_TraitsDataWith("a", "b", object())])
+
+    def test_when_int_too_large_then_raises_TypeError(self):
+        with pytest.raises(TypeError):
+            serialization.encode([_TraitsDataWith("a", "b", 2**64)])
+
+
+class Test_decode_errors:
+    def test_when_not_an_encoding_then_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            serialization.decode(b"not a buffer")
+
+    def test_when_truncated_then_raises_ValueError(self, sequenceData):
+        encoded = serialization.encode([sequenceData])
+
+        with pytest.raises(ValueError):
+            serialization.decode(encoded[:-3])
+
+    def test_when_trailing_data_then_raises_ValueError(self, sequenceData):
+        with pytest.raises(ValueError):
+            serialization.decode(serialization.encode([sequenceData]) + b"\0")
+
+    def test_when_schema_differs_then_raises_ValueError(self, sequenceData):
+        encoded = bytearray(serialization.encode([sequenceData]))
+        encoded[5] ^= 0xFF
+
+        with pytest.raises(ValueError, match="different version"):
+            serialization.decode(encoded)
+
+    def test_when_value_type_unknown_then_raises_ValueError_and_releases_buffer(self):
+        key = "corruptKey"
+        data = TraitsData()
+        data.setTraitProperty("other:package.Trait", key, "value")
+        encoded = serialization.encode([data])
+        # The property's type tag immediately precedes its (unknown,
+        # so inline) key's length and UTF-8 bytes.
+        tagOffset = encoded.index(len(key).to_bytes(4, "little") + key.encode()) - 1
+
+        shm = shared_memory.SharedMemory(create=True, size=len(encoded))
+        try:
+            shm.buf[: len(encoded)] = encoded
+            shm.buf[tagOffset] = 250
+
+            try:
+                serialization.Reader(shm.buf)
+            except ValueError as exc:
+                assert "unknown value type" in str(exc)
+                # Whilst the exception (and so the reader's frame) is
+                # alive. Raises BufferError if the reader leaked a view.
+                shm.close()
+            else:
+                pytest.fail("Expected ValueError")
+        finally:
+            shm.unlink()
+
+
+class Test_single:
+    def test_round_trips(self, sequenceData):
+        encoded = serialization.encodeTraitsData(sequenceData)
+
+        assert serialization.decodeTraitsData(encoded) == sequenceData
+
+    def test_when_multiple_then_raises_ValueError(self, sequenceData):
+        with pytest.raises(ValueError):
+            serialization.decodeTraitsData(serialization.encode([sequenceData] * 2))
+
+
+class Test_Reader:
+    def test_decodes_each_by_offset(self, sequenceData):
+        other = TraitsData({"other:package.Trait"})
+        encoded, offsets = serialization.encodeIndexed([sequenceData, other, sequenceData])
+        reader = serialization.Reader(encoded)
+
+        assert len(reader) == 3
+        assert [reader.decodeAt(offset) for offset in reversed(offsets)] == [
+            sequenceData,
+            other,
+            sequenceData,
+        ]
+
+    def test_when_offset_invalid_then_raises_ValueError(self, sequenceData):
+        encoded, offsets = serialization.encodeIndexed([sequenceData])
+        reader = serialization.Reader(encoded)
+
+        with pytest.raises(ValueError):
+            reader.decodeAt(0)
+        with pytest.raises(ValueError):
+            reader.decodeAt(offsets[0] + len(encoded))
+
+
+class _TraitsDataWith:
+    """
+    A stand-in for TraitsData holding a value that TraitsData itself
+    would not accept.
+    """
+
+    def __init__(self, traitId, key, value):
+        self.__traitId, self.__key, self.__value = traitId, key, value
+
+    def traitSet(self):
+        return {self.__traitId}
+
+    def traitPropertyKeys(self, _traitId):
+        return {self.__key}
+
+    def getTraitProperty(self, _traitId, _key):
+        return self.__value
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests for batches of TraitsData held in shared memory.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name,redefined-outer-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import pytest
+
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation.sharedTraitsData import SharedTraitsDataBatch
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+
+
+@pytest.fixture
+def traitsDatas():
+    datas = []
+    for index in range(5):
+        data = TraitsData()
+        FrameRangedTrait_v1(data).setStartFrame(1001 + index)
+        datas.append(data)
+    other = TraitsData({"other:package.Trait"})
+    other.setTraitProperty("other:package.Trait", "name", "ü")
+    datas.append(other)
+    return datas
+
+
+@pytest.fixture
+def batch(traitsDatas):
+    with SharedTraitsDataBatch.create(traitsDatas) as batch:
+        yield batch
+
+
+def startFrame(batch, index):
+    return FrameRangedTrait_v1(batch[index]).getStartFrame()
+
+
+class Test_SharedTraitsDataBatch_sequence:
+    def test_has_length_of_input(self, batch, traitsDatas):
+        assert len(batch) == len(traitsDatas)
+
+    def test_items_equal_input(self, batch, traitsDatas):
+        assert list(batch) == traitsDatas
+
+    def test_supports_negative_indices_and_slices(self, batch, traitsDatas):
+        assert batch[-1] == traitsDatas[-1]
+        assert batch[1:4] == traitsDatas[1:4]
+
+    def test_when_index_out_of_range_then_raises_IndexError(self, batch):
+        with pytest.raises(IndexError):
+            _ = batch[len(batch)]
+
+    def test_when_empty_then_has_no_items(self):
+        with SharedTraitsDataBatch.create([]) as batch:
+            assert list(batch) == []
+
+
+class Test_SharedTraitsDataBatch_sharing:
+    def test_pickles_only_name(self, batch):
+        assert len(pickle.dumps(batch)) < 200
+
+    def test_when_unpickled_then_items_equal_input(self, batch, traitsDatas):
+        unpickled = pickle.loads(pickle.dumps(batch))
+
+        assert unpickled is not batch
+        assert list(unpickled) == traitsDatas
+
+    def test_when_attached_repeatedly_then_same_batch_returned(self, batch):
+        assert SharedTraitsDataBatch.attach(batch.name) is SharedTraitsDataBatch.attach(batch.name)
+
+    def test_when_read_by_process_pool_then_items_equal_input(self, batch):
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            startFrames = list(pool.map(startFrame, repeat(batch), range(5)))
+
+        assert startFrames == [1001, 1002, 1003, 1004, 1005]
+
+
+class Test_SharedTraitsDataBatch_close:
+    def test_when_closed_then_indexing_raises_ValueError(self, traitsDatas):
+        batch = SharedTraitsDataBatch.create(traitsDatas)
+        batch.close()
+        batch.unlink()
+
+        assert batch.closed
+        with pytest.raises(ValueError):
+            _ = batch[0]
+
+    def test_when_context_exits_then_unlinked(self, traitsDatas):
+        with SharedTraitsDataBatch.create(traitsDatas) as batch:
+            name = batch.name
+
+        with pytest.raises(FileNotFoundError):
+            SharedTraitsDataBatch.attach(name)
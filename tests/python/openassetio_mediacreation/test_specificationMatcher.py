@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests the generated specification matcher.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import inspect
+
+import pytest
+
+from openassetio_mediacreation import specificationMatcher, specifications
+from openassetio_mediacreation.specifications.twoDimensional import (
+    BitmapImageResourceSpecification_v1,
+    BitmapImageResourceSequenceSpecification_v1,
+    ImageSpecification_v1,
+    PlanarBitmapImageResourceSpecification_v1,
+)
+from openassetio_mediacreation.traits.color import OCIOColorManagedTrait_v1
+
+
+@pytest.fixture
+def allSpecifications():
+    specs = []
+    for _, namespace in inspect.getmembers(specifications, inspect.ismodule):
+        for name, cls in inspect.getmembers(namespace, inspect.isclass):
+            if name.endswith("Specification_v1"):
+                specs.append(cls)
+    return specs
+
+
+class Test_specificationMatcher_kSpecifications:
+    def test_masks_match_specification_trait_sets(self, allSpecifications):
+        byName = {info.className: info for info in specificationMatcher.kSpecifications}
+
+        assert set(byName) == {cls.__name__ for cls in allSpecifications}
+        for cls in allSpecifications:
+            assert byName[cls.__name__].mask == specificationMatcher.traitSetMask(cls.kTraitSet)
+
+    def test_trait_bits_are_unique(self):
+        bits = list(specificationMatcher.kTraitBits.values())
+        assert len(set(bits)) == len(bits)
+        assert specificationMatcher.kUnknownTraitBit not in bits
+
+
+class Test_specificationMatcher_exactMatches:
+    def test_when_trait_set_is_specification_then_matches_it(self, allSpecifications):
+        results = specificationMatcher.exactMatches([cls.kTraitSet for cls in allSpecifications])
+
+        for cls, matches in zip(allSpecifications, results):
+            assert cls in matches
+            for match in matches:
+                assert match.kTraitSet == cls.kTraitSet
+
+    def test_when_trait_set_has_extra_trait_then_no_match(self):
+        traitSet = BitmapImageResourceSpecification_v1.kTraitSet | {OCIOColorManagedTrait_v1.kId}
+
+        assert specificationMatcher.exactMatches([traitSet]) == [()]
+
+    def test_when_trait_set_has_unknown_trait_then_no_match(self):
+        traitSet = BitmapImageResourceSpecification_v1.kTraitSet | {"some:unknown.Trait"}
+
+        assert specificationMatcher.exactMatches([traitSet]) == [()]
+
+    def test_when_empty_then_returns_empty(self):
+        assert specificationMatcher.exactMatches([]) == []
+
+
+class Test_specificationMatcher_supersetMatches:
+    def test_returns_all_satisfied_specifications_in_input_order(self):
+        planar = PlanarBitmapImageResourceSpecification_v1.kTraitSet | {"some:unknown.Trait"}
+
+        results = specificationMatcher.supersetMatches(
+            [planar, set(), BitmapImageResourceSequenceSpecification_v1.kTraitSet]
+        )
+
+        assert set(results[0]) == {
+            ImageSpecification_v1,
+            BitmapImageResourceSpecification_v1,
+            PlanarBitmapImageResourceSpecification_v1,
+        }
+        assert results[1] == ()
+        assert BitmapImageResourceSequenceSpecification_v1 in results[2]
+        assert BitmapImageResourceSpecification_v1 not in results[2]
+
+    def test_agrees_with_subset_test(self, allSpecifications):
+        traitSets = [cls.kTraitSet for cls in allSpecifications]
+
+        results = specificationMatcher.supersetMatches(traitSets)
+
+        for traitSet, matches in zip(traitSets, results):
+            assert set(matches) == {cls for cls in allSpecifications if cls.kTraitSet <= traitSet}
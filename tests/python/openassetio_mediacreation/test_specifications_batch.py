@@ -0,0 +1,186 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests the batch constructors of the generated specification view
+classes.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pytest
+
+from openassetio_mediacreation import registry, specificationMatcher, specifications
+from openassetio_mediacreation.specifications.lifecycle import (
+    StableReferenceRelationshipSpecification_v1,
+)
+from openassetio_mediacreation.specifications.twoDimensional import (
+    BitmapImageResourceSequenceSpecification_v1,
+)
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+from openassetio_mediacreation.traits.twoDimensional import PixelBasedTrait_v1
+
+Sequence = BitmapImageResourceSequenceSpecification_v1
+
+
+class Test_batchCreate_generated:
+    def test_every_specification_has_batchCreate(self):
+        for info in specificationMatcher.kSpecifications:
+            namespace = getattr(specifications, info.namespace)
+            assert hasattr(getattr(namespace, info.className), "batchCreate")
+
+
+class Test_batchCreate:
+    def test_sets_properties_from_columns(self):
+        datas = Sequence.batchCreate(
+            {
+                "frameRanged.startFrame": [1001, 1],
+                "frameRanged.endFrame": [1100, 10],
+                "locatableContent.location": ["file:///a.####.exr", "file:///b.####.exr"],
+                "pixelBased.pixelAspectRatio": [1.0, 2.0],
+            }
+        )
+
+        assert len(datas) == 2
+        assert FrameRangedTrait_v1(datas[1]).getStartFrame() == 1
+        assert FrameRangedTrait_v1(datas[1]).getEndFrame() == 10
+        assert LocatableContentTrait_v1(datas[0]).getLocation() == "file:///a.####.exr"
+        assert PixelBasedTrait_v1(datas[1]).getPixelAspectRatio() == 2.0
+
+    def test_matches_setting_properties_via_views(self):
+        specification = Sequence.create()
+        specification.frameRangedTrait().setStartFrame(1001)
+        specification.locatableContentTrait().setMimeType("image/x-exr")
+
+        datas = Sequence.batchCreate(
+            {"frameRanged.startFrame": [1001], "locatableContent.mimeType": ["image/x-exr"]}
+        )
+
+        assert datas == [specification.traitsData()]
+
+    def test_when_no_columns_then_count_data_with_trait_set(self):
+        datas = Sequence.batchCreate(count=3)
+
+        assert len(datas) == 3
+        assert all(data.traitSet() == Sequence.kTraitSet for data in datas)
+        assert datas[0] is not datas[1]
+
+    def test_when_specification_has_no_properties_then_count_data_with_trait_set(self):
+        datas = StableReferenceRelationshipSpecification_v1.batchCreate(count=2)
+
+        assert [data.traitSet() for data in datas] == [
+            StableReferenceRelationshipSpecification_v1.kTraitSet
+        ] * 2
+
+    def test_when_values_none_then_not_set_but_trait_imbued(self):
+        datas = Sequence.batchCreate({"frameRanged.startFrame": [None, 1]})
+
+        assert FrameRangedTrait_v1(datas[0]).getStartFrame() is None
+        assert all(data.traitSet() == Sequence.kTraitSet for data in datas)
+
+    def test_when_masked_then_not_set(self):
+        datas = Sequence.batchCreate(
+            {"frameRanged.startFrame": [1, 2]},
+            missing={"frameRanged.startFrame": [True, False]},
+        )
+
+        assert FrameRangedTrait_v1(datas[0]).getStartFrame() is None
+        assert FrameRangedTrait_v1(datas[1]).getStartFrame() == 2
+        assert datas[0].hasTrait(FrameRangedTrait_v1.kId)
+
+    def test_when_numpy_arrays_then_values_are_set_as_native_types(self):
+        numpy = pytest.importorskip("numpy")
+
+        datas = Sequence.batchCreate(
+            {
+                "frameRanged.startFrame": numpy.array([1, 2, 3]),
+                "frameRanged.framesPerSecond": numpy.array([24.0, 25.0, numpy.nan]),
+            },
+            missing={"frameRanged.framesPerSecond": numpy.array([False, False, True])},
+        )
+
+        starts, _ = FrameRangedTrait_v1.batchGetStartFrame(datas)
+        assert starts == [1, 2, 3]
+        assert type(starts[0]) is int
+        assert FrameRangedTrait_v1.batchGetFramesPerSecond(datas)[1] == [False, False, True]
+
+    def test_round_trips_batch_getters(self):
+        numpy = pytest.importorskip("numpy")
+        source = Sequence.batchCreate({"frameRanged.endFrame": [10, None, 30]})
+
+        values, missing = FrameRangedTrait_v1.batchGetEndFrame(source, asArray=True)
+        datas = Sequence.batchCreate(
+            {"frameRanged.endFrame": values}, missing={"frameRanged.endFrame": missing}
+        )
+
+        assert isinstance(values, numpy.ndarray)
+        assert datas == source
+
+    def test_when_unknown_column_then_raises_ValueError(self):
+        with pytest.raises(ValueError, match="frameRanged.startFrame"):
+            Sequence.batchCreate({"frameRanged.start": [1]})
+
+    def test_when_mask_without_column_then_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            Sequence.batchCreate(
+                {"frameRanged.startFrame": [1]}, missing={"frameRanged.endFrame": [True]}
+            )
+
+    def test_when_column_lengths_differ_then_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            Sequence.batchCreate(
+                {"frameRanged.startFrame": [1, 2], "frameRanged.endFrame": [1, 2, 3]}
+            )
+
+    def test_when_no_columns_or_count_then_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            Sequence.batchCreate()
+
+    def test_when_value_wrong_type_then_raises_TypeError(self):
+        with pytest.raises(TypeError):
+            Sequence.batchCreate({"frameRanged.startFrame": [1, 2.0]})
+
+
+class Test_batchCreate_validate:
+    def test_when_valid_then_returns_data(self):
+        datas = Sequence.batchCreate(
+            {"frameRanged.startFrame": [1], "frameRanged.endFrame": [10]}, validate=True
+        )
+
+        assert len(datas) == 1
+
+    def test_when_invalid_then_raises_ValueError_detailing_indices(self):
+        with pytest.raises(ValueError) as exc:
+            Sequence.batchCreate(
+                {
+                    "frameRanged.startFrame": [1, 20, 1],
+                    "frameRanged.endFrame": [10, 10, 10],
+                    "pixelBased.displayWindowWidth": [1920, 1920, 0],
+                },
+                validate=True,
+            )
+
+        message = str(exc.value)
+        assert message.startswith("2 of 3 entities are invalid")
+        assert "[1]" in message and "[2]" in message and "[0]" not in message
+
+    def test_when_not_validating_then_invalid_data_returned(self):
+        datas = Sequence.batchCreate({"pixelBased.displayWindowWidth": [0]})
+
+        assert PixelBasedTrait_v1(datas[0]).getDisplayWindowWidth() == 0
+
+
+class Test_batchCreate_registry:
+    def test_accepts_every_property_of_every_trait(self):
+        columns = {}
+        for traitId in Sequence.kTraitSet:
+            info = registry.kTraits[traitId]
+            accessor = info.name[0].lower() + info.name[1:]
+            for name in info.properties:
+                columns[f"{accessor}.{name}"] = [None]
+
+        datas = Sequence.batchCreate(columns)
+
+        assert datas[0].traitSet() == Sequence.kTraitSet
@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests for the immutable, interned trait sets of the generated
+specification view classes.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pickle
+import sys
+
+import pytest
+
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation.specifications.twoDimensional import (
+    BitmapImageResourceSpecification,
+    BitmapImageResourceSpecification_v1,
+    ImageSpecification_v1,
+    PlanarBitmapImageResourceSpecification_v1,
+)
+from openassetio_mediacreation.traits.color import OCIOColorManagedTrait_v1
+from openassetio_mediacreation.traits.identity import DisplayNameTrait_v1
+from openassetio_mediacreation.traits.twoDimensional import PlanarTrait_v1
+
+
+class Test_kTraitSet:
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda traitSet: traitSet.add("some:other.Trait"),
+            lambda traitSet: traitSet.discard(PlanarTrait_v1.kId),
+            lambda traitSet: traitSet.remove(PlanarTrait_v1.kId),
+            lambda traitSet: traitSet.pop(),
+            lambda traitSet: traitSet.clear(),
+            lambda traitSet: traitSet.update({"some:other.Trait"}),
+            lambda traitSet: traitSet.difference_update({PlanarTrait_v1.kId}),
+            lambda traitSet: traitSet.intersection_update(set()),
+            lambda traitSet: traitSet.symmetric_difference_update({PlanarTrait_v1.kId}),
+        ],
+    )
+    def test_is_immutable(self, mutate):
+        traitSet = PlanarBitmapImageResourceSpecification_v1.kTraitSet
+        expected = set(traitSet)
+
+        with pytest.raises(TypeError):
+            mutate(traitSet)
+
+        assert traitSet == expected
+
+    def test_when_augmented_assignment_then_new_set(self):
+        traitSet = ImageSpecification_v1.kTraitSet
+        traitSet |= {PlanarTrait_v1.kId}
+
+        assert type(traitSet) is set  # pylint: disable=unidiomatic-typecheck
+        assert PlanarTrait_v1.kId not in ImageSpecification_v1.kTraitSet
+
+    def test_hashes_as_frozenset(self):
+        traitSet = BitmapImageResourceSpecification_v1.kTraitSet
+
+        assert {frozenset(traitSet): True}[traitSet]
+
+    def test_is_shared_with_unversioned_class(self):
+        assert (
+            BitmapImageResourceSpecification.kTraitSet
+            is BitmapImageResourceSpecification_v1.kTraitSet
+        )
+
+    def test_trait_ids_are_interned(self):
+        for traitId in PlanarBitmapImageResourceSpecification_v1.kTraitSet:
+            assert sys.intern(traitId) is traitId
+
+    def test_accepted_by_TraitsData(self):
+        data = TraitsData(PlanarBitmapImageResourceSpecification_v1.kTraitSet)
+
+        assert data.traitSet() == PlanarBitmapImageResourceSpecification_v1.kTraitSet
+
+    def test_roundtrips_through_pickle(self):
+        traitSet = PlanarBitmapImageResourceSpecification_v1.kTraitSet
+
+        restored = pickle.loads(pickle.dumps(traitSet))
+
+        assert restored == traitSet
+        assert type(restored) is type(traitSet)
+
+
+class Test_optional_traits:
+    def test_kOptionalTraitSet_lists_declared_optional_traits(self):
+        assert BitmapImageResourceSpecification_v1.kOptionalTraitSet == {
+            OCIOColorManagedTrait_v1.kId,
+            DisplayNameTrait_v1.kId,
+        }
+
+    def test_when_no_optional_traits_then_kOptionalTraitSet_empty(self):
+        assert ImageSpecification_v1.kOptionalTraitSet == set()
+
+    def test_kTraitSetWith_is_union_with_optional_trait(self):
+        spec = PlanarBitmapImageResourceSpecification_v1
+
+        assert spec.kTraitSetWithOCIOColorManaged == spec.kTraitSet | {
+            OCIOColorManagedTrait_v1.kId
+        }
+        assert spec.kTraitSetWithDisplayName == spec.kTraitSet | {DisplayNameTrait_v1.kId}
+
+
+class Test_traitSetWith:
+    def test_returns_union(self):
+        spec = ImageSpecification_v1
+
+        assert spec.traitSetWith(PlanarTrait_v1.kId) == spec.kTraitSet | {PlanarTrait_v1.kId}
+
+    def test_when_called_again_then_same_set_returned(self):
+        spec = ImageSpecification_v1
+
+        assert spec.traitSetWith(PlanarTrait_v1.kId) is spec.traitSetWith(PlanarTrait_v1.kId)
+
+    def test_when_union_is_precomputed_then_same_set_returned(self):
+        spec = BitmapImageResourceSpecification_v1
+
+        assert spec.traitSetWith(OCIOColorManagedTrait_v1.kId) is (
+            spec.kTraitSetWithOCIOColorManaged
+        )
+
+    def test_when_no_trait_ids_then_kTraitSet_returned(self):
+        spec = ImageSpecification_v1
+
+        assert spec.traitSetWith() is spec.kTraitSet
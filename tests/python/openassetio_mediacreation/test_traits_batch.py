@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests the batch (columnar) accessors of the generated trait view
+classes.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import math
+
+import pytest
+
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation import registry
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+from openassetio_mediacreation.traits.twoDimensional import PixelBasedTrait_v1
+
+
+@pytest.fixture
+def traitsDatas():
+    return [TraitsData() for _ in range(3)]
+
+
+class Test_batch_accessors_generated:
+    def test_every_property_has_batch_accessors(self):
+        for traitId, info in registry.kTraits.items():
+            cls = registry.viewClass(traitId)
+            assert hasattr(cls, "batchImbueTo")
+            assert hasattr(cls, "batchIsImbuedTo")
+            for name in info.properties:
+                accessor = name[0].upper() + name[1:]
+                assert hasattr(cls, f"batchGet{accessor}")
+                assert hasattr(cls, f"batchSet{accessor}")
+
+
+class Test_batchImbueTo:
+    def test_imbues_all(self, traitsDatas):
+        FrameRangedTrait_v1.batchImbueTo(traitsDatas)
+
+        assert all(FrameRangedTrait_v1.isImbuedTo(data) for data in traitsDatas)
+
+
+class Test_batchIsImbuedTo:
+    def test_returns_flag_per_data(self, traitsDatas):
+        FrameRangedTrait_v1.imbueTo(traitsDatas[1])
+
+        assert FrameRangedTrait_v1.batchIsImbuedTo(traitsDatas) == [False, True, False]
+
+
+class Test_batchGet:
+    def test_returns_values_and_missing_mask(self, traitsDatas):
+        LocatableContentTrait_v1(traitsDatas[0]).setLocation("file:///a")
+        LocatableContentTrait_v1(traitsDatas[2]).setLocation("file:///c")
+
+        values, missing = LocatableContentTrait_v1.batchGetLocation(traitsDatas)
+
+        assert values == ["file:///a", None, "file:///c"]
+        assert missing == [False, True, False]
+
+    def test_when_empty_then_returns_empty_columns(self):
+        assert FrameRangedTrait_v1.batchGetStartFrame([]) == ([], [])
+
+    def test_when_stored_value_has_wrong_type_then_raises_TypeError(self, traitsDatas):
+        traitsDatas[1].setTraitProperty(FrameRangedTrait_v1.kId, "startFrame", "one")
+
+        with pytest.raises(TypeError, match="startFrame' at index 1"):
+            FrameRangedTrait_v1.batchGetStartFrame(traitsDatas)
+
+    def test_when_asArray_and_int_then_returns_int_array_with_zero_for_missing(self, traitsDatas):
+        numpy = pytest.importorskip("numpy")
+        FrameRangedTrait_v1(traitsDatas[0]).setStartFrame(1001)
+        FrameRangedTrait_v1(traitsDatas[2]).setStartFrame(1003)
+
+        values, missing = FrameRangedTrait_v1.batchGetStartFrame(traitsDatas, asArray=True)
+
+        assert values.dtype == numpy.int64
+        assert values.tolist() == [1001, 0, 1003]
+        assert missing.tolist() == [False, True, False]
+
+    def test_when_asArray_and_float_then_returns_float_array_with_nan_for_missing(
+        self, traitsDatas
+    ):
+        numpy = pytest.importorskip("numpy")
+        PixelBasedTrait_v1(traitsDatas[1]).setPixelAspectRatio(2.0)
+
+        values, missing = PixelBasedTrait_v1.batchGetPixelAspectRatio(traitsDatas, asArray=True)
+
+        assert values.dtype == numpy.float64
+        assert math.isnan(values[0]) and values[1] == 2.0 and math.isnan(values[2])
+        assert missing.tolist() == [True, False, True]
+
+
+class Test_batchSet:
+    def test_sets_value_per_data(self, traitsDatas):
+        FrameRangedTrait_v1.batchSetEndFrame(traitsDatas, [1, 2, 3])
+
+        assert [FrameRangedTrait_v1(data).getEndFrame() for data in traitsDatas] == [1, 2, 3]
+
+    def test_when_masked_then_entry_is_not_set(self, traitsDatas):
+        LocatableContentTrait_v1.batchSetLocation(
+            traitsDatas, ["file:///a", "file:///b", "file:///c"], [False, True, False]
+        )
+
+        assert LocatableContentTrait_v1.batchGetLocation(traitsDatas) == (
+            ["file:///a", None, "file:///c"],
+            [False, True, False],
+        )
+
+    def test_when_numpy_arrays_then_values_are_set_as_native_types(self, traitsDatas):
+        numpy = pytest.importorskip("numpy")
+
+        FrameRangedTrait_v1.batchSetStep(
+            traitsDatas, numpy.array([1, 2, 3]), numpy.array([False, False, True])
+        )
+
+        assert FrameRangedTrait_v1.batchGetStep(traitsDatas) == (
+            [1, 2, None],
+            [False, False, True],
+        )
+
+    def test_when_value_count_differs_then_raises_ValueError(self, traitsDatas):
+        with pytest.raises(ValueError):
+            FrameRangedTrait_v1.batchSetEndFrame(traitsDatas, [1, 2])
+
+    def test_when_value_has_wrong_type_then_raises_TypeError(self, traitsDatas):
+        with pytest.raises(TypeError, match="endFrame at index 2"):
+            FrameRangedTrait_v1.batchSetEndFrame(traitsDatas, [1, 2, 3.0])
+
+        # No partial writes.
+        assert FrameRangedTrait_v1.batchIsImbuedTo(traitsDatas) == [False, False, False]
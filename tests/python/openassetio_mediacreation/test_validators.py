@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests for the generated bulk validators of trait property constraints.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import pytest
+
+from openassetio.errors import BatchElementError
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation import validators
+from openassetio_mediacreation.traits.content import LocatableContentTrait_v1
+from openassetio_mediacreation.traits.threeDimensional import SpatialTrait_v1
+from openassetio_mediacreation.traits.timeDomain import FrameRangedTrait_v1
+from openassetio_mediacreation.traits.twoDimensional import PixelBasedTrait_v1
+
+
+def frameRanged(**properties):
+    data = TraitsData()
+    trait = FrameRangedTrait_v1(data)
+    trait.imbue()
+    for name, value in properties.items():
+        data.setTraitProperty(trait.kId, name, value)
+    return data
+
+
+class Test_violations_FrameRanged:
+    def test_when_ordered_then_valid(self):
+        data = frameRanged(startFrame=1, inFrame=5, outFrame=10, endFrame=20, step=1)
+
+        assert validators.violations([data]) == {}
+
+    def test_when_partially_set_and_ordered_then_valid(self):
+        assert validators.violations([frameRanged(startFrame=1, endFrame=1)]) == {}
+
+    def test_when_in_frame_before_start_frame_then_invalid(self):
+        (messages,) = validators.violations([frameRanged(startFrame=10, inFrame=5)]).values()
+
+        assert messages == [
+            f"'{FrameRangedTrait_v1.kId}' properties must satisfy"
+            " startFrame <= inFrame <= outFrame <= endFrame, got startFrame=10, inFrame=5"
+        ]
+
+    def test_when_end_frame_before_start_frame_then_invalid(self):
+        assert list(validators.violations([frameRanged(startFrame=10, endFrame=9)])) == [0]
+
+    @pytest.mark.parametrize("step", [0, -1])
+    def test_when_step_not_positive_then_invalid(self, step):
+        (messages,) = validators.violations([frameRanged(step=step)]).values()
+
+        assert messages == [f"'{FrameRangedTrait_v1.kId}' property 'step' must be > 0, got {step}"]
+
+    def test_when_wrong_type_then_invalid(self):
+        (messages,) = validators.violations([frameRanged(step="1")]).values()
+
+        assert messages == [
+            f"'{FrameRangedTrait_v1.kId}' property 'step' must be a 'int', got 'str'"
+        ]
+
+
+class Test_violations_other_traits:
+    @pytest.mark.parametrize(
+        "location",
+        [
+            "file:///shot/image.exr",
+            "file:///shot/image.%7Bframe%7D.exr",
+            "file:///shot/image.{frame:04d}.exr",
+            "https://host/path?query=1#fragment",
+        ],
+    )
+    def test_when_valid_url_then_valid(self, location):
+        data = TraitsData()
+        LocatableContentTrait_v1(data).setLocation(location)
+
+        assert validators.violations([data]) == {}
+
+    @pytest.mark.parametrize(
+        "location", ["/shot/image.exr", "file:///shot/my image.exr", "file:///shot/100%.exr"]
+    )
+    def test_when_invalid_url_then_invalid(self, location):
+        data = TraitsData()
+        LocatableContentTrait_v1(data).setLocation(location)
+
+        assert list(validators.violations([data])) == [0]
+
+    def test_when_not_in_enum_then_invalid(self):
+        data = TraitsData()
+        SpatialTrait_v1(data).setUpAxis("x")
+
+        (messages,) = validators.violations([data]).values()
+
+        assert messages == [
+            f"'{SpatialTrait_v1.kId}' property 'upAxis' must be one of ['y', 'z'], got 'x'"
+        ]
+
+    def test_when_multiple_violations_then_all_reported(self):
+        data = frameRanged(step=0)
+        PixelBasedTrait_v1(data).setPixelAspectRatio(0.0)
+
+        (messages,) = validators.violations([data]).values()
+
+        assert len(messages) == 2
+
+
+class Test_violations_batch:
+    def test_reports_only_invalid_indices(self):
+        datas = [
+            frameRanged(step=1),
+            frameRanged(step=0),
+            TraitsData(),
+            frameRanged(startFrame=2, endFrame=1),
+        ]
+
+        assert list(validators.violations(datas)) == [1, 3]
+
+    def test_when_trait_ids_supplied_then_only_those_validated(self):
+        data = frameRanged(step=0)
+        PixelBasedTrait_v1(data).setPixelAspectRatio(0.0)
+
+        (messages,) = validators.violations([data], traitIds=[PixelBasedTrait_v1.kId]).values()
+
+        assert len(messages) == 1
+        assert "pixelAspectRatio" in messages[0]
+
+    def test_constrained_trait_ids_include_frame_ranged(self):
+        assert FrameRangedTrait_v1.kId in validators.kConstrainedTraitIds
+
+
+class Test_columnViolations:
+    def test_matches_violations_of_equivalent_data(self):
+        starts = [1, 10, None, 5]
+        ends = [20, 9, 3, None]
+        steps = [1, 1, 0, None]
+        datas = [
+            frameRanged(
+                **{
+                    name: value
+                    for name, value in (("startFrame", start), ("endFrame", end), ("step", step))
+                    if value is not None
+                }
+            )
+            for start, end, step in zip(starts, ends, steps)
+        ]
+
+        problems = validators.columnViolations(
+            {FrameRangedTrait_v1.kId: {"startFrame": starts, "endFrame": ends, "step": steps}},
+            len(datas),
+        )
+
+        assert problems == validators.violations(datas)
+        assert list(problems) == [1, 2]
+
+    def test_when_trait_or_properties_not_supplied_then_unset(self):
+        problems = validators.columnViolations(
+            {FrameRangedTrait_v1.kId: {"endFrame": [1, 2]}, "unconstrained": {"a": [0, 0]}}, 2
+        )
+
+        assert not problems
+
+
+class Test_validate:
+    def test_returns_batch_element_errors_by_index(self):
+        errors = validators.validate([frameRanged(step=1), frameRanged(step=0)])
+
+        assert list(errors) == [1]
+        assert errors[1].code == BatchElementError.ErrorCode.kInvalidTraitSet
+        assert "'step' must be > 0" in errors[1].message
+
+    def test_when_error_code_supplied_then_used(self):
+        code = BatchElementError.ErrorCode.kInvalidPreflightHint
+
+        errors = validators.validate([frameRanged(step=0)], errorCode=code)
+
+        assert errors[0].code == code
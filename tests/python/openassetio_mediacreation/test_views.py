@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2026 The Foundry Visionmongers Ltd
+"""
+Tests the instance layout of the generated trait and specification
+view classes.
+"""
+
+# pylint: disable=no-self-use
+# pylint: disable=invalid-name
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+import inspect
+import warnings
+
+import pytest
+
+from openassetio.trait import TraitsData
+
+from openassetio_mediacreation import registry, specifications, traits
+from openassetio_mediacreation.specifications.threeDimensional import (
+    SceneGeometryResourceSpecification,
+    SceneGeometryResourceSpecification_v1,
+)
+from openassetio_mediacreation.traits.content import (
+    LocatableContentTrait,
+    LocatableContentTrait_v1,
+)
+
+
+def allSpecificationClasses():
+    return [
+        cls
+        for _, namespace in inspect.getmembers(specifications, inspect.ismodule)
+        for _, cls in inspect.getmembers(namespace, inspect.isclass)
+        if "Specification" in cls.__name__
+    ]
+
+
+class Test_trait_views:
+    @pytest.mark.parametrize("traitId", sorted(registry.kTraits))
+    def test_have_no_instance_dict(self, traitId):
+        view = registry.viewClass(traitId)(TraitsData())
+
+        assert not hasattr(view, "__dict__")
+
+    def test_when_unversioned_then_has_no_instance_dict(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            view = LocatableContentTrait(TraitsData())
+
+        assert not hasattr(view, "__dict__")
+
+
+class Test_specification_views:
+    @pytest.mark.parametrize("cls", allSpecificationClasses(), ids=lambda cls: cls.__name__)
+    def test_have_no_instance_dict(self, cls):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            view = cls(TraitsData())
+
+        assert not hasattr(view, "__dict__")
+
+    def test_trait_accessor_returns_cached_view(self):
+        spec = SceneGeometryResourceSpecification_v1.create()
+
+        view = spec.spatialTrait()
+
+        assert spec.spatialTrait() is view
+        assert spec.locatableContentTrait() is not view
+
+    def test_cached_view_wraps_specification_data(self):
+        spec = SceneGeometryResourceSpecification_v1.create()
+        spec.locatableContentTrait().setLocation("file:///a.abc")
+
+        assert (
+            spec.traitsData().getTraitProperty(spec.locatableContentTrait().kId, "location")
+            == "file:///a.abc"
+        )
+
+    def test_when_unversioned_then_accessors_cached(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            spec = SceneGeometryResourceSpecification.create()
+
+        assert spec.spatialTrait() is spec.spatialTrait()
+
+
+class Test_traitgen_classes_extended:
+    def test_trait_view_methods_are_those_generated_by_traitgen(self):
+        getLocation = inspect.unwrap(LocatableContentTrait_v1.getLocation)
+
+        assert getLocation.__code__.co_filename == traits.content.__file__
+        assert LocatableContentTrait_v1.__module__ == traits.content.__name__
+        assert LocatableContentTrait_v1.__doc__
+
+    def test_specification_view_methods_are_those_generated_by_traitgen(self):
+        assert (
+            SceneGeometryResourceSpecification_v1.create.__code__.co_filename
+            == specifications.threeDimensional.__file__
+        )
+        assert SceneGeometryResourceSpecification_v1.__module__ == (
+            specifications.threeDimensional.__name__
+        )
+
+    def test_specification_trait_accessors_return_extended_views(self):
+        view = SceneGeometryResourceSpecification_v1.create().locatableContentTrait()
+
+        assert type(view) is LocatableContentTrait_v1
+
+    def test_unversioned_derives_from_extended_class(self):
+        assert issubclass(LocatableContentTrait, LocatableContentTrait_v1)
+        assert issubclass(
+            SceneGeometryResourceSpecification, SceneGeometryResourceSpecification_v1
+        )